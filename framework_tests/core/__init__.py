@@ -0,0 +1,4 @@
+"""
+Core Tests for PATH Framework
+Tests for LLM client infrastructure and shared core utilities
+"""
@@ -0,0 +1,124 @@
+"""
+Artifact Writer Tests for PATH Framework
+Tests for background, atomic, skip-unchanged artifact writes
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.core import artifact_writer
+from path_framework.core.artifact_writer import (
+    ArtifactWriter,
+    WriteReport,
+    atomic_write_text,
+    sync_paths,
+    write_if_changed,
+)
+
+
+class TestArtifactWriter:
+    """Test queued artifact writes"""
+
+    def test_atomic_write_replaces_file_without_leftovers(self, tmp_path):
+        """The target is replaced and no temporary file remains"""
+        target = tmp_path / "nested" / "artifact.yaml"
+        atomic_write_text(target, "first")
+        atomic_write_text(target, "second")
+
+        assert target.read_text() == "second"
+        assert [p.name for p in target.parent.iterdir()] == ["artifact.yaml"]
+
+    async def test_queued_writes_finish_on_close(self, tmp_path):
+        """Every queued write is on disk once the writer is closed"""
+        async with ArtifactWriter(concurrency=2) as writer:
+            for i in range(10):
+                writer.write(tmp_path / f"artifact_{i}.md", f"content {i}")
+
+        assert writer.written == 10
+        assert (tmp_path / "artifact_7.md").read_text() == "content 7"
+
+    async def test_failed_write_is_raised_on_flush(self, tmp_path):
+        """Write errors surface when the writer is flushed"""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        writer = ArtifactWriter()
+        writer.write(blocker / "artifact.yaml", "content")
+        with pytest.raises(OSError, match="Failed to write 1 artifacts"):
+            await writer.flush()
+        await writer.close()
+
+    async def test_unexpected_batch_error_keeps_the_writer_running(self, tmp_path):
+        """A batch that cannot be written fails on flush; later writes proceed"""
+        writer = ArtifactWriter(fsync=False)
+        writer.write(tmp_path / "broken.md", "lone surrogate \ud800")
+        with pytest.raises(OSError, match="Failed to write 1 artifacts"):
+            await asyncio.wait_for(writer.flush(), timeout=5)
+
+        writer.write(tmp_path / "artifact.md", "content")
+        await asyncio.wait_for(writer.close(), timeout=5)
+
+        assert (tmp_path / "artifact.md").read_text() == "content"
+        assert not (tmp_path / "broken.md").exists()
+
+    def test_unchanged_content_is_not_rewritten(self, tmp_path):
+        """Identical content leaves the file untouched and is reported skipped"""
+        target = tmp_path / "artifact.yaml"
+        report = WriteReport()
+
+        assert write_if_changed(target, "content", report)
+        before = target.stat()
+        assert not write_if_changed(target, "content", report)
+        after = target.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+        assert write_if_changed(target, "changed", report)
+        assert target.stat().st_ino != before.st_ino
+        assert report.written == [target]
+        assert report.unchanged == []
+        assert (report.bytes_written, report.bytes_skipped) == (7, 0)
+
+    async def test_batched_writes_keep_last_content_per_path(self, tmp_path):
+        """Repeated writes to a path collapse into the last one"""
+        target = tmp_path / "manifest.json"
+        async with ArtifactWriter(fsync=False) as writer:
+            for i in range(5):
+                writer.write(target, f"version {i}")
+            writer.write(tmp_path / "other.md", "other")
+
+        assert target.read_text() == "version 4"
+        assert writer.report.paths == [target, tmp_path / "other.md"]
+
+        async with ArtifactWriter(fsync=False) as again:
+            again.write(target, "version 4")
+        assert again.written == 0
+        assert again.report.unchanged == [target]
+
+    def test_repeated_saves_of_a_path_are_counted_once(self, tmp_path):
+        """A file saved after every step is reported once, at its last size"""
+        manifest = tmp_path / "run_manifest.json"
+        report = WriteReport()
+
+        write_if_changed(manifest, "{}", report, fsync=False)
+        write_if_changed(manifest, '{"steps": 1}', report, fsync=False)
+        write_if_changed(manifest, '{"steps": 1}', report, fsync=False)
+        write_if_changed(tmp_path / "artifact.md", "content", report, fsync=False)
+
+        assert report.written == [manifest, tmp_path / "artifact.md"]
+        assert report.unchanged == []
+        assert report.bytes_written == len('{"steps": 1}') + len("content")
+        assert report.summary().startswith("2 written")
+
+    def test_sync_paths_syncs_each_directory_once(self, tmp_path, monkeypatch):
+        """A batch of files costs one directory sync per directory"""
+        synced = []
+        monkeypatch.setattr(artifact_writer, "_fsync_directory", synced.append)
+        paths = [tmp_path / "a.md", tmp_path / "b.md", tmp_path / "sub" / "c.md"]
+        for path in paths:
+            write_if_changed(path, path.name, fsync=False)
+        assert synced == []
+
+        sync_paths([*paths, paths[0]])
+
+        assert sorted(synced) == [tmp_path, tmp_path / "sub"]
@@ -0,0 +1,122 @@
+"""
+Bounded Concurrency Tests for PATH Framework
+Tests for ordered, capped fan-out with per-item error isolation
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.core.concurrency import BoundedGather, map_bounded, merge_streams
+
+
+class TestMapBounded:
+    """Test bounded fan-out"""
+
+    async def test_results_keep_input_order_and_errors_stay_isolated(self):
+        """Failures occupy their own slot without affecting other items"""
+
+        async def work(n):
+            await asyncio.sleep(0.001 * (5 - n))
+            if n == 2:
+                raise ValueError("bad item")
+            return n * 10
+
+        results = await map_bounded(work, range(5), concurrency=2)
+
+        assert results[:2] == [0, 10]
+        assert isinstance(results[2], ValueError)
+        assert results[3:] == [30, 40]
+
+    async def test_concurrency_is_capped(self):
+        """No more than the configured number of calls run at once"""
+        running = 0
+        peak = 0
+
+        async def work(_):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        await map_bounded(work, range(20), concurrency=3)
+
+        assert peak == 3
+
+    async def test_work_can_be_submitted_while_running(self):
+        """Items submitted later still come back in submission order"""
+        batch = BoundedGather(2)
+        for n in range(3):
+            batch.submit(asyncio.sleep(0.001 * (3 - n), result=n))
+            await asyncio.sleep(0)
+
+        assert await batch.results() == [0, 1, 2]
+
+    async def test_leaving_the_block_on_error_stops_submitted_work(self):
+        """Work submitted before an error is cancelled and has stopped"""
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(10)
+
+        with pytest.raises(ValueError):
+            async with BoundedGather(2) as batch:
+                batch.submit(work())
+                await started.wait()
+                raise ValueError("input failed")
+
+        assert all(task.cancelled() for task in batch._tasks)
+
+    async def test_cancelled_results_wait_for_work_to_stop(self):
+        """Cancelling the wait cancels every task before it propagates"""
+        batch = BoundedGather(2)
+        for _ in range(3):
+            batch.submit(asyncio.sleep(10))
+        waiter = asyncio.create_task(batch.results())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert all(task.done() for task in batch._tasks)
+
+
+class TestMergeStreams:
+    """Test interleaving of async iterators"""
+
+    async def test_items_from_all_streams_arrive_as_produced(self):
+        """A slow stream does not hold back items from faster ones"""
+
+        async def produce(label, delay, count):
+            for i in range(count):
+                await asyncio.sleep(delay)
+                yield f"{label}{i}"
+
+        merged = [
+            item
+            async for item in merge_streams(
+                [produce("slow", 0.02, 2), produce("fast", 0.001, 3)]
+            )
+        ]
+
+        assert sorted(merged) == ["fast0", "fast1", "fast2", "slow0", "slow1"]
+        assert merged[:3] == ["fast0", "fast1", "fast2"]
+
+    async def test_stream_error_reaches_consumer(self):
+        """An exception inside a stream is raised from the merged iterator"""
+
+        async def failing():
+            yield 1
+            raise ValueError("stream broke")
+
+        async def endless():
+            while True:
+                await asyncio.sleep(0.001)
+                yield 0
+
+        with pytest.raises(ValueError, match="stream broke"):
+            async for _ in merge_streams([failing(), endless()]):
+                pass
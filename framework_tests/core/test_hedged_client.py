@@ -0,0 +1,124 @@
+"""
+Hedged LLM Client Tests for PATH Framework
+Tests for latency hedging, failover and the circuit breaker
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.core.hedged_client import (
+    CircuitBreaker,
+    HedgeConfig,
+    HedgedLLMClient,
+)
+from path_framework.core.llm_client import BaseLLMClient, LLMRequest, LLMResponse
+from path_framework.exceptions import LLMError
+
+
+class ScriptedClient(BaseLLMClient):
+    """Client answering after a fixed delay, or failing"""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__(api_key="key", model=f"{name}-model")
+        self.provider_name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.provider_name} down")
+        return LLMResponse(
+            content=self.provider_name,
+            tokens_used=0,
+            model_used=self.model,
+            provider=self.provider_name,
+            finish_reason="stop",
+        )
+
+
+class TestHedgedLLMClient:
+    """Test suite for hedged, failing-over LLM calls"""
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """Test that a backup fires after the hedge delay and wins"""
+        primary = ScriptedClient("primary", delay=1.0)
+        backup = ScriptedClient("backup", delay=0.0)
+        client = HedgedLLMClient(
+            [primary, backup], HedgeConfig(initial_hedge_delay=0.02)
+        )
+
+        response = await client.generate(LLMRequest(prompt="hello"))
+        await asyncio.sleep(0)
+
+        assert response.content == "backup"
+        assert primary.cancelled == 1
+        stats = client.hedge_stats()
+        assert stats["hedges_fired"] == 1
+        assert stats["hedge_wins"] == 1
+
+    async def test_cancelled_slow_call_keeps_its_latency(self):
+        """Test that a losing call is recorded as a lower-bound sample"""
+        primary = ScriptedClient("primary", delay=1.0)
+        backup = ScriptedClient("backup", delay=0.0)
+        client = HedgedLLMClient(
+            [primary, backup], HedgeConfig(initial_hedge_delay=0.02)
+        )
+
+        await client.generate(LLMRequest(prompt="hello"))
+        await asyncio.sleep(0)
+
+        samples = client._latency[0]
+        assert len(samples) == 1
+        assert samples.percentile(0.5) >= 0.02
+
+    async def test_fast_primary_is_not_hedged(self):
+        """Test that no backup is sent when the primary answers in time"""
+        primary = ScriptedClient("primary")
+        backup = ScriptedClient("backup")
+        client = HedgedLLMClient([primary, backup])
+
+        response = await client.generate(LLMRequest(prompt="hello"))
+
+        assert response.content == "primary"
+        assert backup.calls == 0
+
+    async def test_provider_error_fails_over_and_opens_circuit(self):
+        """Test failover on errors and that a failing provider is skipped"""
+        primary = ScriptedClient("primary", fail=True)
+        backup = ScriptedClient("backup")
+        client = HedgedLLMClient([primary, backup], HedgeConfig(failure_threshold=2))
+
+        for prompt in ("a", "b", "c"):
+            response = await client.generate(LLMRequest(prompt=prompt))
+            assert response.content == "backup"
+
+        assert primary.calls == 2
+        assert client.hedge_stats()["providers"][0]["circuit"] == "open"
+
+    async def test_all_providers_failing_raises(self):
+        """Test that an error is raised once every provider has failed"""
+        client = HedgedLLMClient(
+            [ScriptedClient("a", fail=True), ScriptedClient("b", fail=True)]
+        )
+
+        with pytest.raises(LLMError, match="All LLM providers failed"):
+            await client.generate(LLMRequest(prompt="hello"))
+
+    def test_circuit_half_opens_after_timeout(self):
+        """Test that one trial call is allowed after the cool-down"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
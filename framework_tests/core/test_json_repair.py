@@ -0,0 +1,75 @@
+"""
+JSON Repair Tests for PATH Framework
+Tests for local recovery of malformed structured output
+"""
+
+import pytest
+
+from path_framework.core.json_repair import JSONRepairError, repair_json
+from path_framework.core.llm_client import BaseLLMClient, LLMRequest, LLMResponse
+
+
+class ScriptedJSONClient(BaseLLMClient):
+    """Client replying with queued raw outputs"""
+
+    def __init__(self, *outputs: str):
+        super().__init__(api_key="key", model="fake-model")
+        self.outputs = list(outputs)
+        self.calls = 0
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=self.outputs.pop(0),
+            tokens_used=0,
+            model_used=self.model,
+            provider="fake",
+            finish_reason="stop",
+        )
+
+
+class TestRepairJSON:
+    """Test suite for the JSON repair stage"""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ('```json\n{"a": 1}\n```', {"a": 1}),
+            ('Here you go: {"a": [1, 2,],} Hope this helps!', {"a": [1, 2]}),
+            ("{'a': True, 'b': None}", {"a": True, "b": None}),
+            ('{"a": 1} Let\'s know if you need more', {"a": 1}),
+            (
+                '{"items": [{"t": "x"}, {"t": "cut',
+                {"items": [{"t": "x"}, {"t": "cut"}]},
+            ),
+            ('{"items": [{"t": "x"}, {"t":', {"items": [{"t": "x"}]}),
+        ],
+    )
+    def test_common_defects_are_repaired(self, raw, expected):
+        """Test fences, prose, trailing commas, literals and truncation"""
+        assert repair_json(raw) == expected
+
+    def test_unrecoverable_output_raises(self):
+        """Test that text without JSON is reported as unrepairable"""
+        with pytest.raises(JSONRepairError):
+            repair_json("I cannot help with that.")
+
+    async def test_structured_call_repairs_before_re_requesting(self):
+        """Test that a repairable answer costs no second call"""
+        client = ScriptedJSONClient('```json\n{"ok": true,}\n```')
+
+        result = await client.generate_structured(LLMRequest(prompt="go"), {})
+
+        assert result == {"ok": True}
+        assert client.calls == 1
+        assert client.structured_stats()["repaired"] == 1
+
+    async def test_structured_call_re_requests_once(self):
+        """Test that a second call is made only when repair fails"""
+        client = ScriptedJSONClient("no json here", '{"ok": 1}')
+
+        result = await client.generate_structured(LLMRequest(prompt="go"), {})
+
+        assert result == {"ok": 1}
+        assert client.calls == 2
+        assert client.structured_stats()["re_requested"] == 1
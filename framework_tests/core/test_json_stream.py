@@ -0,0 +1,95 @@
+"""
+Streaming JSON Parser Tests for PATH Framework
+Tests for incremental extraction of array elements from streamed output
+"""
+
+from path_framework.core.json_stream import JSONArrayStreamParser
+from path_framework.core.llm_client import BaseLLMClient, LLMRequest, LLMResponse
+
+DOCUMENT = (
+    '```json\n{"summary": "requirements", "requirements": ['
+    '{"title": "Login ]} \\"quoted\\"", "tags": ["a", "b"]}, '
+    '{"title": "Search"}, {"title": "Rep'
+)
+
+
+def _feed_in_pieces(parser: JSONArrayStreamParser, text: str, size: int) -> list:
+    elements = []
+    for start in range(0, len(text), size):
+        elements.extend(parser.feed(text[start : start + size]))
+    return elements
+
+
+class ChunkedClient(BaseLLMClient):
+    """Client replying with a fixed document"""
+
+    def __init__(self, content: str):
+        super().__init__(api_key="key", model="fake-model")
+        self.content = content
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        return LLMResponse(
+            content=self.content,
+            tokens_used=0,
+            model_used=self.model,
+            provider="fake",
+            finish_reason="stop",
+        )
+
+
+class TestJSONArrayStreamParser:
+    """Test suite for the incremental JSON array parser"""
+
+    def test_elements_emitted_as_they_close(self):
+        """Test that each element is available once its bracket closes"""
+        parser = JSONArrayStreamParser("requirements")
+
+        assert parser.feed('{"requirements": [{"title": "A"}, {"ti') == [{"title": "A"}]
+        assert parser.feed('tle": "B"}]}') == [{"title": "B"}]
+        assert parser.complete
+
+    def test_truncated_tail_only_loses_last_element(self):
+        """Test strings with brackets, escapes and a cut-off final element"""
+        for size in (1, 3, 7, len(DOCUMENT)):
+            parser = JSONArrayStreamParser("requirements")
+
+            elements = _feed_in_pieces(parser, DOCUMENT, size)
+
+            assert [e["title"] for e in elements] == ['Login ]} "quoted"', "Search"]
+            assert parser.pending == '{"title": "Rep'
+
+    def test_scalars_and_first_array(self):
+        """Test scalar elements and the keyless first-array mode"""
+        parser = JSONArrayStreamParser()
+
+        assert parser.feed('[1, "a,b", true, null, {"k": [2]}]') == [
+            1,
+            "a,b",
+            True,
+            None,
+            {"k": [2]},
+        ]
+
+    def test_malformed_elements_are_repaired_or_skipped(self):
+        """Test that one bad element does not stop the stream"""
+        parser = JSONArrayStreamParser("items")
+
+        assert parser.feed('{"items": [{"a": 1,}, {"b" 2 3}, {"c": 3}]}') == [
+            {"a": 1},
+            {"c": 3},
+        ]
+        assert parser.repaired == 1
+        assert parser.skipped == 1
+
+    async def test_structured_stream_from_client(self):
+        """Test element streaming through the client API"""
+        client = ChunkedClient('{"items": [{"n": 1}, {"n": 2}]}')
+
+        items = [
+            item
+            async for item in client.generate_structured_stream(
+                LLMRequest(prompt="list"), {}, "items"
+            )
+        ]
+
+        assert items == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,40 @@
+"""
+Keyword Matching Tests for PATH Framework
+Tests for single-pass vocabulary classification
+"""
+
+import random
+
+from path_framework.core.keywords import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test keyword matching against plain substring checks"""
+
+    def test_overlapping_and_nested_keywords_are_all_found(self):
+        """Keywords inside or overlapping other keywords are reported too"""
+        matcher = KeywordMatcher(
+            {"short": ["will", "data", "base"], "long": ["system will", "database"]}
+        )
+
+        assert matcher.matches("The System WILL store it in a Database") == {
+            "short": {"will", "data", "base"},
+            "long": {"system will", "database"},
+        }
+        assert matcher.categories("nothing relevant") == set()
+
+    def test_matches_substring_semantics(self):
+        """Hits equal ``keyword in text.lower()`` for every keyword"""
+        rng = random.Random(7)  # noqa: S311 - test data
+        alphabet = "abc "
+        keywords = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip()
+            or "a"
+            for _ in range(30)
+        }
+        matcher = KeywordMatcher({"all": keywords})
+
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet + "ABC") for _ in range(40))
+            expected = {keyword for keyword in keywords if keyword in text.lower()}
+            assert matcher.keywords(text) == expected
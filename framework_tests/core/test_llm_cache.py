@@ -0,0 +1,185 @@
+"""
+LLM Response Cache Tests for PATH Framework
+Tests for the content-addressed response store and caching client wrapper
+"""
+
+import threading
+
+import pytest
+
+from path_framework.core.llm_cache import CachedLLMClient, LLMResponseCache
+from path_framework.core.llm_client import (
+    BaseLLMClient,
+    LLMRequest,
+    LLMResponse,
+    collect_stream,
+    request_fingerprint,
+)
+from path_framework.core.retry import RetryPolicy
+from path_framework.exceptions import LLMError
+
+
+class CountingClient(BaseLLMClient):
+    """Client that counts provider calls instead of making them"""
+
+    provider_name = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="key", model="fake-model")
+        self.calls = 0
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=f'{{"call": {self.calls}}}',
+            tokens_used=10,
+            model_used=self.model,
+            provider="fake",
+            finish_reason="stop",
+        )
+
+
+class UnavailableClient(CountingClient):
+    """Client whose provider is always overloaded"""
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        error = Exception("service unavailable")
+        error.status_code = 503
+        raise error
+
+
+def _response(content: str) -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        tokens_used=0,
+        model_used="fake-model",
+        provider="fake",
+        finish_reason="stop",
+    )
+
+
+class TestLLMResponseCache:
+    """Test suite for the SQLite response store"""
+
+    def test_fingerprint_covers_effective_input(self):
+        """Test that any input change produces a different key"""
+        base = LLMRequest(prompt="hello", temperature=0.1)
+
+        assert request_fingerprint("fake", "m", base) == request_fingerprint(
+            "fake", "m", LLMRequest(prompt="hello", temperature=0.1)
+        )
+        assert request_fingerprint("fake", "m", base) != request_fingerprint(
+            "fake", "m", LLMRequest(prompt="hello", temperature=0.2)
+        )
+        assert request_fingerprint("fake", "m", base) != request_fingerprint(
+            "fake", "other", base
+        )
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries older than the TTL are not served"""
+        cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=-1)
+        cache.put("key", _response("old"))
+
+        assert cache.get("key") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test that the entry budget evicts the coldest entries first"""
+        cache = LLMResponseCache(tmp_path / "cache.db", max_entries=2)
+        cache.put("a", _response("a"))
+        cache.put("b", _response("b"))
+        cache.get("a")
+        cache.put("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").content == "a"
+        assert cache.stats()["evictions"] == 1
+
+
+class TestCachedLLMClient:
+    """Test suite for the caching client wrapper"""
+
+    async def test_repeat_request_is_served_from_cache(self, tmp_path):
+        """Test that an identical low-temperature request skips the provider"""
+        inner = CountingClient()
+        client = CachedLLMClient(inner, LLMResponseCache(tmp_path / "cache.db"))
+
+        first = await client.generate(LLMRequest(prompt="hello"))
+        second = await client.generate(LLMRequest(prompt="hello"))
+
+        assert inner.calls == 1
+        assert second.content == first.content
+        assert second.metadata["cache"] == "hit"
+
+    async def test_structured_calls_are_cached(self, tmp_path):
+        """Test that JSON generation goes through the cache too"""
+        inner = CountingClient()
+        client = CachedLLMClient(inner, LLMResponseCache(tmp_path / "cache.db"))
+
+        first = await client.generate_structured(LLMRequest(prompt="hello"), {})
+        second = await client.generate_structured(LLMRequest(prompt="hello"), {})
+
+        assert inner.calls == 1
+        assert first == second == {"call": 1}
+
+    async def test_high_temperature_and_refresh_bypass_reads(self, tmp_path):
+        """Test that creative requests and refresh mode hit the provider"""
+        cache = LLMResponseCache(tmp_path / "cache.db")
+        inner = CountingClient()
+
+        client = CachedLLMClient(inner, cache)
+        await client.generate(LLMRequest(prompt="poem", temperature=0.9))
+        await client.generate(LLMRequest(prompt="poem", temperature=0.9))
+        assert inner.calls == 2
+
+        await client.generate(LLMRequest(prompt="hello"))
+        refreshing = CachedLLMClient(inner, cache, refresh=True)
+        await refreshing.generate(LLMRequest(prompt="hello"))
+        assert inner.calls == 4
+
+    async def test_streamed_responses_are_cached(self, tmp_path):
+        """Test that a streamed miss is stored and replayed on the next stream"""
+        inner = CountingClient()
+        client = CachedLLMClient(inner, LLMResponseCache(tmp_path / "cache.db"))
+
+        first = await collect_stream(client.generate_stream(LLMRequest(prompt="x")))
+        second = await collect_stream(client.generate_stream(LLMRequest(prompt="x")))
+
+        assert inner.calls == 1
+        assert second.content == first.content
+
+    async def test_failures_are_retried_by_the_wrapped_client_only(self, tmp_path):
+        """A transient failure is not retried again by the cache layer"""
+        inner = UnavailableClient()
+        inner.retry_policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+        client = CachedLLMClient(inner, LLMResponseCache(tmp_path / "cache.db"))
+
+        with pytest.raises(LLMError):
+            await client.generate(LLMRequest(prompt="hello"))
+
+        assert inner.calls == 3
+
+    async def test_cache_io_runs_off_the_event_loop(self, tmp_path):
+        """Database reads and writes run on the cache's worker thread"""
+        cache = LLMResponseCache(tmp_path / "cache.db")
+        threads = []
+        get, put = cache.get, cache.put
+
+        def recording_get(key):
+            threads.append(threading.current_thread())
+            return get(key)
+
+        def recording_put(key, response):
+            threads.append(threading.current_thread())
+            put(key, response)
+
+        cache.get, cache.put = recording_get, recording_put
+        client = CachedLLMClient(CountingClient(), cache)
+
+        await client.generate(LLMRequest(prompt="hello"))
+        await client.generate(LLMRequest(prompt="hello"))
+        cache.close()
+
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
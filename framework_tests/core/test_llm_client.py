@@ -0,0 +1,352 @@
+"""
+LLM Client Tests for PATH Framework
+Tests for transport pooling, client lifecycle and the client registry
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from path_framework.core.llm_client import (
+    BaseLLMClient,
+    ConnectionPoolConfig,
+    LLMRequest,
+    LLMResponse,
+    LLMStreamChunk,
+    _stream_chat_completion,
+    add_stream_listener,
+    collect_stream,
+    get_client_registry,
+    get_llm_client,
+    invalidate_llm_clients,
+)
+from path_framework.core.retry import RetryPolicy
+
+
+class FakeTransport:
+    """Stand-in for a provider SDK client"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeClient(BaseLLMClient):
+    """Client that records transport usage instead of calling a provider"""
+
+    def _create_transport(self):
+        return FakeTransport()
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self._get_transport()
+        return LLMResponse(
+            content=request.prompt,
+            tokens_used=0,
+            model_used=self.model,
+            provider="fake",
+            finish_reason="stop",
+        )
+
+    async def generate_structured(self, request, schema):
+        return {}
+
+
+class TestConnectionPooling:
+    """Test suite for pooled client transports"""
+
+    async def test_transport_is_reused_across_calls(self):
+        """Test that one transport serves many generate() calls"""
+        client = FakeClient(api_key="key", model="fake-model")
+
+        for _ in range(5):
+            await client.generate(LLMRequest(prompt="hello"))
+
+        stats = client.pool_stats()
+        assert stats["transports_created"] == 1
+        assert stats["transport_reuses"] == 4
+        assert stats["requests"] == 5
+        assert stats["transport_open"] is True
+
+    async def test_context_manager_closes_transport(self):
+        """Test that leaving the async context closes the transport"""
+        async with FakeClient(api_key="key", model="fake-model") as client:
+            await client.generate(LLMRequest(prompt="hello"))
+            transport = client._transport
+
+        assert transport.closed is True
+        assert client.pool_stats()["transport_open"] is False
+
+    def test_transport_of_a_previous_loop_is_closed(self):
+        """Test that a new event loop replaces and closes the old transport"""
+        client = FakeClient(api_key="key", model="fake-model")
+
+        asyncio.run(client.generate(LLMRequest(prompt="hello")))
+        first = client._transport
+
+        async def generate_and_settle():
+            await client.generate(LLMRequest(prompt="hello"))
+            await asyncio.sleep(0)
+
+        asyncio.run(generate_and_settle())
+
+        assert first.closed is True
+        assert client._transport is not first
+        assert client.pool_stats()["transports_created"] == 2
+
+    def test_pool_config_from_config_ignores_unknown_keys(self):
+        """Test that pool settings are read from the config section"""
+        pool_config = ConnectionPoolConfig.from_config(
+            {"max_connections": 5, "http2": False, "unknown": 1}
+        )
+
+        assert pool_config.max_connections == 5
+        assert pool_config.http2 is False
+        assert pool_config.max_keepalive_connections == 10
+
+
+class SlowClient(BaseLLMClient):
+    """Client whose provider call takes a moment and can be made to fail"""
+
+    def __init__(self, error: Exception | None = None):
+        super().__init__(api_key="key", model="fake-model")
+        self.error = error
+        self.calls = 0
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise self.error
+        return LLMResponse(
+            content=request.prompt,
+            tokens_used=0,
+            model_used=self.model,
+            provider="fake",
+            finish_reason="stop",
+        )
+
+
+class TestRequestCoalescing:
+    """Test suite for single-flight coalescing of identical requests"""
+
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """Test that concurrent duplicates await the first call"""
+        client = SlowClient()
+
+        responses = await asyncio.gather(
+            *(client.generate(LLMRequest(prompt="same")) for _ in range(5)),
+            client.generate(LLMRequest(prompt="different")),
+        )
+
+        assert client.calls == 2
+        assert [r.content for r in responses[:5]] == ["same"] * 5
+        stats = client.coalesce_stats()
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    async def test_sequential_requests_are_not_coalesced(self):
+        """Test that completed calls are not reused"""
+        client = SlowClient()
+
+        await client.generate(LLMRequest(prompt="same"))
+        await client.generate(LLMRequest(prompt="same"))
+
+        assert client.calls == 2
+
+    async def test_errors_reach_every_waiter(self):
+        """Test that a failed shared call fails all coalesced callers"""
+        client = SlowClient(error=RuntimeError("boom"))
+
+        results = await asyncio.gather(
+            *(client.generate(LLMRequest(prompt="same")) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert client.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class FakeCompletions:
+    """OpenAI-style completions endpoint returning scripted stream events"""
+
+    def __init__(self, events):
+        self.events = events
+        self.options = None
+
+    async def create(self, **options):
+        self.options = options
+
+        async def stream():
+            for event in self.events:
+                yield event
+
+        return stream()
+
+
+def _event(content=None, finish_reason=None, usage=None):
+    choices = [
+        SimpleNamespace(
+            delta=SimpleNamespace(content=content), finish_reason=finish_reason
+        )
+    ]
+    return SimpleNamespace(
+        model="fake-model",
+        choices=choices if content or finish_reason else [],
+        usage=usage,
+    )
+
+
+class TestStreaming:
+    """Test suite for streamed generation"""
+
+    async def test_openai_compatible_stream_yields_deltas_then_usage(self):
+        """Test that deltas arrive as chunks and usage ends the stream"""
+        completions = FakeCompletions(
+            [
+                _event("Hel"),
+                _event("lo"),
+                _event(finish_reason="stop"),
+                _event(usage=SimpleNamespace(total_tokens=7)),
+            ]
+        )
+        transport = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        chunks = [
+            chunk
+            async for chunk in _stream_chat_completion(
+                transport, LLMRequest(prompt="hi"), "fake-model", "openai"
+            )
+        ]
+
+        assert [c.delta for c in chunks] == ["Hel", "lo", ""]
+        assert chunks[-1].done and chunks[-1].tokens_used == 7
+        assert chunks[-1].finish_reason == "stop"
+        assert completions.options["stream"] is True
+
+    async def test_default_stream_and_listeners(self):
+        """Test the single-chunk fallback and stream listener notifications"""
+        client = FakeClient(api_key="key", model="fake-model")
+        seen = []
+        remove = add_stream_listener(lambda request, chunk: seen.append(chunk))
+        try:
+            response = await collect_stream(
+                client.generate_stream(LLMRequest(prompt="hello"))
+            )
+        finally:
+            remove()
+
+        assert response.content == "hello"
+        assert [c.done for c in seen] == [False, True]
+
+
+class FlakyStreamClient(FakeClient):
+    """Client whose stream fails ``failures`` times, before or mid-stream"""
+
+    def __init__(self, failures: int = 0, after_first_chunk: bool = False):
+        super().__init__(api_key="key", model="fake-model")
+        self.retry_policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+        self.failures = failures
+        self.after_first_chunk = after_first_chunk
+        self.streams = 0
+
+    async def _generate_stream(self, request):
+        self.streams += 1
+        failing = self.streams <= self.failures
+        if failing and not self.after_first_chunk:
+            error = Exception("service unavailable")
+            error.status_code = 503
+            raise error
+        await asyncio.sleep(0.01)
+        yield LLMStreamChunk(delta="hel")
+        if failing:
+            error = Exception("service unavailable")
+            error.status_code = 503
+            raise error
+        yield LLMStreamChunk(delta="lo")
+        yield LLMStreamChunk(delta="", done=True, finish_reason="stop")
+
+
+class TestStreamResilience:
+    """Test suite for retried and coalesced streams"""
+
+    async def test_stream_failing_before_first_chunk_is_retried(self):
+        """Test that a transient error before any output opens a new stream"""
+        client = FlakyStreamClient(failures=1)
+
+        response = await collect_stream(
+            client.generate_stream(LLMRequest(prompt="hello"))
+        )
+
+        assert response.content == "hello"
+        assert client.streams == 2
+
+    async def test_stream_failing_after_output_is_not_retried(self):
+        """Test that chunks already delivered are never replayed by a retry"""
+        client = FlakyStreamClient(failures=1, after_first_chunk=True)
+        received = []
+
+        with pytest.raises(Exception, match="service unavailable"):
+            async for chunk in client.generate_stream(LLMRequest(prompt="hello")):
+                received.append(chunk.delta)
+
+        assert received == ["hel"]
+        assert client.streams == 1
+
+    async def test_identical_concurrent_streams_share_one_call(self):
+        """Test that duplicates replay one provider stream"""
+        client = FlakyStreamClient()
+
+        responses = await asyncio.gather(
+            *(
+                collect_stream(client.generate_stream(LLMRequest(prompt="same")))
+                for _ in range(3)
+            )
+        )
+
+        assert client.streams == 1
+        assert [r.content for r in responses] == ["hello"] * 3
+        assert client.coalesce_stats()["coalesced"] == 2
+        assert client.coalesce_stats()["in_flight"] == 0
+
+
+@pytest.fixture
+def ollama_env(monkeypatch):
+    """Resolve clients for a local provider that needs no API key"""
+    monkeypatch.setenv("PATH_LLM_PROVIDER", "ollama")
+    monkeypatch.setenv("PATH_LLM_MODEL", "llama2")
+    monkeypatch.setenv("PATH_LLM_CACHE", "off")
+    invalidate_llm_clients()
+    yield
+    invalidate_llm_clients()
+
+
+class TestClientRegistry:
+    """Test suite for the process-wide LLM client registry"""
+
+    def test_same_arguments_return_same_client(self, ollama_env):
+        """Test that repeat lookups hand back the warm client"""
+        first = get_llm_client(phase=1)
+        second = get_llm_client(phase=1)
+
+        assert first is second
+        assert get_client_registry().stats()["hits"] >= 1
+
+    def test_equivalent_configs_share_a_client(self, ollama_env):
+        """Test that different call arguments resolving alike share a client"""
+        by_phase = get_llm_client(phase=1)
+        explicit = get_llm_client(provider="ollama", model="llama2")
+
+        assert by_phase is explicit
+
+    def test_set_config_file_invalidates_clients(self, ollama_env, tmp_path):
+        """Test that switching config files drops cached clients"""
+        from path_framework.core.config import set_config_file
+
+        before = get_llm_client(phase=1)
+        set_config_file(str(tmp_path / "missing.json"))
+        after = get_llm_client(phase=1)
+
+        assert before is not after
@@ -0,0 +1,107 @@
+"""
+Rate Limiter Tests for PATH Framework
+Tests for token-bucket budgets and in-flight limits
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.core.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    resolve_rate_limits,
+)
+from path_framework.exceptions import RateLimitError
+
+
+class TestRateLimiter:
+    """Test suite for per-provider/model rate limiting"""
+
+    def test_limits_merge_from_default_to_model(self):
+        """Test that more specific config entries override broader ones"""
+        rate_limits = {
+            "default": {"max_in_flight": 4, "requests_per_minute": 10},
+            "openai": {"requests_per_minute": 100},
+            "openai:gpt-4": {"tokens_per_minute": 5000},
+        }
+
+        config = resolve_rate_limits("openai", "gpt-4", rate_limits)
+
+        assert config == RateLimitConfig(
+            requests_per_minute=100, tokens_per_minute=5000, max_in_flight=4
+        )
+        assert get_rate_limiter("ollama", "llama2", None) is None
+
+    def test_bucket_reports_wait_for_missing_budget(self):
+        """Test that an exhausted bucket asks callers to wait"""
+        bucket = TokenBucket(rate_per_minute=60)
+        bucket.consume(60)
+
+        assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.05)
+        bucket.refund(60)
+        assert bucket.wait_time(1) == 0.0
+
+    async def test_max_in_flight_caps_concurrency(self):
+        """Test that no more than max_in_flight calls run at once"""
+        limiter = RateLimiter(RateLimitConfig(max_in_flight=2))
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with limiter.limit(10):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.stats()["requests"] == 6
+        assert limiter.stats()["in_flight"] == 0
+
+    async def test_queue_wait_beyond_limit_is_rejected(self):
+        """Test that requests which cannot be admitted in time fail fast"""
+        limiter = RateLimiter(
+            RateLimitConfig(requests_per_minute=1, max_queue_wait=0.1)
+        )
+
+        async with limiter.limit(10):
+            pass
+        with pytest.raises(RateLimitError):
+            async with limiter.limit(10):
+                pass
+
+    async def test_token_usage_is_reconciled(self):
+        """Test that the estimate is corrected by reported usage"""
+        limiter = RateLimiter(RateLimitConfig(tokens_per_minute=1000))
+
+        async with limiter.limit(100) as ticket:
+            ticket.actual_tokens = 300
+
+        assert limiter.stats()["tokens_available"] == pytest.approx(700, abs=1)
+
+    async def test_cancelled_waiter_refunds_its_budget(self):
+        """Test that a caller cancelled while waiting for a slot gives back its budget"""
+        limiter = RateLimiter(
+            RateLimitConfig(
+                requests_per_minute=10, tokens_per_minute=1000, max_in_flight=1
+            )
+        )
+
+        async with limiter.limit(100):
+            waiter = asyncio.create_task(limiter.acquire(400))
+            await asyncio.sleep(0.01)
+            assert limiter.stats()["tokens_available"] == pytest.approx(500, abs=1)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        stats = limiter.stats()
+        assert stats["tokens_available"] == pytest.approx(900, abs=1)
+        assert stats["requests_available"] == pytest.approx(9, abs=0.1)
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
@@ -0,0 +1,97 @@
+"""
+Retry Policy Tests for PATH Framework
+Tests for error classification, Retry-After handling and backoff
+"""
+
+import pytest
+
+from path_framework.core.retry import RetryPolicy, classify_error, parse_retry_after
+from path_framework.exceptions import LLMError, PathFrameworkError
+
+
+class StatusError(Exception):
+    """Provider SDK style error carrying an HTTP status"""
+
+    def __init__(self, status_code, code=None, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.code = code
+        self.headers = headers or {}
+
+
+def _wrapped(error: Exception) -> PathFrameworkError:
+    """Wrap an error the way the provider clients do"""
+    try:
+        raise error
+    except Exception as e:
+        try:
+            raise PathFrameworkError(f"generation failed: {e}")
+        except PathFrameworkError as wrapped:
+            return wrapped
+
+
+class TestRetryPolicy:
+    """Test suite for the shared LLM retry policy"""
+
+    def test_classification_follows_the_exception_chain(self):
+        """Test that wrapped provider errors are classified by their cause"""
+        assert classify_error(_wrapped(StatusError(429))).retryable
+        assert classify_error(_wrapped(TimeoutError())).retryable
+        assert not classify_error(_wrapped(StatusError(400))).retryable
+        assert not classify_error(
+            StatusError(429, code="insufficient_quota"),
+            non_retryable_codes=frozenset({"insufficient_quota"}),
+        ).retryable
+        assert not classify_error(StatusError(529)).retryable
+        assert classify_error(
+            StatusError(529), retryable_statuses=frozenset({529})
+        ).retryable
+
+    def test_retry_after_header_is_parsed(self):
+        """Test seconds and millisecond Retry-After forms"""
+        assert parse_retry_after({"retry-after": "2"}) == 2.0
+        assert parse_retry_after({"retry-after-ms": "250"}) == 0.25
+        assert parse_retry_after({}) is None
+        assert classify_error(
+            StatusError(503, headers={"retry-after": "1.5"})
+        ).retry_after == pytest.approx(1.5)
+
+    async def test_transient_errors_are_retried(self):
+        """Test that a blip is retried and the attempts are recorded"""
+        policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+        outcomes = [StatusError(503), StatusError(429)]
+
+        async def attempt():
+            if outcomes:
+                raise outcomes.pop(0)
+            return "ok"
+
+        result, record = await policy.call(attempt)
+
+        assert result == "ok"
+        assert record["attempts"] == 3
+        assert record["errors"] == ["HTTP 503", "HTTP 429"]
+
+    async def test_permanent_errors_are_not_retried(self):
+        """Test that non-retryable errors propagate immediately"""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.001)
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            raise StatusError(401)
+
+        with pytest.raises(StatusError):
+            await policy.call(attempt)
+        assert calls == 1
+
+    async def test_deadline_bounds_total_time(self):
+        """Test that a Retry-After beyond the deadline gives up early"""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.001, deadline=0.5)
+
+        async def attempt():
+            raise StatusError(429, headers={"retry-after": "30"})
+
+        with pytest.raises(LLMError, match="deadline"):
+            await policy.call(attempt)
@@ -0,0 +1,83 @@
+"""
+Text Chunking Tests for PATH Framework
+Tests for splitting documents into prompt-sized chunks
+"""
+
+from path_framework.core.rate_limiter import estimate_tokens
+from path_framework.core.text_chunking import (
+    chunk_text,
+    iter_sentences,
+    split_sections,
+)
+
+
+class TestChunkText:
+    """Test chunking on section and sentence boundaries"""
+
+    def test_small_text_is_returned_whole(self):
+        """Text within budget is a single chunk"""
+        assert chunk_text("One short paragraph.", 100) == ["One short paragraph."]
+        assert chunk_text("   ", 100) == []
+
+    def test_headings_start_new_sections(self):
+        """Markdown and numbered headings split a block into sections"""
+        text = "# Intro\nSome text.\n## Scope\nMore text.\n\n2.1 Security\nAuth."
+
+        assert split_sections(text) == [
+            "# Intro\nSome text.",
+            "## Scope\nMore text.",
+            "2.1 Security\nAuth.",
+        ]
+
+    def test_chunks_respect_budget_and_keep_all_words(self):
+        """Every chunk fits the budget and no text is lost"""
+        sentence = "The platform shall record every payment event for audit. "
+        text = "\n\n".join(
+            f"## Section {i}\n" + sentence * (i % 7 + 1) for i in range(40)
+        )
+        text += "\n\n" + "word " * 500
+
+        chunks = chunk_text(text, 120)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 120 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+
+class TestIterSentences:
+    """Test streaming sentence segmentation"""
+
+    def test_decimals_abbreviations_and_lists(self):
+        """Only real sentence ends split; list items stand alone"""
+        text = (
+            "Fees are 3.5 USD, e.g. per card payment. Logins take\n"
+            "under 2 s! Is that fast?\n"
+            "- Admins can export reports\n"
+            "2) Data must be encrypted (i.e. AES)\n"
+            "\n"
+            "Final note"
+        )
+
+        assert list(iter_sentences(text)) == [
+            "Fees are 3.5 USD, e.g. per card payment.",
+            "Logins take under 2 s!",
+            "Is that fast?",
+            "Admins can export reports",
+            "Data must be encrypted (i.e. AES)",
+            "Final note",
+        ]
+
+    def test_lines_are_consumed_lazily(self):
+        """A sentence is yielded before the rest of the input is read"""
+        read = 0
+
+        def lines():
+            nonlocal read
+            for i in range(100_000):
+                read += 1
+                yield f"Requirement {i} must hold.\n"
+
+        sentences = iter_sentences(lines())
+
+        assert next(sentences) == "Requirement 0 must hold."
+        assert read == 1
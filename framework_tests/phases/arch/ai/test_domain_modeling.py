@@ -0,0 +1,88 @@
+"""
+Domain Modeling Index Tests for Architecture Phase
+Tests for co-occurrence relationships and union-find bounded contexts
+"""
+
+import random
+import time
+
+import pytest
+
+from path_framework.models.arch_models import DomainEntity
+from path_framework.phases.arch.ai.domain_modeling import DomainModelIndex
+
+
+def _entities(*names: str) -> list[DomainEntity]:
+    return [DomainEntity(name=name, description=f"{name} entity") for name in names]
+
+
+class TestDomainModelIndex:
+    """Test index-driven domain modeling"""
+
+    def test_name_rules_and_cooccurrence_relationships(self):
+        """Rule-based kinds win; other co-mentioned pairs are associations"""
+        entities = _entities("User", "Order", "Session", "Report")
+        index = DomainModelIndex(entities)
+
+        relationships = index.relationships(
+            [
+                "A user places an order.",
+                "Each session belongs to one user.",
+                "Reports are generated nightly.",
+            ]
+        )
+
+        assert relationships == {
+            "User_to_Order": "one_to_many",
+            "User_to_Session": "association",
+        }
+        assert entities[0].relationships == {
+            "Order": "one_to_many",
+            "Session": "association",
+        }
+        assert entities[2].relationships == {"User": "association"}
+
+    def test_min_cooccurrence_filters_incidental_mentions(self):
+        """Pairs mentioned together too rarely are not related"""
+        index = DomainModelIndex(_entities("Ticket", "Agent"), min_cooccurrence=2)
+
+        assert index.relationships(["The agent closes the ticket."]) == {}
+
+    def test_bounded_contexts_follow_relationships(self):
+        """Related entities join a context without merging known contexts"""
+        entities = _entities(
+            "Customer", "Order", "Session", "Shipment", "Carrier", "Invoice"
+        )
+        index = DomainModelIndex(entities)
+        index.relationships(
+            [
+                "A customer places an order in a session.",
+                "A carrier delivers each shipment.",
+            ]
+        )
+
+        assert index.bounded_contexts() == [
+            "User Management",
+            "Order Management",
+            "Shipment Context",
+        ]
+
+    @pytest.mark.slow
+    def test_benchmark_thousands_of_entities(self):
+        """5k entities and 20k sentences are modeled in seconds"""
+        rng = random.Random(3)  # noqa: S311
+        entities = _entities(*(f"Entity{i:05d}" for i in range(5000)))
+        sentences = [
+            " ".join(f"entity{rng.randrange(5000):05d}" for _ in range(3))
+            for _ in range(20_000)
+        ]
+
+        started = time.perf_counter()
+        index = DomainModelIndex(entities)
+        relationships = index.relationships(sentences)
+        contexts = index.bounded_contexts()
+        elapsed = time.perf_counter() - started
+
+        assert relationships
+        assert contexts
+        assert elapsed < 10
@@ -0,0 +1,100 @@
+"""
+Requirement Deduplication Tests for Architecture Phase
+Tests for MinHash/LSH near-duplicate merging
+"""
+
+import pytest
+
+from path_framework.models.arch_models import Requirement, RequirementPriority
+from path_framework.phases.arch.ai.requirement_dedup import (
+    NearDuplicateIndex,
+    deduplicate_requirements,
+)
+
+
+class TestRequirementDedup:
+    """Test near-duplicate detection and merging"""
+
+    def test_near_duplicates_are_merged_into_first_occurrence(self):
+        """Reworded copies are folded into the first requirement"""
+        first = Requirement(
+            description="Users must be able to reset their password by email link",
+            stakeholders=["Support"],
+            acceptance_criteria=["Link expires after one hour"],
+        )
+        copy = Requirement(
+            description="Users must be able to reset their password by email link.",
+            stakeholders=["Security"],
+            acceptance_criteria=["Link expires after one hour", "Link is single use"],
+            priority=RequirementPriority.CRITICAL,
+        )
+        other = Requirement(description="Administrators can export monthly reports")
+
+        kept = deduplicate_requirements([first, copy, other])
+
+        assert kept == [first, other]
+        assert first.stakeholders == ["Support", "Security"]
+        assert first.acceptance_criteria == [
+            "Link expires after one hour",
+            "Link is single use",
+        ]
+        assert first.priority == RequirementPriority.CRITICAL
+
+    def test_distinct_requirements_are_kept(self):
+        """Requirements sharing a few words are not merged"""
+        requirements = [
+            Requirement(description="The system shall store orders in PostgreSQL"),
+            Requirement(description="The system shall store invoices in S3 buckets"),
+        ]
+
+        assert deduplicate_requirements(requirements) == requirements
+
+    def test_chained_duplicates_join_one_group(self):
+        """A duplicate of a merged copy joins the original's group"""
+        index = NearDuplicateIndex(threshold=0.6)
+        base = "customers can track every shipment on a live map with eta updates"
+        first = Requirement(description=base)
+        second = Requirement(description=base + " daily")
+        third = Requirement(description=base + " daily and weekly")
+
+        assert index.add(first) is None
+        assert index.add(second) is first
+        assert index.add(third) is first
+        assert index.merged == 2
+
+    def test_non_ascii_requirements_are_compared_by_their_words(self):
+        """CJK and Cyrillic requirements are only merged with real copies"""
+        requirements = [
+            Requirement(description="用户必须能够通过电子邮件重置密码"),
+            Requirement(description="管理员可以导出月度报告"),
+            Requirement(description="Система должна хранить заказы в базе данных"),
+            Requirement(description="Пользователи получают уведомления о доставке"),  # noqa: RUF001
+            Requirement(description="Система должна хранить заказы в базе данных."),
+        ]
+
+        kept = deduplicate_requirements(requirements)
+
+        assert kept == requirements[:4]
+
+    def test_requirements_without_words_are_never_merged(self):
+        """Empty and punctuation-only text does not count as a match"""
+        requirements = [
+            Requirement(description="", title=""),
+            Requirement(description="...", title=""),
+            Requirement(description="!?", title=""),
+            Requirement(description="", title=""),
+        ]
+
+        assert deduplicate_requirements(requirements) == requirements
+
+    @pytest.mark.slow
+    def test_large_batches(self):
+        """Twenty thousand sentences collapse to their distinct requirements"""
+        requirements = [
+            Requirement(description=f"Service {i % 5000} must log request {i % 5000}")
+            for i in range(20_000)
+        ]
+
+        kept = deduplicate_requirements(requirements)
+
+        assert len(kept) == 5000
@@ -0,0 +1,103 @@
+"""
+Requirement Index Tests for Architecture Phase
+Tests for inverted-index dependency detection
+"""
+
+import random
+import time
+
+import pytest
+
+from path_framework.models.arch_models import Requirement
+from path_framework.phases.arch.ai.domain_analyst import AIDomainAnalyst
+from path_framework.phases.arch.ai.requirement_index import RequirementIndex
+
+
+def _brute_force(requirements: list[Requirement]) -> dict[str, list[str]]:
+    """The original pairwise keyword intersection"""
+    result = {}
+    for req in requirements:
+        words = set(req.description.lower().split())
+        result[req.id] = [
+            other.id
+            for other in requirements
+            if other.id != req.id
+            and len(words & set(other.description.lower().split())) > 2
+        ]
+    return result
+
+
+def _synthetic(count: int, seed: int = 7) -> list[Requirement]:
+    rng = random.Random(seed)  # noqa: S311
+    vocabulary = [f"term{i}" for i in range(2000)]
+    filler = ["the", "system", "shall", "to", "a", "user", "data"]
+    return [
+        Requirement(
+            id=f"REQ-{i:05d}",
+            description=" ".join(
+                rng.sample(vocabulary, 8) + rng.sample(filler, rng.randint(0, 6))
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+class TestRequirementIndex:
+    """Test dependency detection through the term index"""
+
+    def test_matches_pairwise_intersection_without_stop_words(self):
+        """With no stop words the index reproduces the original lists"""
+        requirements = _synthetic(400)
+
+        index = RequirementIndex(requirements, stop_words=())
+
+        assert index.all_dependencies() == _brute_force(requirements)
+
+    async def test_domain_analyst_links_the_original_dependencies(self):
+        """Dependency linking during analysis keeps the pairwise results"""
+        requirements = _synthetic(200)
+        expected = _brute_force(requirements)
+
+        linked = await AIDomainAnalyst()._link_dependencies(requirements)
+
+        assert {req.id: req.dependencies for req in linked} == expected
+
+    def test_stop_words_do_not_create_dependencies(self):
+        """Sharing only filler words does not relate two requirements"""
+        requirements = [
+            Requirement(id="a", description="The system shall export the report"),
+            Requirement(id="b", description="The system shall import the ledger"),
+            Requirement(id="c", description="Export the quarterly report to PDF"),
+        ]
+
+        index = RequirementIndex(requirements, threshold=1)
+
+        assert index.dependencies(0) == ["c"]
+        assert index.dependencies(1) == []
+
+    def test_tfidf_weights_rare_terms_higher(self):
+        """A shared rare term can outweigh several common ones"""
+        requirements = [
+            Requirement(id="a", description="invoice ledger"),
+            Requirement(id="b", description="invoice ledger"),
+            *[
+                Requirement(id=f"x{i}", description="invoice ledger common")
+                for i in range(6)
+            ],
+        ]
+
+        index = RequirementIndex(requirements, threshold=0.5, tfidf=True)
+
+        assert index.dependencies(0) == []
+
+    @pytest.mark.slow
+    def test_benchmark_ten_thousand_requirements(self):
+        """10k synthetic requirements are linked in seconds"""
+        requirements = _synthetic(10_000)
+
+        started = time.perf_counter()
+        dependencies = RequirementIndex(requirements).all_dependencies()
+        elapsed = time.perf_counter() - started
+
+        assert len(dependencies) == 10_000
+        assert elapsed < 10
@@ -0,0 +1,103 @@
+"""
+Step Scheduler Tests for Architecture Phase
+Tests for dependency validation and concurrent step execution
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.exceptions import ValidationError
+from path_framework.phases.arch.ai.orchestrator import PHASE1_STEP_GRAPH, Phase1Step
+from path_framework.phases.arch.process.scheduler import StepScheduler, step_spec
+
+
+def _diamond() -> StepScheduler:
+    return StepScheduler(
+        [
+            step_spec("a", provides=["x"]),
+            step_spec("b", provides=["y"]),
+            step_spec("c", requires=["x", "y"], provides=["z"]),
+            step_spec("d", requires=["z"]),
+        ]
+    )
+
+
+class TestStepGraph:
+    """Test graph validation and ordering"""
+
+    def test_levels_group_independent_steps(self):
+        """Steps without mutual dependencies share a level"""
+        assert _diamond().levels == [["a", "b"], ["c"], ["d"]]
+
+    def test_missing_producer_is_rejected(self):
+        """A requirement nobody provides is a configuration error"""
+        with pytest.raises(ValidationError):
+            StepScheduler([step_spec("a", requires=["missing"])])
+
+    def test_cycle_is_rejected(self):
+        """Cyclic dependencies are detected up front"""
+        with pytest.raises(ValidationError):
+            StepScheduler(
+                [
+                    step_spec("a", requires=["y"], provides=["x"]),
+                    step_spec("b", requires=["x"], provides=["y"]),
+                ]
+            )
+
+    def test_phase1_context_and_domain_modeling_are_independent(self):
+        """The first two architecture steps can run together"""
+        levels = StepScheduler(PHASE1_STEP_GRAPH).levels
+        assert set(levels[0]) == {
+            Phase1Step.CONTEXT_ANALYSIS,
+            Phase1Step.DOMAIN_MODELING,
+        }
+        assert levels[-1] == [Phase1Step.DOCUMENTATION_HANDOFF]
+
+
+class TestStepSchedulerRun:
+    """Test concurrent execution"""
+
+    async def test_ready_steps_run_concurrently(self):
+        """Independent steps overlap and dependents wait for them"""
+        running = set()
+        overlapped = []
+        completed = []
+
+        async def execute(step):
+            running.add(step)
+            overlapped.append(set(running))
+            await asyncio.sleep(0.01)
+            running.discard(step)
+            return step.upper()
+
+        async def on_complete(step, result):
+            completed.append(step)
+            return True
+
+        results = await _diamond().run(execute, on_complete)
+
+        assert {"a", "b"} in overlapped
+        assert results == {"a": "A", "b": "B", "c": "C", "d": "D"}
+        assert completed.index("c") > max(completed.index("a"), completed.index("b"))
+        assert completed[-1] == "d"
+
+    async def test_stop_cancels_running_and_skips_pending(self):
+        """Returning False from on_complete halts the workflow"""
+        cancelled = []
+
+        async def execute(step):
+            try:
+                await asyncio.sleep(0 if step == "a" else 1)
+            except asyncio.CancelledError:
+                cancelled.append(step)
+                raise
+            return step
+
+        async def on_complete(step, result):
+            return step != "a"
+
+        results = await _diamond().run(execute, on_complete)
+
+        assert results == {"a": "a"}
+        assert cancelled == ["b"]
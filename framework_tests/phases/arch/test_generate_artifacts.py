@@ -0,0 +1,197 @@
+"""
+Artifact Generator Tests for Architecture Phase
+Tests for async, multi-project artifact generation
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.core import artifact_writer
+from path_framework.core.llm_client import LLMResponse
+from path_framework.phases.arch.generate_artifacts import (
+    ARTIFACT_STEPS,
+    AsyncPathArtifactGenerator,
+    PathArtifactGenerator,
+    generate_projects,
+)
+
+
+class FakeLLMClient:
+    """Async client answering each prompt with a small YAML artifact"""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, request):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return LLMResponse(
+            content=f"```yaml\nstep: {self.calls}\n```",
+            tokens_used=0,
+            model_used="fake",
+            provider="fake",
+            finish_reason="stop",
+        )
+
+
+class TestAsyncPathArtifactGenerator:
+    """Test the async generator"""
+
+    async def test_generates_every_artifact(self, tmp_path):
+        """All seven artifacts and the README are written"""
+        generator = AsyncPathArtifactGenerator(
+            "Shop", output_dir=tmp_path, llm_client=FakeLLMClient()
+        )
+
+        artifacts = await generator.generate_all_artifacts()
+
+        assert list(artifacts) == [step.name for step in ARTIFACT_STEPS]
+        assert artifacts["context_analysis"] == "step: 1"
+        for step in ARTIFACT_STEPS:
+            assert (tmp_path / step.artifact).exists()
+        assert "## Shop" in (tmp_path / "README.md").read_text()
+
+    async def test_projects_share_one_event_loop(self, tmp_path):
+        """Several projects run concurrently on a shared client"""
+        client = FakeLLMClient()
+
+        results = await generate_projects(
+            [
+                {"project_name": f"Project{i}", "output_dir": tmp_path / str(i)}
+                for i in range(3)
+            ],
+            llm_client=client,
+        )
+
+        assert all(isinstance(result, dict) for result in results)
+        assert client.calls == 3 * len(ARTIFACT_STEPS)
+        assert client.peak == 3
+        assert (tmp_path / "2" / "deliverables" / "architecture_decisions.md").exists()
+
+
+class SyncFakeLLMClient:
+    """Blocking client answering each prompt with a small YAML artifact"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_response(self, prompt, max_tokens=4000):
+        self.calls += 1
+        return f"```yaml\nstep: {self.calls}\n```"
+
+
+class TestPathArtifactGenerator:
+    """Test the blocking generator"""
+
+    def test_directories_are_synced_once_per_run(self, tmp_path, monkeypatch):
+        """Artifacts are written without per-file syncs and synced at the end"""
+        synced = []
+        monkeypatch.setattr(artifact_writer, "_fsync_directory", synced.append)
+        generator = PathArtifactGenerator("Shop", output_dir=tmp_path)
+        generator._llm_client = SyncFakeLLMClient()
+
+        generator.generate_all_artifacts()
+
+        for step in ARTIFACT_STEPS:
+            assert (tmp_path / step.artifact).exists()
+        assert sorted(synced) == sorted(
+            {p.parent for p in generator.write_report.paths}
+        )
+        assert len(synced) == len(set(synced))
+
+
+class FailingLLMClient(FakeLLMClient):
+    """Fake client failing on one call"""
+
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+
+    async def generate(self, request):
+        if self.calls + 1 == self.fail_on:
+            self.calls += 1
+            raise RuntimeError("provider unavailable")
+        return await super().generate(request)
+
+
+class TestResume:
+    """Test checkpointed resume of the seven steps"""
+
+    async def test_resume_runs_only_steps_after_the_failure(self, tmp_path):
+        """Completed steps are reused; only the failed and later steps run"""
+        failing = FailingLLMClient(fail_on=6)
+        with pytest.raises(RuntimeError):
+            await AsyncPathArtifactGenerator(
+                "Shop", output_dir=tmp_path, llm_client=failing
+            ).generate_all_artifacts()
+
+        resumed_client = FakeLLMClient()
+        generator = AsyncPathArtifactGenerator(
+            "Shop", output_dir=tmp_path, llm_client=resumed_client, resume=True
+        )
+        artifacts = await generator.generate_all_artifacts()
+
+        assert resumed_client.calls == 2
+        # Resumed artifacts are reported along with the ones written
+        assert sorted(generator.write_report.paths) == sorted(
+            path for path in tmp_path.rglob("*") if path.is_file()
+        )
+        assert artifacts["context_analysis"] == "step: 1"
+        assert artifacts["architecture_validation"] == "step: 1"
+
+    async def test_changed_input_invalidates_later_steps(self, tmp_path):
+        """A step whose artifact was edited is rerun along with its successors"""
+        await AsyncPathArtifactGenerator(
+            "Shop", output_dir=tmp_path, llm_client=FakeLLMClient()
+        ).generate_all_artifacts()
+        (tmp_path / ARTIFACT_STEPS[4].artifact).write_text("edited by hand")
+
+        client = FakeLLMClient()
+        await AsyncPathArtifactGenerator(
+            "Shop", output_dir=tmp_path, llm_client=client, resume=True
+        ).generate_all_artifacts()
+
+        assert client.calls == 3
+
+
+class StableLLMClient(FakeLLMClient):
+    """Fake client whose answer does not depend on the call"""
+
+    async def generate(self, request):
+        response = await super().generate(request)
+        response.content = "```yaml\nstable: true\n```"
+        return response
+
+
+class TestIncrementalBuild:
+    """Test rebuilding only the steps whose declared inputs changed"""
+
+    async def test_changed_request_field_rebuilds_only_its_readers(self, tmp_path):
+        """Downstream steps are skipped when the rebuilt artifact is unchanged"""
+        client = StableLLMClient()
+        await AsyncPathArtifactGenerator(
+            "Shop", output_dir=tmp_path, llm_client=client, constraints="EU hosting"
+        ).generate_all_artifacts()
+
+        changed = AsyncPathArtifactGenerator(
+            "Shop",
+            output_dir=tmp_path,
+            llm_client=client,
+            constraints="EU and US hosting",
+            resume=True,
+        )
+        plan = changed.build_plan()
+
+        assert plan["context_analysis"] == ["requirements_context changed"]
+        assert plan["domain_modeling"] == ["context_analysis is rebuilt"]
+
+        calls = client.calls
+        await changed.generate_all_artifacts()
+        assert client.calls == calls + 1
+        assert not any(changed.build_plan().values())
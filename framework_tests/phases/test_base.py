@@ -0,0 +1,80 @@
+"""
+Base Phase Tests for PATH Framework
+Tests for waiting on agent tasks
+"""
+
+import asyncio
+
+import pytest
+
+from path_framework.agents_base import AgentTask
+from path_framework.exceptions import PhaseError
+from path_framework.phases.base import BasePhase
+
+
+class DemoPhase(BasePhase):
+    """Minimal concrete phase"""
+
+    async def execute(self, input_data):
+        return None
+
+    def get_required_agents(self):
+        return []
+
+    def validate_input(self, input_data):
+        return True
+
+
+def _phase_with_tasks(count: int) -> tuple[DemoPhase, list[AgentTask]]:
+    phase = DemoPhase("demo", "Demo", "Demo phase", agent_registry=None)
+    tasks = [AgentTask(f"t{i}", "task", {}) for i in range(count)]
+    for task in tasks:
+        phase.active_tasks[task.task_id] = task
+    return phase, tasks
+
+
+class TestTaskWaiting:
+    """Test event-driven task completion"""
+
+    async def test_wait_for_all_tasks_collects_results(self):
+        """Every completed task's result is returned"""
+        phase, tasks = _phase_with_tasks(3)
+
+        async def finish():
+            for i, task in enumerate(tasks):
+                await asyncio.sleep(0)
+                task.mark_completed({"n": i})
+
+        finisher = asyncio.create_task(finish())
+        results = await phase.wait_for_all_tasks(timeout=1)
+        await finisher
+
+        assert results == {"t0": {"n": 0}, "t1": {"n": 1}, "t2": {"n": 2}}
+        assert phase.active_tasks == {}
+
+    async def test_first_failure_stops_waiting(self):
+        """A failure returns at once and leaves unfinished tasks active"""
+        phase, tasks = _phase_with_tasks(2)
+        tasks[0].mark_failed("boom")
+
+        results = await phase.wait_for_all_tasks(timeout=5)
+
+        assert results == {}
+        assert "boom" in phase.errors[0]
+        assert list(phase.active_tasks) == ["t1"]
+
+    async def test_shared_deadline_times_out(self):
+        """Unfinished tasks are reported once the group deadline passes"""
+        phase, _ = _phase_with_tasks(2)
+
+        results = await phase.wait_for_all_tasks(timeout=0.01)
+
+        assert results == {}
+        assert len(phase.errors) == 2
+
+    async def test_single_task_timeout(self):
+        """Waiting on one task honours its timeout"""
+        phase, _ = _phase_with_tasks(1)
+        with pytest.raises(PhaseError, match="timed out"):
+            await phase.wait_for_task_completion("t0", timeout=0.01)
+        assert "t0" in phase.active_tasks
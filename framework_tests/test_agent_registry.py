@@ -0,0 +1,78 @@
+"""Tests for the capability-indexed agent registry."""
+
+import asyncio
+
+import pytest
+
+from path_framework.agents import AgentRegistry
+from path_framework.agents_base import AgentTask, BaseAgent
+from path_framework.exceptions import AgentError
+
+
+class SlowAgent(BaseAgent):
+    """Agent whose tasks finish when released by the test."""
+
+    def __init__(self, agent_id="slow", capabilities=None):
+        super().__init__(
+            agent_id=agent_id,
+            name="Slow Agent",
+            specialization="Testing",
+            decision_authority="low",
+            phase=1,
+            capabilities=capabilities or ["analysis"],
+        )
+        self.gate = asyncio.Event()
+
+    async def execute(self, task):
+        await self.gate.wait()
+        return {"done": task.get("n")}
+
+    def validate_output(self, output):
+        return True
+
+
+def test_pool_registration_and_capability_lookup():
+    """Test pooled instances get unique IDs and are indexed by capability."""
+    registry = AgentRegistry()
+    ids = registry.register_pool(SlowAgent, 3)
+    registry.register(SlowAgent("reviewer", capabilities=["review"]))
+
+    assert ids == ["slow-1", "slow-2", "slow-3"]
+    assert len(registry.list_agents("analysis")) == 3
+    assert registry.has_capability("slow")
+    assert registry.idle_count("review") == 1
+    assert not registry.has_capability("deployment")
+
+
+@pytest.mark.asyncio
+async def test_find_available_agent_matches_all_capabilities():
+    """Test that only agents with every requested capability match."""
+    registry = AgentRegistry()
+    registry.register(SlowAgent("a", capabilities=["analysis"]))
+    registry.register(SlowAgent("b", capabilities=["analysis", "review"]))
+
+    agent = await registry.find_available_agent(["analysis", "review"])
+
+    assert agent.agent_id == "b"
+    assert await registry.find_available_agent(["deployment"]) is None
+
+
+@pytest.mark.asyncio
+async def test_busy_pool_waits_for_release():
+    """Test that acquiring from a busy pool waits for a finished task."""
+    registry = AgentRegistry()
+    registry.register_pool(SlowAgent, 1)
+    agent = await registry.acquire_agent(["analysis"])
+    task = AgentTask(task_id="t1", description="test", parameters={"n": 1})
+    await registry.assign_task(agent.agent_id, task)
+
+    with pytest.raises(AgentError):
+        await registry.acquire_agent(["analysis"], timeout=0.01)
+    assert registry.stats()["utilisation"] == 1.0
+
+    waiter = asyncio.create_task(registry.acquire_agent(["analysis"], timeout=1))
+    agent.gate.set()
+
+    assert await task.wait() == {"done": 1}
+    assert await waiter is agent
+    assert registry.stats()["by_agent"]["slow"]["tasks"] == 1
@@ -1,8 +1,11 @@
 """Tests for the base agent functionality."""
 
+import asyncio
+
 import pytest
 
-from path_framework.agents_base import AgentStatus, BaseAgent
+from path_framework.agents_base import AgentStatus, AgentTask, BaseAgent
+from path_framework.exceptions import AgentError
 
 
 class TestAgent(BaseAgent):
@@ -80,3 +83,34 @@ def test_agent_string_representation():
     # Basic existence check
     assert agent.agent_id == "string-test"
     assert agent.name == "String Test Agent"
+
+
+@pytest.mark.asyncio
+async def test_run_task_resolves_waiters():
+    """Test that waiters are woken with the task result."""
+    agent = TestAgent(
+        agent_id="task-agent",
+        name="Task Agent",
+        specialization="Testing",
+        decision_authority="low",
+        phase=1,
+    )
+    task = AgentTask(task_id="t1", description="test", parameters={"name": "t1"})
+
+    waiter = asyncio.create_task(task.wait())
+    await asyncio.sleep(0)
+    await agent.run_task(task)
+
+    assert await waiter == {"result": "Task t1 completed"}
+    assert task.status == AgentStatus.COMPLETED
+    assert agent.status == AgentStatus.IDLE
+
+
+@pytest.mark.asyncio
+async def test_failed_task_raises_on_wait():
+    """Test that a failed task raises for its waiters."""
+    task = AgentTask(task_id="t2", description="test", parameters={})
+    task.mark_failed("boom")
+
+    with pytest.raises(AgentError, match="boom"):
+        await task.wait()
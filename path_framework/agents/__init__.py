@@ -0,0 +1,5 @@
+"""Agent management for PATH Framework"""
+
+from .registry import AgentRegistry
+
+__all__ = ["AgentRegistry"]
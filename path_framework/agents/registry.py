@@ -0,0 +1,279 @@
+"""
+Agent Registry for PATH Framework
+Capability-indexed pool of agent instances shared between phases
+
+Agents are indexed by each capability they offer, and idle agents are kept
+in per-capability ordered sets, so finding an idle agent for a capability
+takes constant time regardless of how many agents are registered. Several
+instances of the same agent type can be registered as a pool; phases that
+need an agent while the pool is busy wait for one to be released.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from ..agents_base import AgentStatus, AgentTask, BaseAgent
+from ..exceptions import AgentError
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRegistry:
+    """
+    Registry and scheduler for a bounded pool of agents
+
+    All methods must be called from the event loop the registry is used on.
+    """
+
+    def __init__(self):
+        self._agents: dict[str, BaseAgent] = {}
+        self._by_capability: dict[str, dict[str, BaseAgent]] = {}
+        # Insertion-ordered so the longest idle agent is handed out first
+        self._idle: dict[str, dict[str, BaseAgent]] = {}
+        self._idle_ids: set[str] = set()
+        self._reserved: set[str] = set()
+        self._running: dict[str, asyncio.Task] = {}
+
+        # asyncio primitives are bound to the loop that first uses them
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._released: asyncio.Condition | None = None
+
+        self._busy_since: dict[str, float] = {}
+        self._usage: dict[str, dict[str, float]] = {}
+
+    def _bind_loop(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._released = asyncio.Condition()
+        return self._released
+
+    def register(self, agent: BaseAgent) -> None:
+        """Add an agent to the registry as idle"""
+        if agent.agent_id in self._agents:
+            raise AgentError(f"Agent already registered: {agent.agent_id}")
+
+        self._agents[agent.agent_id] = agent
+        for capability in agent.capabilities:
+            self._by_capability.setdefault(capability, {})[agent.agent_id] = agent
+        self._usage[agent.agent_id] = {"tasks": 0, "failed": 0, "busy_seconds": 0.0}
+        self._mark_idle(agent)
+
+    def register_pool(self, factory: Callable[[], BaseAgent], size: int) -> list[str]:
+        """
+        Register ``size`` instances of one agent type
+
+        Args:
+            factory: Callable creating a new agent instance
+            size: Number of instances
+
+        Returns:
+            IDs of the registered instances
+        """
+        agent_ids = []
+        for index in range(1, size + 1):
+            agent = factory()
+            if size > 1 or agent.agent_id in self._agents:
+                agent.agent_id = f"{agent.agent_id}-{index}"
+            self.register(agent)
+            agent_ids.append(agent.agent_id)
+        return agent_ids
+
+    def unregister(self, agent_id: str) -> None:
+        """Remove an idle agent from the registry"""
+        agent = self.get_agent(agent_id)
+        if not self._is_idle(agent):
+            raise AgentError(f"Cannot unregister busy agent: {agent_id}")
+
+        self._unmark_idle(agent)
+        for capability in agent.capabilities:
+            holders = self._by_capability[capability]
+            del holders[agent_id]
+            if not holders:
+                del self._by_capability[capability]
+        del self._agents[agent_id]
+        del self._usage[agent_id]
+
+    def get_agent(self, agent_id: str) -> BaseAgent:
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            raise AgentError(f"Unknown agent: {agent_id}")
+        return agent
+
+    def list_agents(self, capability: str | None = None) -> list[BaseAgent]:
+        """List registered agents, optionally only those with a capability"""
+        if capability is None:
+            return list(self._agents.values())
+        return list(self._by_capability.get(capability, {}).values())
+
+    def has_capability(self, capability: str) -> bool:
+        """Whether any registered agent (busy or idle) offers ``capability``"""
+        return capability in self._by_capability
+
+    def idle_count(self, capability: str) -> int:
+        return len(self._idle.get(capability, {}))
+
+    def _is_idle(self, agent: BaseAgent) -> bool:
+        return agent.agent_id in self._idle_ids
+
+    def _mark_idle(self, agent: BaseAgent) -> None:
+        self._idle_ids.add(agent.agent_id)
+        for capability in agent.capabilities:
+            self._idle.setdefault(capability, {})[agent.agent_id] = agent
+
+    def _unmark_idle(self, agent: BaseAgent) -> None:
+        self._idle_ids.discard(agent.agent_id)
+        for capability in agent.capabilities:
+            self._idle[capability].pop(agent.agent_id, None)
+
+    def _pick_idle(self, capabilities: Iterable[str]) -> BaseAgent | None:
+        required = set(capabilities)
+        if not required:
+            agent_id = next(iter(self._idle_ids), None)
+            return self._agents[agent_id] if agent_id is not None else None
+
+        buckets = [self._idle.get(capability, {}) for capability in required]
+        # Scan the smallest bucket; with one capability the first entry matches
+        for agent in min(buckets, key=len).values():
+            if required <= agent.capabilities:
+                return agent
+        return None
+
+    async def find_available_agent(
+        self, capabilities: Iterable[str]
+    ) -> BaseAgent | None:
+        """
+        Find an idle agent offering every capability, without reserving it
+
+        Args:
+            capabilities: Required capabilities
+
+        Returns:
+            An idle agent, or None if all matching agents are busy
+        """
+        return self._pick_idle(capabilities)
+
+    async def acquire_agent(
+        self, capabilities: Iterable[str], timeout: float | None = None
+    ) -> BaseAgent:
+        """
+        Reserve an idle agent, waiting for one to be released if necessary
+
+        The reservation is consumed by ``assign_task`` or returned with
+        ``release_agent``.
+
+        Args:
+            capabilities: Required capabilities
+            timeout: Maximum seconds to wait for an agent
+
+        Returns:
+            The reserved agent
+
+        Raises:
+            AgentError: If no registered agent offers the capabilities or
+                none became available in time
+        """
+        required = list(capabilities)
+        missing = [c for c in required if not self.has_capability(c)]
+        if missing:
+            raise AgentError(f"No agent registered with capabilities: {missing}")
+
+        released = self._bind_loop()
+        async with released:
+            try:
+                agent = await asyncio.wait_for(
+                    released.wait_for(lambda: self._pick_idle(required)), timeout
+                )
+            except asyncio.TimeoutError:
+                raise AgentError(
+                    f"No agent with capabilities {required} available "
+                    f"within {timeout} seconds"
+                )
+            self._unmark_idle(agent)
+            self._reserved.add(agent.agent_id)
+        return agent
+
+    async def release_agent(self, agent_id: str) -> None:
+        """Return a reserved but unused agent to the idle pool"""
+        if agent_id in self._reserved:
+            self._reserved.discard(agent_id)
+            await self._set_idle(self.get_agent(agent_id))
+
+    async def _set_idle(self, agent: BaseAgent) -> None:
+        self._mark_idle(agent)
+        released = self._bind_loop()
+        async with released:
+            released.notify_all()
+
+    async def assign_task(self, agent_id: str, task: AgentTask) -> str:
+        """
+        Start a task on an agent
+
+        The agent must be idle or reserved by ``acquire_agent``. It returns
+        to the idle pool when the task finishes; completion can be awaited
+        with ``task.wait()``.
+
+        Args:
+            agent_id: Agent to run the task
+            task: Task to run
+
+        Returns:
+            The task ID
+
+        Raises:
+            AgentError: If the agent is unknown or busy
+        """
+        agent = self.get_agent(agent_id)
+        if agent_id in self._reserved:
+            self._reserved.discard(agent_id)
+        elif self._is_idle(agent):
+            self._unmark_idle(agent)
+        else:
+            raise AgentError(f"Agent {agent_id} is busy")
+
+        self._busy_since[agent_id] = time.monotonic()
+        self._running[agent_id] = asyncio.create_task(self._run(agent, task))
+        return task.task_id
+
+    async def _run(self, agent: BaseAgent, task: AgentTask) -> None:
+        try:
+            await agent.run_task(task)
+        finally:
+            usage = self._usage.get(agent.agent_id)
+            if usage is not None:
+                usage["tasks"] += 1
+                usage["failed"] += task.status == AgentStatus.FAILED
+                usage["busy_seconds"] += time.monotonic() - self._busy_since.pop(
+                    agent.agent_id
+                )
+            self._running.pop(agent.agent_id, None)
+            await self._set_idle(agent)
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool utilisation per agent type and per agent"""
+        by_type: dict[str, dict[str, Any]] = {}
+        for agent in self._agents.values():
+            entry = by_type.setdefault(
+                type(agent).__name__,
+                {"agents": 0, "busy": 0, "tasks": 0, "failed": 0},
+            )
+            usage = self._usage[agent.agent_id]
+            entry["agents"] += 1
+            entry["busy"] += agent.agent_id not in self._idle_ids
+            entry["tasks"] += usage["tasks"]
+            entry["failed"] += usage["failed"]
+
+        for entry in by_type.values():
+            entry["utilisation"] = entry["busy"] / entry["agents"]
+
+        busy = len(self._agents) - len(self._idle_ids)
+        return {
+            "agents": len(self._agents),
+            "busy": busy,
+            "utilisation": busy / len(self._agents) if self._agents else 0.0,
+            "by_type": by_type,
+            "by_agent": {agent_id: dict(u) for agent_id, u in self._usage.items()},
+        }
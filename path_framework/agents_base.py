@@ -2,12 +2,15 @@
 Base Agent class for PATH Framework
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .exceptions import AgentError
+
 
 class AgentStatus(Enum):
     """Agent execution status"""
@@ -26,6 +29,65 @@ class AgentTask:
     description: str
     parameters: dict[str, Any]
     status: AgentStatus = AgentStatus.IDLE
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+    # Resolved when the task finishes; created by the first waiter
+    _done: asyncio.Future | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (AgentStatus.COMPLETED, AgentStatus.FAILED)
+
+    def mark_completed(self, result: dict[str, Any]) -> None:
+        """Record the task output and wake everyone waiting on it"""
+        self.result = result
+        self.status = AgentStatus.COMPLETED
+        self._resolve()
+
+    def mark_failed(self, error: str) -> None:
+        """Record the failure and wake everyone waiting on the task"""
+        self.error = error
+        self.status = AgentStatus.FAILED
+        self._resolve()
+
+    def _resolve(self) -> None:
+        future = self._done
+        if future is None or future.done():
+            return
+        loop = future.get_loop()
+        try:
+            same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            same_loop = False
+        if same_loop:
+            future.set_result(None)
+        else:
+            # Completed from another thread or loop
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+    async def wait(self) -> dict[str, Any] | None:
+        """
+        Wait for the task to finish without polling
+
+        Cancelling the wait does not affect the task itself.
+
+        Returns:
+            The task output
+
+        Raises:
+            AgentError: If the task failed
+        """
+        if not self.finished:
+            if self._done is None:
+                self._done = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self._done)
+
+        if self.status == AgentStatus.FAILED:
+            raise AgentError(f"Task {self.task_id} failed: {self.error}")
+        return self.result
 
 
 class BaseAgent(ABC):
@@ -41,6 +103,7 @@ class BaseAgent(ABC):
         decision_authority: str,
         phase: int,
         config: dict[str, Any] | None = None,
+        capabilities: list[str] | None = None,
     ):
         self.agent_id = agent_id
         self.name = name
@@ -48,10 +111,30 @@ class BaseAgent(ABC):
         self.decision_authority = decision_authority
         self.phase = phase
         self.config = config or {}
+        # An agent can always be requested by its own type id
+        self.capabilities = {agent_id, *(capabilities or [])}
         self.logger = logging.getLogger(f"path.agent.{agent_id}")
         self.current_task: AgentTask | None = None
         self.status = AgentStatus.IDLE
 
+    async def run_task(self, task: AgentTask) -> None:
+        """Execute a task and record its outcome on the task"""
+        self.current_task = task
+        self.status = task.status = AgentStatus.RUNNING
+        try:
+            result = await self.execute(task.parameters)
+        except asyncio.CancelledError:
+            task.mark_failed("cancelled")
+            raise
+        except Exception as e:
+            self.logger.error(f"Task {task.task_id} failed: {e!s}")
+            task.mark_failed(str(e))
+        else:
+            task.mark_completed(result)
+        finally:
+            self.current_task = None
+            self.status = AgentStatus.IDLE
+
     @abstractmethod
     async def execute(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute an agent task"""
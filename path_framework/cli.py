@@ -20,6 +20,7 @@ from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 # Arch phase imports
+from .core.llm_client import add_stream_listener
 from .phases.arch.simple_orchestrator import ArchOrchestrator
 
 app = typer.Typer(
@@ -410,6 +411,12 @@ def arch(
     config_file: str | None = typer.Option(
         None, "--config", "-c", help="Configuration file path"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Disable the LLM response cache"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached LLM responses and store fresh ones"
+    ),
 ):
     """
     Execute Arch Phase: Software Engineering & Architecture
@@ -428,6 +435,11 @@ def arch(
         )
     )
 
+    if no_cache or refresh:
+        from .core.llm_cache import configure_llm_cache
+
+        configure_llm_cache(enabled=False if no_cache else None, refresh=refresh)
+
     # Setup paths
     if project_path:
         proj_path = Path(project_path).resolve()
@@ -531,10 +543,21 @@ async def _run_arch_phase(
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        TextColumn("[dim]{task.fields[streamed]}"),
         console=console,
     ) as progress:
         # Execute Phase 1 workflow
-        task = progress.add_task("Initializing Phase 1...", total=7)
+        task = progress.add_task("Initializing Phase 1...", total=7, streamed="")
+
+        # Show LLM output arriving instead of a silent spinner
+        streamed_chars = 0
+
+        def on_stream_chunk(request, chunk):
+            nonlocal streamed_chars
+            streamed_chars += len(chunk.delta)
+            progress.update(task, streamed=f"{streamed_chars:,} chars received")
+
+        remove_stream_listener = add_stream_listener(on_stream_chunk)
 
         try:
             # Step 1: Context Analysis
@@ -609,6 +632,8 @@ async def _run_arch_phase(
         except Exception as e:
             progress.update(task, description=f"Error: {e}")
             raise
+        finally:
+            remove_stream_listener()
 
     # Display results
     console.print("\n[green]✅ Architecture phase completed successfully![/green]")
@@ -33,6 +33,7 @@ class AgentConfig:
     audit_trail_enabled: bool = True
     decision_timeout: int = 300  # seconds
     retry_attempts: int = 3
+    enrichment_concurrency: int = 8
 
 
 @dataclass
@@ -162,6 +163,7 @@ class PathConfig:
             audit_trail_enabled=agents_data.get("audit_trail_enabled", True),
             decision_timeout=agents_data.get("decision_timeout", 300),
             retry_attempts=agents_data.get("retry_attempts", 3),
+            enrichment_concurrency=agents_data.get("enrichment_concurrency", 8),
         )
 
         # Quality gates config
@@ -284,6 +286,7 @@ class PathConfig:
                 "audit_trail_enabled": self.agents.audit_trail_enabled,
                 "decision_timeout": self.agents.decision_timeout,
                 "retry_attempts": self.agents.retry_attempts,
+                "enrichment_concurrency": self.agents.enrichment_concurrency,
             },
             "quality_gates": {
                 "test_coverage_threshold": self.quality_gates.test_coverage_threshold,
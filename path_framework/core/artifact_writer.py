@@ -0,0 +1,334 @@
+"""
+Artifact Writer for PATH Framework
+Background, atomic, skip-unchanged file writes for generated artifacts
+
+Artifact generation alternates between waiting on the LLM and writing its
+output. Writes are queued to a background task and performed in a worker
+thread, so the next LLM call starts without waiting for the disk. Each
+file is written to a temporary file in the same directory and renamed into
+place, so readers never see a partially written artifact.
+
+A file whose content is already on disk is left untouched, so re-running
+generation on an unchanged project does not rewrite files (or wake file
+watchers). Queued writes are committed in batches: repeated writes to one
+path collapse into the last one, and each directory is synced once per
+batch rather than once per file.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteReport:
+    """
+    Paths and byte counts of written and skipped artifacts
+
+    A path saved several times (such as the run manifest after every
+    step) is counted once, with its last size; it counts as written if
+    any of the saves changed it.
+    """
+
+    written: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    bytes_written: int = 0
+    bytes_skipped: int = 0
+    _recorded: dict[Path, tuple[int, bool]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def add(self, path: Path, size: int, changed: bool) -> None:
+        previous = self._recorded.get(path)
+        if previous is not None:
+            previous_size, previous_changed = previous
+            if previous_changed:
+                self.written.remove(path)
+                self.bytes_written -= previous_size
+            else:
+                self.unchanged.remove(path)
+                self.bytes_skipped -= previous_size
+            changed = changed or previous_changed
+
+        self._recorded[path] = (size, changed)
+        if changed:
+            self.written.append(path)
+            self.bytes_written += size
+        else:
+            self.unchanged.append(path)
+            self.bytes_skipped += size
+
+    @property
+    def paths(self) -> list[Path]:
+        """Every artifact path handled, written or unchanged"""
+        return sorted({*self.written, *self.unchanged})
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.written)} written ({self.bytes_written:,} bytes), "
+            f"{len(self.unchanged)} unchanged ({self.bytes_skipped:,} bytes skipped)"
+        )
+
+
+def _same_content(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _write_temp(path: Path, data: bytes, fsync: bool) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+    return temp_path
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist renames in a directory (not supported on every platform)"""
+    with contextlib.suppress(OSError):
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def atomic_write_text(path: str | Path, content: str) -> None:
+    """Write a text file via a temporary file and an atomic rename"""
+    path = Path(path)
+    temp_path = _write_temp(path, content.encode("utf-8"), fsync=False)
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+def write_if_changed(
+    path: str | Path,
+    content: str,
+    report: WriteReport | None = None,
+    fsync: bool = True,
+) -> bool:
+    """
+    Atomically write a text file unless it already has this content
+
+    Args:
+        path: Target file
+        content: Text to write
+        report: Report to record the outcome in
+        fsync: Sync the file and its directory to disk; to sync a run's
+            files together instead, pass False and call ``sync_paths``
+
+    Returns:
+        Whether the file was written
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    changed = not _same_content(path, data)
+    if changed:
+        temp_path = _write_temp(path, data, fsync)
+        try:
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+        if fsync:
+            _fsync_directory(path.parent)
+    if report is not None:
+        report.add(path, len(data), changed)
+    return changed
+
+
+def sync_paths(paths: Iterable[str | Path]) -> None:
+    """
+    Sync written files, and each of their directories once, to disk
+
+    Args:
+        paths: Files written with ``fsync=False``; repeats are synced once
+    """
+    files = {Path(path) for path in paths}
+    for path in files:
+        with contextlib.suppress(OSError):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    for directory in {path.parent for path in files}:
+        _fsync_directory(directory)
+
+
+class ArtifactWriter:
+    """
+    Queue of pending artifact writes drained by a background task
+
+    One writer can be shared by every generator running on an event loop.
+    Writes complete in the order they were queued, so a later write to
+    the same path always wins. Use the writer as an async context manager,
+    or call ``close()`` when done; both wait for queued writes to finish.
+
+    Args:
+        concurrency: Maximum number of files of a batch written at once;
+            they are still renamed into place in queue order
+        fsync: Sync written files, and once per batch their directories,
+            to disk
+    """
+
+    def __init__(self, concurrency: int = 1, fsync: bool = True):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.fsync = fsync
+        self.report = WriteReport()
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._errors: list[tuple[Path, BaseException]] = []
+
+    @property
+    def written(self) -> int:
+        return len(self.report.written)
+
+    def _start(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain())
+        return self._queue
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        while True:
+            # Everything queued while the previous batch was being written
+            # becomes the next batch; the last write to a path wins
+            batch: dict[Path, tuple[str, WriteReport | None]] = {}
+            queued = 0
+            while queued == 0 or not queue.empty():
+                path, content, report = await queue.get()
+                batch.pop(path, None)
+                batch[path] = (content, report)
+                queued += 1
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                # Keep draining: later writes and flush() must not hang
+                for path in batch:
+                    self._record_error(path, e)
+            finally:
+                for _ in range(queued):
+                    queue.task_done()
+
+    def _stage(self, path: Path, data: bytes) -> tuple[str | None, Exception | None]:
+        """Temporary file holding new content, or None if it is unchanged"""
+        if _same_content(path, data):
+            return None, None
+        try:
+            return _write_temp(path, data, self.fsync), None
+        except Exception as e:
+            return None, e
+
+    def _write_batch(self, batch: dict[Path, tuple[str, WriteReport | None]]) -> None:
+        paths = list(batch)
+        data = [batch[path][0].encode("utf-8") for path in paths]
+        if self.concurrency > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(min(self.concurrency, len(paths))) as pool:
+                staged = list(pool.map(self._stage, paths, data))
+        else:
+            staged = list(map(self._stage, paths, data))
+
+        directories = set()
+        for path, content, (temp_path, error) in zip(paths, data, staged, strict=True):
+            report = batch[path][1]
+            if error is not None:
+                self._record_error(path, error)
+                continue
+            if temp_path is not None:
+                try:
+                    os.replace(temp_path, path)
+                except Exception as e:
+                    with contextlib.suppress(OSError):
+                        os.unlink(temp_path)
+                    self._record_error(path, e)
+                    continue
+                directories.add(path.parent)
+            changed = temp_path is not None
+            self.report.add(path, len(content), changed)
+            if report is not None and report is not self.report:
+                report.add(path, len(content), changed)
+
+        if self.fsync:
+            for directory in directories:
+                _fsync_directory(directory)
+
+    def _record_error(self, path: Path, error: Exception) -> None:
+        logger.error(f"Failed to write artifact {path}: {error}")
+        self._errors.append((path, error))
+
+    def write(
+        self, path: str | Path, content: str, report: WriteReport | None = None
+    ) -> None:
+        """
+        Queue ``content`` to be written to ``path``
+
+        Args:
+            path: Target file
+            content: Text to write
+            report: Report to record the outcome in, besides the writer's
+                own ``report`` of every write
+        """
+        self._start().put_nowait((Path(path), content, report))
+
+    async def flush(self) -> None:
+        """
+        Wait until every queued write has finished
+
+        Raises:
+            OSError: The first error of any write that failed since the
+                last flush
+        """
+        if self._queue is not None:
+            await self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            path, error = errors[0]
+            raise OSError(
+                f"Failed to write {len(errors)} artifacts, e.g. {path}"
+            ) from error
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the background task"""
+        try:
+            await self.flush()
+        finally:
+            if self._worker is not None:
+                self._worker.cancel()
+                await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            self._queue = None
+
+    async def __aenter__(self) -> "ArtifactWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,152 @@
+"""
+Bounded Concurrency for PATH Framework
+Fan out coroutines and streams with a cap on how many run at once
+
+Used for per-item LLM work (e.g. enriching each extracted requirement, or
+extracting from each chunk of a large document), where running everything
+at once would flood the provider and running items one by one makes the
+batch as slow as the sum of its calls.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BoundedGather:
+    """
+    Collect coroutines, running at most ``concurrency`` of them at a time
+
+    Coroutines may be submitted while earlier ones are still running, so
+    work can start as soon as its input is known. Results come back in
+    submission order, and a failing coroutine only affects its own slot.
+
+    Submitted work starts immediately, so it must not be abandoned: use
+    the gather as an async context manager, which cancels (and waits for)
+    unfinished work if the block raises, or always await ``results()`` or
+    ``cancel()``.
+
+    Args:
+        concurrency: Maximum number of coroutines running at once
+    """
+
+    def __init__(self, concurrency: int):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.concurrency = concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+        self._tasks: list[asyncio.Task] = []
+
+    async def _guarded(self, work: Awaitable[T]) -> T:
+        async with self._slots:
+            return await work
+
+    def submit(self, work: Awaitable[T]) -> None:
+        """Schedule a coroutine; it starts once a slot is free"""
+        self._tasks.append(asyncio.create_task(self._guarded(work)))
+
+    async def results(self) -> list[Any]:
+        """
+        Wait for every submitted coroutine
+
+        Returns:
+            Each coroutine's result, or the exception it raised, in
+            submission order
+        """
+        try:
+            return await asyncio.gather(*self._tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            await self.cancel()
+            raise
+
+    async def cancel(self) -> None:
+        """Cancel unfinished coroutines and wait until they have stopped"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "BoundedGather":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            await self.cancel()
+        else:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def map_bounded(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int = 8
+) -> list[R | BaseException]:
+    """
+    Apply an async function to every item with bounded concurrency
+
+    Args:
+        func: Coroutine function applied to each item
+        items: Inputs
+        concurrency: Maximum number of calls in flight
+
+    Returns:
+        Results (or raised exceptions) in input order
+    """
+    async with BoundedGather(concurrency) as batch:
+        for item in items:
+            batch.submit(func(item))
+        return await batch.results()
+
+
+_STREAM_DONE = object()
+
+
+async def merge_streams(
+    streams: Iterable[AsyncIterator[T]], concurrency: int = 8
+) -> AsyncIterator[T]:
+    """
+    Interleave several async iterators, yielding items as they arrive
+
+    At most ``concurrency`` streams are consumed at once; the rest start as
+    earlier ones finish. An exception from any stream is raised to the
+    consumer and stops the others.
+
+    Args:
+        streams: Async iterators to merge
+        concurrency: Maximum number of streams consumed at once
+
+    Yields:
+        Items from all streams in arrival order
+    """
+    streams = list(streams)
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def pump(stream: AsyncIterator[T]) -> None:
+        async with slots:
+            try:
+                async for item in stream:
+                    await queue.put((item, None))
+            except Exception as e:
+                await queue.put((_STREAM_DONE, e))
+                return
+        await queue.put((_STREAM_DONE, None))
+
+    pumps = [asyncio.create_task(pump(stream)) for stream in streams]
+    remaining = len(pumps)
+    try:
+        while remaining:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _STREAM_DONE:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in pumps:
+            task.cancel()
+        await asyncio.gather(*pumps, return_exceptions=True)
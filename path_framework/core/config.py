@@ -212,6 +212,44 @@ class PathConfig:
                 "timeout": 30,
                 "temperature": 0.1,
                 "max_tokens": 4000,
+                "connection_pool": {
+                    "max_connections": 20,
+                    "max_keepalive_connections": 10,
+                    "keepalive_expiry": 30.0,
+                    "http2": True,
+                },
+                "cache": {
+                    "enabled": True,
+                    "path": "~/.path_framework/cache/llm_responses.db",
+                    "ttl_seconds": 604800,
+                    "max_entries": 10000,
+                    "max_bytes": 268435456,
+                    "max_temperature": 0.3,
+                },
+                "retry": {
+                    "max_attempts": 3,
+                    "base_delay": 0.5,
+                    "max_delay": 20.0,
+                    "deadline": 120.0,
+                },
+                "failover": {
+                    "providers": [],
+                    "hedge_percentile": 0.95,
+                    "initial_hedge_delay": 5.0,
+                    "failure_threshold": 3,
+                    "reset_timeout": 30.0,
+                },
+                "rate_limits": {
+                    "default": {"max_in_flight": 8},
+                    "openai": {
+                        "requests_per_minute": 500,
+                        "tokens_per_minute": 30000,
+                    },
+                    "anthropic": {
+                        "requests_per_minute": 50,
+                        "tokens_per_minute": 40000,
+                    },
+                },
                 "phase_models": {
                     "phase1": "openai/gpt-4",  # Architecture & Requirements - Best reasoning
                     "phase2": "anthropic/claude-3-sonnet",  # Development Planning - Good planning
@@ -263,3 +301,8 @@ def set_config_file(config_file: str) -> None:
     """Set custom configuration file"""
     global _config_instance
     _config_instance = PathConfig(config_file)
+
+    # Shared LLM clients were built from the previous configuration
+    from .llm_client import invalidate_llm_clients
+
+    invalidate_llm_clients()
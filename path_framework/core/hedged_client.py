@@ -0,0 +1,357 @@
+"""
+Hedged LLM Client for PATH Framework
+Latency hedging and provider failover across several LLM clients
+
+A HedgedLLMClient sends each request to its primary client and, if no
+answer has arrived by the primary's observed latency percentile, fires a
+backup request at the next provider. The first valid response wins and
+the remaining calls are cancelled. Providers that keep failing are taken
+out of rotation by a circuit breaker until a cool-down has passed.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from ..exceptions import LLMError
+from .llm_client import BaseLLMClient, LLMClientFactory, LLMRequest, LLMResponse
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Sliding window of recent call latencies"""
+
+    def __init__(self, window: int = 256):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Latency below which ``fraction`` of samples fall"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": len(self._samples),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    the provider is skipped. Once ``reset_timeout`` seconds have passed a
+    single trial call is let through (half-open); its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may be sent to this provider now"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_cancelled(self) -> None:
+        """A cancelled call says nothing about health; free the trial slot"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+@dataclass
+class HedgeConfig:
+    """Hedging and failover settings"""
+
+    hedge_percentile: float = 0.95
+    initial_hedge_delay: float = 5.0
+    min_hedge_delay: float = 0.05
+    min_samples: int = 10
+    failure_threshold: int = 3
+    reset_timeout: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "HedgeConfig":
+        """Build settings from the ``failover`` config section"""
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in (config or {}).items() if k in known})
+
+
+class HedgedLLMClient(BaseLLMClient):
+    """
+    LLM client racing an ordered list of provider clients
+
+    Each request starts on the first provider whose circuit is closed.
+    If it has not answered within that provider's hedge delay (its
+    ``hedge_percentile`` latency, or ``initial_hedge_delay`` until enough
+    samples exist), the next provider is tried in parallel. A provider
+    error fails over to the next provider immediately.
+    """
+
+    provider_name = "hedged"
+
+    def __init__(self, clients: list[BaseLLMClient], config: HedgeConfig | None = None):
+        if not clients:
+            raise LLMError("HedgedLLMClient needs at least one client")
+
+        primary = clients[0]
+        super().__init__(
+            primary.api_key,
+            "+".join(f"{c.provider_name}:{c.model}" for c in clients),
+            primary.timeout,
+            primary.pool_config,
+        )
+        self.clients = clients
+        self.config = config or HedgeConfig()
+
+        # Inner clients retry on their own; a second layer would multiply waits
+        self.retry_policy = RetryPolicy(max_attempts=1)
+
+        self._latency = [LatencyHistogram() for _ in clients]
+        self._breakers = [
+            CircuitBreaker(self.config.failure_threshold, self.config.reset_timeout)
+            for _ in clients
+        ]
+        self._hedge_stats = {
+            "requests": 0,
+            "hedges_fired": 0,
+            "hedge_wins": 0,
+            "failovers": 0,
+            "all_failed": 0,
+        }
+
+    def hedge_delay(self, index: int) -> float:
+        """Time to wait on client ``index`` before firing a backup request"""
+        histogram = self._latency[index]
+        if len(histogram) < self.config.min_samples:
+            return self.config.initial_hedge_delay
+        return max(
+            self.config.min_hedge_delay,
+            histogram.percentile(self.config.hedge_percentile),
+        )
+
+    def _request_for(self, index: int, request: LLMRequest) -> LLMRequest:
+        # Explicit model names are provider specific; backups use their own
+        if index == 0 or request.model is None:
+            return request
+        return replace(request, model=None)
+
+    async def _timed_call(
+        self,
+        index: int,
+        call: Callable[[BaseLLMClient, LLMRequest], Awaitable[Any]],
+        request: LLMRequest,
+    ) -> Any:
+        started = time.monotonic()
+        try:
+            result = await call(self.clients[index], self._request_for(index, request))
+        except asyncio.CancelledError:
+            self._breakers[index].record_cancelled()
+            # A call that lost the race took at least this long. Keeping it
+            # as a lower-bound sample stops the slow tail from vanishing out
+            # of the histogram; shorter cancellations say nothing about it.
+            elapsed = time.monotonic() - started
+            if elapsed >= self.hedge_delay(index):
+                self._latency[index].record(elapsed)
+            raise
+        if isinstance(result, LLMResponse) and not result.content:
+            raise LLMError(f"Empty response from {self.clients[index].provider_name}")
+        self._latency[index].record(time.monotonic() - started)
+        return result
+
+    async def _hedge(
+        self,
+        request: LLMRequest,
+        call: Callable[[BaseLLMClient, LLMRequest], Awaitable[Any]],
+    ) -> Any:
+        """Race ``call`` across the clients and return the first valid result"""
+        self._hedge_stats["requests"] += 1
+        candidates = deque(
+            i for i, breaker in enumerate(self._breakers) if breaker.allow()
+        )
+        if not candidates:
+            # Every circuit is open - better to try the primary than refuse
+            candidates.append(0)
+
+        running: dict[asyncio.Task, int] = {}
+        last_error: BaseException | None = None
+
+        def launch() -> int:
+            index = candidates.popleft()
+            task = asyncio.create_task(self._timed_call(index, call, request))
+            running[task] = index
+            return index
+
+        current = launch()
+        try:
+            while running:
+                timeout = self.hedge_delay(current) if candidates else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Slow answer - hedge with the next provider
+                    self._hedge_stats["hedges_fired"] += 1
+                    current = launch()
+                    logger.debug(
+                        f"Hedging LLM request to {self.clients[current].provider_name}"
+                    )
+                    continue
+
+                for task in done:
+                    index = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._breakers[index].record_success()
+                        if index != 0:
+                            self._hedge_stats["hedge_wins"] += 1
+                        return task.result()
+
+                    last_error = error
+                    self._breakers[index].record_failure()
+                    logger.warning(
+                        f"LLM provider {self.clients[index].provider_name} "
+                        f"failed: {error}"
+                    )
+
+                if candidates:
+                    self._hedge_stats["failovers"] += 1
+                    current = launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        self._hedge_stats["all_failed"] += 1
+        raise LLMError(f"All LLM providers failed: {last_error}") from last_error
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        return await self._hedge(request, lambda client, req: client.generate(req))
+
+    async def generate_structured(
+        self, request: LLMRequest, schema: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Race structured generation, each provider using its own JSON mode"""
+        return await self._hedge(
+            request, lambda client, req: client.generate_structured(req, schema)
+        )
+
+    def hedge_stats(self) -> dict[str, Any]:
+        """Get hedging counters plus per-provider latency and circuit state"""
+        return {
+            **self._hedge_stats,
+            "providers": [
+                {
+                    "provider": client.provider_name,
+                    "model": client.model,
+                    "hedge_delay": self.hedge_delay(i),
+                    "circuit": self._breakers[i].state,
+                    "latency": self._latency[i].summary(),
+                }
+                for i, client in enumerate(self.clients)
+            ],
+        }
+
+    def pool_stats(self) -> dict[str, Any]:
+        return {
+            f"{client.provider_name}:{client.model}": client.pool_stats()
+            for client in self.clients
+        }
+
+    async def aclose(self) -> None:
+        for client in self.clients:
+            await client.aclose()
+
+
+_PROVIDER_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+}
+
+
+def wrap_with_failover(client: BaseLLMClient, config: dict[str, Any]) -> BaseLLMClient:
+    """
+    Combine a client with the backups listed under ``failover.providers``
+
+    Each backup entry needs a ``provider`` and ``model``; its API key comes
+    from the entry or the provider's usual environment variable, and
+    timeout, pooling, rate limit and retry settings are inherited from the
+    primary configuration.
+
+    Args:
+        client: Primary client built from ``config``
+        config: Resolved LLM configuration
+
+    Returns:
+        The client itself, or a HedgedLLMClient if backups are configured
+    """
+    failover = config.get("failover") or {}
+    backups = failover.get("providers") or []
+    if not backups:
+        return client
+
+    inherited = {
+        key: config[key]
+        for key in ("timeout", "connection_pool", "rate_limits", "retry")
+        if key in config
+    }
+    clients = [client]
+    for entry in backups:
+        backup_config = {**inherited, **entry}
+        backup_config.setdefault(
+            "api_key", os.getenv(_PROVIDER_KEY_ENV.get(entry["provider"], ""))
+        )
+        clients.append(LLMClientFactory.create_from_resolved_config(backup_config))
+
+    return HedgedLLMClient(clients, HedgeConfig.from_config(failover))
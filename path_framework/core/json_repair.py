@@ -0,0 +1,233 @@
+"""
+JSON Repair for PATH Framework
+Local recovery of malformed structured LLM output
+
+Models regularly wrap JSON in markdown fences, add a sentence before or
+after it, leave trailing commas, use Python literals or single quotes, or
+stop mid-document when they run out of tokens. These are cheap to fix
+locally, which saves a second (paid, slow) request.
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+_decoder = json.JSONDecoder()
+
+_stats = {"parsed": 0, "repaired": 0, "failed": 0}
+_stats_lock = threading.Lock()
+
+
+class JSONRepairError(ValueError):
+    """Raised when text cannot be turned into valid JSON"""
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def repair_stats() -> dict[str, int]:
+    """Get process-wide counts of clean, repaired and unrecoverable parses"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _strip_fences(text: str) -> str:
+    match = _FENCE.search(text)
+    return match.group(1).strip() if match else text.strip()
+
+
+def _largest_embedded_value(text: str) -> Any:
+    """Decode the longest JSON object/array found anywhere in ``text``"""
+    best: tuple[int, Any] | None = None
+    index = 0
+    while index < len(text):
+        starts = [p for p in (text.find("{", index), text.find("[", index)) if p >= 0]
+        if not starts:
+            break
+        start = min(starts)
+        try:
+            value, end = _decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            index = start + 1
+            continue
+        if best is None or end - start > best[0]:
+            best = (end - start, value)
+        # Anything nested in this value is shorter; skip past it
+        index = end
+
+    if best is None:
+        raise JSONRepairError("No JSON value found")
+    return best[1]
+
+
+def _normalize(text: str) -> tuple[str, list[str], bool]:
+    """
+    Rewrite common syntax slips outside of strings
+
+    Converts single-quoted strings and Python literals, drops trailing
+    commas before closing brackets, and tracks open brackets.
+
+    Returns:
+        Normalized text, the stack of unclosed openers and whether the text
+        ended inside a string
+    """
+    out: list[str] = []
+    stack: list[str] = []
+    quote: str | None = None
+    escape = False
+    i = 0
+
+    while i < len(text):
+        char = text[i]
+
+        if quote is not None:
+            if escape:
+                escape = False
+                out.append(char)
+            elif char == "\\":
+                escape = True
+                out.append(char)
+            elif char == quote:
+                quote = None
+                out.append('"')
+            elif char == '"' and quote == "'":
+                out.append('\\"')
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in "{[":
+            stack.append(char)
+            out.append(char)
+        elif char in "}]":
+            # Drop a trailing comma before the closer
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(char)
+        elif char.isalpha():
+            end = i
+            while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                end += 1
+            word = text[i:end]
+            out.append(_LITERALS.get(word, word))
+            i = end
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    return "".join(out), stack, quote is not None
+
+
+def _close_truncated(text: str, stack: list[str], in_string: bool) -> str:
+    """Terminate an unfinished string and close every open bracket"""
+    if in_string:
+        text += '"'
+    text = text.rstrip()
+    while text and text[-1] in ",:":
+        text = text[:-1].rstrip()
+    return text + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def _drop_last_member(text: str) -> str | None:
+    """Cut the text back to before its last comma"""
+    cut = text.rfind(",")
+    return text[:cut] if cut > 0 else None
+
+
+def repair_json(text: str, max_backtracks: int = 8) -> Any:
+    """
+    Parse LLM output as JSON, repairing it locally if needed
+
+    Repairs are tried cheapest first: markdown fence stripping and
+    skipping surrounding prose, syntax normalization (trailing commas,
+    single quotes, Python literals), closing a truncated document (dropping
+    its unfinished last members if needed) and finally extraction of the
+    largest well-formed JSON value anywhere in the output.
+
+    Args:
+        text: Raw model output
+        max_backtracks: How many trailing members may be dropped when
+            closing a truncated document
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        JSONRepairError: If no valid JSON could be recovered
+    """
+    try:
+        value = json.loads(text)
+        _count("parsed")
+        return value
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    if not isinstance(text, str) or not text.strip():
+        _count("failed")
+        raise JSONRepairError("Empty response")
+
+    stripped = _strip_fences(text)
+    start = min(
+        (p for p in (stripped.find("{"), stripped.find("[")) if p >= 0), default=0
+    )
+    candidate = stripped[start:]
+
+    # Complete value followed by prose
+    try:
+        value, _ = _decoder.raw_decode(candidate)
+        _count("repaired")
+        return value
+    except json.JSONDecodeError:
+        pass
+
+    normalized, stack, in_string = _normalize(candidate)
+    try:
+        value, _ = _decoder.raw_decode(normalized)
+        _count("repaired")
+        return value
+    except json.JSONDecodeError:
+        pass
+
+    if stack or in_string:
+        # Truncated output - close it, dropping unfinished members as needed
+        attempt: str | None = normalized
+        for _ in range(max_backtracks + 1):
+            _, stack, in_string = _normalize(attempt)
+            try:
+                value = json.loads(_close_truncated(attempt, stack, in_string))
+                _count("repaired")
+                return value
+            except json.JSONDecodeError:
+                attempt = _drop_last_member(attempt)
+                if attempt is None:
+                    break
+
+    # Last resort: the largest well-formed value anywhere in the output
+    try:
+        value = _largest_embedded_value(stripped)
+        _count("repaired")
+        return value
+    except JSONRepairError:
+        pass
+
+    _count("failed")
+    raise JSONRepairError("Could not repair JSON output")
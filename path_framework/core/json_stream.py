@@ -0,0 +1,231 @@
+"""
+Incremental JSON Parsing for PATH Framework
+Emit array elements from streamed LLM JSON output as soon as each one closes
+
+LLM structured output usually wraps the interesting data in one array,
+e.g. ``{"requirements": [{...}, {...}]}``. Waiting for the whole document
+delays all downstream work until generation finishes, and one truncated
+brace at the end invalidates everything. The parser here scans text as it
+arrives and decodes each element of the target array the moment its
+closing bracket (or separating comma) is seen.
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from .json_repair import JSONRepairError, repair_json
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser for the elements of one JSON array
+
+    Args:
+        array_key: Object key holding the array (at any nesting level); with
+            None the first array in the document is used
+    """
+
+    def __init__(self, array_key: str | None = None):
+        self.array_key = array_key
+        self.found = False
+        self.complete = False
+        self.emitted = 0
+        self.skipped = 0
+        self.repaired = 0
+
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._expect_array = array_key is None
+        self._array_depth: int | None = None
+        self._element_start: int | None = None
+
+    def feed(self, text: str) -> list[Any]:
+        """
+        Consume more text and return the elements completed by it
+
+        Args:
+            text: Next piece of the JSON document
+
+        Returns:
+            Decoded array elements that closed within this piece
+        """
+        if self.complete or not text:
+            return []
+
+        self._text += text
+        text = self._text
+        elements: list[Any] = []
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._array_depth is None:
+                        self._last_string = text[self._string_start + 1 : i]
+                continue
+
+            if self._array_depth is None:
+                self._seek(char, i)
+                continue
+
+            # Inside the target array
+            if self._depth == self._array_depth and self._element_start is None:
+                if char in _WHITESPACE or char == ",":
+                    continue
+                if char == "]":
+                    self.complete = True
+                    break
+                self._element_start = i
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == self._array_depth:
+                    # Array closed right after a scalar element
+                    self._emit(text[self._element_start : i], elements)
+                    self.complete = True
+                    break
+                self._depth -= 1
+                if self._depth == self._array_depth:
+                    self._emit(text[self._element_start : i + 1], elements)
+            elif char == "," and self._depth == self._array_depth:
+                self._emit(text[self._element_start : i], elements)
+
+        self._pos = len(text)
+        self._compact()
+        return elements
+
+    def _seek(self, char: str, index: int) -> None:
+        """Scan for the target array outside of it"""
+        if char == '"':
+            self._in_string = True
+            self._string_start = index
+            return
+        if char in _WHITESPACE:
+            return
+        if char == ":":
+            self._expect_array = self._last_string == self.array_key
+            self._last_string = None
+            return
+
+        if char == "[" and self._expect_array:
+            self._depth += 1
+            self._array_depth = self._depth
+            self.found = True
+            return
+
+        if char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+
+        # Any other token means the key's value is not the array
+        self._expect_array = self.array_key is None
+        self._last_string = None
+
+    def _emit(self, raw: str, elements: list[Any]) -> None:
+        """Decode one complete element; malformed ones are skipped"""
+        self._element_start = None
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            elements.append(json.loads(raw))
+            self.emitted += 1
+            return
+        except json.JSONDecodeError:
+            pass
+
+        try:
+            elements.append(repair_json(raw))
+            self.emitted += 1
+            self.repaired += 1
+        except JSONRepairError as e:
+            self.skipped += 1
+            logger.warning(f"Skipping malformed streamed JSON element: {e}")
+
+    def _compact(self) -> None:
+        """Drop text that can no longer be part of a pending element"""
+        if self._element_start is not None:
+            keep_from = self._element_start
+        elif self._in_string and self._array_depth is None:
+            keep_from = self._string_start
+        else:
+            keep_from = self._pos
+
+        if keep_from > 0:
+            self._text = self._text[keep_from:]
+            self._pos -= keep_from
+            self._string_start -= keep_from
+            if self._element_start is not None:
+                self._element_start -= keep_from
+
+    @property
+    def pending(self) -> str:
+        """Text of the element still being received, if any"""
+        if self._element_start is None:
+            return ""
+        return self._text[self._element_start :]
+
+
+async def stream_json_array(
+    chunks: AsyncIterator[Any], array_key: str | None = None
+) -> AsyncIterator[Any]:
+    """
+    Yield elements of a JSON array from a stream of LLM chunks
+
+    Args:
+        chunks: Async iterator of objects with a ``delta`` text attribute
+            (e.g. ``BaseLLMClient.generate_stream()``)
+        array_key: Object key holding the array, or None for the first array
+
+    Yields:
+        Each decoded array element as soon as it is complete
+    """
+    parser = JSONArrayStreamParser(array_key)
+    # Raw text is kept only until the array is located, for the repair below
+    unparsed: list[str] = []
+    async for chunk in chunks:
+        if not parser.found:
+            unparsed.append(chunk.delta)
+        for element in parser.feed(chunk.delta):
+            yield element
+        if parser.found:
+            unparsed.clear()
+
+    if not parser.found:
+        # Not recognisable as it streamed (e.g. single-quoted keys) - repair it
+        try:
+            document = repair_json("".join(unparsed))
+        except JSONRepairError:
+            return
+        if array_key is not None:
+            document = document.get(array_key) if isinstance(document, dict) else None
+        for element in document if isinstance(document, list) else []:
+            yield element
+        return
+
+    if parser.pending:
+        logger.warning(
+            f"Streamed JSON ended inside an element; dropped "
+            f"{len(parser.pending)} trailing characters"
+        )
@@ -0,0 +1,103 @@
+"""
+Keyword Matching for PATH Framework
+Classify text against keyword vocabularies in a single pass
+
+The heuristic (non-LLM) analysis paths classify sentences by the keywords
+they contain. Testing each keyword separately rescans the text once per
+keyword; a KeywordMatcher compiles a whole vocabulary into one trie-shaped
+regular expression, so a text is scanned once and every keyword it
+contains is reported together.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+
+_END = ""
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a character trie, preferring the longest keyword"""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    pattern = f"(?:{'|'.join(branches)})"
+    # A keyword ending here is a prefix of the longer ones below it
+    return pattern + "?" if _END in node else pattern
+
+
+class KeywordMatcher:
+    """
+    Substring matcher for a vocabulary of keyword categories
+
+    Keywords match anywhere in the text, case-insensitively, with the same
+    semantics as ``keyword in text.lower()``, including keywords that
+    overlap or contain one another.
+
+    Args:
+        vocabulary: Keywords per category; a keyword may belong to several
+    """
+
+    def __init__(self, vocabulary: Mapping[str, Iterable[str]]):
+        self.vocabulary = {
+            category: frozenset(keyword.lower() for keyword in keywords)
+            for category, keywords in vocabulary.items()
+        }
+        self._categories: dict[str, set[str]] = {}
+        for category, keywords in self.vocabulary.items():
+            for keyword in keywords:
+                if keyword:
+                    self._categories.setdefault(keyword, set()).add(category)
+
+        trie: dict = {}
+        for keyword in self._categories:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # Zero-width lookahead, so a match is tried at every position and
+        # keywords starting inside another match are found as well
+        self._pattern = re.compile(f"(?=({_trie_pattern(trie)}))", re.IGNORECASE)
+
+        # Only the longest keyword starting at a position is reported; the
+        # shorter ones starting there are its prefixes
+        self._prefixes = {
+            keyword: frozenset(
+                keyword[:length]
+                for length in range(1, len(keyword) + 1)
+                if keyword[:length] in self._categories
+            )
+            for keyword in self._categories
+        }
+
+    def keywords(self, text: str) -> set[str]:
+        """All vocabulary keywords contained in ``text``"""
+        if not self._categories:
+            return set()
+        longest = {match.group(1).lower() for match in self._pattern.finditer(text)}
+        found: set[str] = set()
+        for keyword in longest:
+            found |= self._prefixes[keyword]
+        return found
+
+    def matches(self, text: str) -> dict[str, set[str]]:
+        """
+        Keywords contained in ``text``, grouped by category
+
+        Returns:
+            Category to the keywords found for it; categories without a
+            hit are omitted
+        """
+        hits: dict[str, set[str]] = {}
+        for keyword in self.keywords(text):
+            for category in self._categories[keyword]:
+                hits.setdefault(category, set()).add(keyword)
+        return hits
+
+    def categories(self, text: str) -> set[str]:
+        """Categories with at least one keyword in ``text``"""
+        return set(self.matches(text))
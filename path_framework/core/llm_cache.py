@@ -0,0 +1,400 @@
+"""
+LLM Response Cache for PATH Framework
+Content-addressed on-disk cache for LLM responses
+
+Responses are keyed on a hash of everything that determines the answer
+(provider, model, prompts, temperature, max_tokens, response format) and
+stored in a local SQLite database with TTL expiry and LRU eviction bounded
+by entry count and total size. Async callers reach the database through
+one worker thread, so lookups never block the event loop on disk I/O.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .llm_client import (
+    BaseLLMClient,
+    LLMRequest,
+    LLMResponse,
+    LLMStreamChunk,
+    _notify_stream_listeners,
+    request_fingerprint,
+)
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.expanduser("~/.path_framework/cache/llm_responses.db")
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LLM response store
+
+    Entries expire ``ttl_seconds`` after they were written. When the store
+    grows past ``max_entries`` or ``max_bytes`` the least recently read
+    entries are evicted first.
+
+    ``get``/``put`` block on the database; coroutines use ``aget``/``aput``,
+    which run them on the cache's own worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="llm-cache"
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_accessed "
+            "ON responses (last_accessed)"
+        )
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for ``key`` or None on miss/expiry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            payload, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_accessed = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+
+        data = json.loads(payload)
+        data["metadata"] = {**(data.get("metadata") or {}), "cache": "hit"}
+        return LLMResponse(**data)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict old entries if over budget"""
+        payload = json.dumps(
+            {
+                "content": response.content,
+                "tokens_used": response.tokens_used,
+                "model_used": response.model_used,
+                "provider": response.provider,
+                "finish_reason": response.finish_reason,
+                "metadata": response.metadata or {},
+            },
+            default=str,
+        )
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, payload, size, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._evict()
+
+    async def aget(self, key: str) -> LLMResponse | None:
+        """``get`` on the cache's worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.get, key)
+
+    async def aput(self, key: str, response: LLMResponse) -> None:
+        """``put`` (including eviction) on the cache's worker thread"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.put, key, response)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within both limits"""
+        count, total_size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_accessed ASC"
+        )
+        doomed = []
+        for key, size in rows:
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total_size -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and current store size"""
+        with self._lock:
+            entries, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total_size,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+
+class CachedLLMClient(BaseLLMClient):
+    """
+    Caching wrapper around any BaseLLMClient
+
+    Only low-temperature requests are cached - higher temperatures are meant
+    to produce varied output. With ``refresh`` set, cached entries are
+    ignored but fresh responses are still written back.
+    """
+
+    def __init__(
+        self,
+        client: BaseLLMClient,
+        cache: LLMResponseCache,
+        refresh: bool = False,
+        max_temperature: float = 0.3,
+    ):
+        super().__init__(
+            client.api_key, client.model, client.timeout, client.pool_config
+        )
+        self.client = client
+        self.cache = cache
+        self.refresh = refresh
+        self.max_temperature = max_temperature
+        self.provider_name = client.provider_name
+
+        # The wrapped client retries on its own; a second layer would
+        # multiply provider calls on every transient failure
+        self.retry_policy = RetryPolicy(max_attempts=1)
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        """Serve from cache when possible, otherwise call the wrapped client"""
+        cacheable = request.temperature <= self.max_temperature
+        key = request_fingerprint(self.provider_name, self.model, request)
+
+        if cacheable and not self.refresh:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit: {key[:12]}")
+                return cached
+
+        response = await self.client.generate(request)
+
+        if cacheable and response.content:
+            await self.cache.aput(key, response)
+
+        return response
+
+    async def generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Replay a cached response as one chunk, or stream and store it"""
+        cacheable = request.temperature <= self.max_temperature
+        key = request_fingerprint(self.provider_name, self.model, request)
+
+        cached = await self.cache.aget(key) if cacheable and not self.refresh else None
+        if cached is not None:
+            for chunk in (
+                LLMStreamChunk(delta=cached.content),
+                LLMStreamChunk(
+                    delta="",
+                    done=True,
+                    tokens_used=cached.tokens_used,
+                    model_used=cached.model_used,
+                    provider=cached.provider,
+                    finish_reason=cached.finish_reason,
+                ),
+            ):
+                _notify_stream_listeners(request, chunk)
+                yield chunk
+            return
+
+        parts = []
+        async for chunk in self.client.generate_stream(request):
+            parts.append(chunk.delta)
+            if chunk.done and cacheable and any(parts):
+                await self.cache.aput(
+                    key,
+                    LLMResponse(
+                        content="".join(parts),
+                        tokens_used=chunk.tokens_used,
+                        model_used=chunk.model_used,
+                        provider=chunk.provider,
+                        finish_reason=chunk.finish_reason or "stop",
+                    ),
+                )
+            yield chunk
+
+    def _structured_request(
+        self, request: LLMRequest, schema: dict[str, Any]
+    ) -> LLMRequest:
+        return self.client._structured_request(request, schema)
+
+    def _parse_structured(self, content: str) -> dict[str, Any]:
+        return self.client._parse_structured(content)
+
+    def pool_stats(self) -> dict[str, Any]:
+        return self.client.pool_stats()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+# Process-wide cache switches, set by the CLI (--no-cache / --refresh)
+_cache_overrides: dict[str, bool] = {}
+_caches: dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def configure_llm_cache(
+    enabled: bool | None = None, refresh: bool | None = None
+) -> None:
+    """
+    Override cache settings for this process
+
+    Args:
+        enabled: Force the cache on or off regardless of configuration
+        refresh: Ignore cached entries but keep writing new responses
+    """
+    if enabled is not None:
+        _cache_overrides["enabled"] = enabled
+    if refresh is not None:
+        _cache_overrides["refresh"] = refresh
+
+    # Shared clients were wrapped (or not) under the previous settings
+    from .llm_client import invalidate_llm_clients
+
+    invalidate_llm_clients()
+
+
+def _resolve_cache_settings(config: dict[str, Any] | None) -> dict[str, Any]:
+    """Merge defaults, the ``cache`` config section, env and overrides"""
+    settings = {
+        "enabled": True,
+        "refresh": False,
+        "path": os.getenv("PATH_LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+        "ttl_seconds": 7 * 24 * 3600,
+        "max_entries": 10_000,
+        "max_bytes": 256 * 1024 * 1024,
+        "max_temperature": 0.3,
+    }
+    settings.update(config or {})
+
+    if os.getenv("PATH_LLM_CACHE", "").lower() in ("0", "false", "off"):
+        settings["enabled"] = False
+
+    settings.update(_cache_overrides)
+    return settings
+
+
+def get_response_cache(config: dict[str, Any] | None = None) -> LLMResponseCache | None:
+    """Get the shared response cache, or None when caching is disabled"""
+    settings = _resolve_cache_settings(config)
+    if not settings["enabled"]:
+        return None
+
+    path = str(Path(settings["path"]).expanduser())
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = LLMResponseCache(
+                    path=path,
+                    ttl_seconds=settings["ttl_seconds"],
+                    max_entries=settings["max_entries"],
+                    max_bytes=settings["max_bytes"],
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM response cache unavailable at {path}: {e}")
+                return None
+            _caches[path] = cache
+
+    return cache
+
+
+def cache_refresh_requested(config: dict[str, Any] | None = None) -> bool:
+    """Whether cached entries should be bypassed for reads"""
+    return bool(_resolve_cache_settings(config)["refresh"])
+
+
+def wrap_with_cache(
+    client: BaseLLMClient, config: dict[str, Any] | None = None
+) -> BaseLLMClient:
+    """Wrap a client with the response cache if caching is enabled"""
+    cache = get_response_cache(config)
+    if cache is None:
+        return client
+
+    settings = _resolve_cache_settings(config)
+    return CachedLLMClient(
+        client,
+        cache,
+        refresh=settings["refresh"],
+        max_temperature=settings["max_temperature"],
+    )
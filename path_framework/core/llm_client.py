@@ -3,15 +3,25 @@ LLM Client Interface for PATH Framework
 Supports multiple LLM providers: OpenAI, Anthropic, Ollama, etc.
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable
+from contextlib import nullcontext
+from dataclasses import dataclass, fields, replace
 from enum import Enum
 from typing import Any
 
 from ..exceptions import PathFrameworkError
+from .json_repair import JSONRepairError, repair_json
+from .json_stream import stream_json_array
+from .rate_limiter import RateLimitTicket, estimate_tokens, get_rate_limiter
+from .retry import RETRYABLE_STATUSES, RetryDecision, RetryPolicy, classify_error
 
 logger = logging.getLogger(__name__)
 
@@ -48,39 +58,664 @@ class LLMResponse:
     metadata: dict[str, Any] = None
 
 
+@dataclass
+class LLMStreamChunk:
+    """Incremental piece of a streamed LLM response"""
+
+    delta: str
+    done: bool = False
+    tokens_used: int = 0
+    model_used: str = ""
+    provider: str = ""
+    finish_reason: str | None = None
+
+
+async def collect_stream(stream: AsyncIterator[LLMStreamChunk]) -> LLMResponse:
+    """Drain a chunk stream into a complete LLMResponse"""
+    parts = []
+    final = LLMStreamChunk(delta="")
+    async for chunk in stream:
+        parts.append(chunk.delta)
+        if chunk.done:
+            final = chunk
+
+    return LLMResponse(
+        content="".join(parts),
+        tokens_used=final.tokens_used,
+        model_used=final.model_used,
+        provider=final.provider,
+        finish_reason=final.finish_reason or "stop",
+        metadata={"streamed": True},
+    )
+
+
+StreamListener = Callable[["LLMRequest", LLMStreamChunk], None]
+_stream_listeners: list[StreamListener] = []
+
+
+def add_stream_listener(listener: StreamListener) -> Callable[[], None]:
+    """
+    Observe every streamed chunk in this process (e.g. for progress display)
+
+    Args:
+        listener: Called with the request and each chunk as it arrives
+
+    Returns:
+        Function that removes the listener again
+    """
+    _stream_listeners.append(listener)
+    return lambda: _stream_listeners.remove(listener)
+
+
+def _notify_stream_listeners(request: "LLMRequest", chunk: LLMStreamChunk) -> None:
+    for listener in list(_stream_listeners):
+        try:
+            listener(request, chunk)
+        except Exception as e:
+            logger.warning(f"Stream listener failed: {e}")
+
+
+class _SharedStream:
+    """One provider stream replayed to every caller of an identical request"""
+
+    def __init__(self):
+        self.chunks: list[LLMStreamChunk] = []
+        self.error: BaseException | None = None
+        self.done = False
+        self.consumers = 0
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Event()
+
+    def publish(self) -> None:
+        """Wake consumers waiting for new chunks or the end of the stream"""
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def replay(self) -> AsyncIterator[LLMStreamChunk]:
+        """Every chunk from the start, then new ones as they arrive"""
+        position = 0
+        while True:
+            while position < len(self.chunks):
+                yield self.chunks[position]
+                position += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+def request_fingerprint(provider: str, model: str, request: LLMRequest) -> str:
+    """Content hash identifying a request's complete effective input"""
+    material = json.dumps(
+        [
+            provider,
+            request.model or model,
+            request.system_prompt,
+            request.prompt,
+            request.temperature,
+            request.max_tokens,
+            request.response_format,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """Connection pool settings for the long-lived transport of a client"""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "ConnectionPoolConfig":
+        """Build pool settings from the ``connection_pool`` config section"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (config or {}).items() if k in known})
+
+
+def _http2_available() -> bool:
+    """HTTP/2 in httpx requires the optional ``h2`` package"""
+    return importlib.util.find_spec("h2") is not None
+
+
 class BaseLLMClient(ABC):
-    """Abstract base class for LLM clients"""
+    """Abstract base class for LLM clients
 
-    def __init__(self, api_key: str, model: str, timeout: int = 30):
+    Each client owns a lazily created provider transport (SDK client or HTTP
+    session) that is reused across calls so keep-alive connections stay warm.
+    Use ``async with client:`` or ``await client.aclose()`` to release it.
+    """
+
+    provider_name = ""
+
+    # Error classification used by the retry policy
+    retryable_statuses: frozenset[int] = RETRYABLE_STATUSES
+    non_retryable_codes: frozenset[str] = frozenset()
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        timeout: int = 30,
+        pool_config: ConnectionPoolConfig | None = None,
+    ):
         self.api_key = api_key
         self.model = model
         self.timeout = timeout
+        self.pool_config = pool_config or ConnectionPoolConfig()
+
+        # Transport state - created on first use inside a running event loop
+        self._transport: Any = None
+        self._transport_loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._pool_stats = {
+            "transports_created": 0,
+            "transport_reuses": 0,
+            "requests": 0,
+        }
+
+        # Single-flight state - identical concurrent requests share one call
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._inflight_waiters: dict[str, int] = {}
+        self._inflight_streams: dict[str, _SharedStream] = {}
+        self._coalesce_stats = {"calls": 0, "coalesced": 0}
+        self._structured_stats = {
+            "parsed": 0,
+            "repaired": 0,
+            "re_requested": 0,
+            "failed": 0,
+        }
+
+        # ``llm.rate_limits`` config section; limiters are shared per model
+        self.rate_limits: dict[str, Any] | None = None
+        self.retry_policy = RetryPolicy()
+
+    def _create_transport(self) -> Any:
+        """
+        Create the provider transport
+
+        Provider SDK clients override this; the default is a pooled httpx
+        client for providers called over plain HTTP. The transport must
+        expose an async ``close()`` or ``aclose()``.
+        """
+        return self._create_http_client()
+
+    def _create_http_client(self, **kwargs) -> Any:
+        """Create a pooled httpx client for SDKs that accept ``http_client``"""
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.pool_config.max_connections,
+                max_keepalive_connections=self.pool_config.max_keepalive_connections,
+                keepalive_expiry=self.pool_config.keepalive_expiry,
+            ),
+            http2=self.pool_config.http2 and _http2_available(),
+            **kwargs,
+        )
+
+    def _get_transport(self) -> Any:
+        """Return the shared transport, creating it on first use"""
+        loop = asyncio.get_running_loop()
+
+        # Pooled connections are bound to the loop that opened them
+        if self._transport is not None and self._transport_loop is not loop:
+            logger.debug(
+                f"Discarding {type(self).__name__} transport from a previous event loop"
+            )
+            self._discard_transport()
+
+        if self._transport is None:
+            self._transport = self._create_transport()
+            self._transport_loop = loop
+            self._pool_stats["transports_created"] += 1
+        else:
+            self._pool_stats["transport_reuses"] += 1
+
+        self._pool_stats["requests"] += 1
+        return self._transport
+
+    async def _close_transport(self, transport: Any) -> None:
+        close = getattr(transport, "aclose", None) or transport.close
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(self).__name__} transport: {e}")
+
+    def _discard_transport(self) -> None:
+        """Drop the transport of another event loop, closing it there if possible"""
+        transport, loop = self._transport, self._transport_loop
+        self._transport = None
+        self._transport_loop = None
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_transport(transport), loop)
+            return
+
+        # The owning loop is gone; release what can still be released here
+        task = asyncio.get_running_loop().create_task(self._close_transport(transport))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Get transport reuse statistics and pool limits"""
+        return {
+            **self._pool_stats,
+            "transport_open": self._transport is not None,
+            "max_connections": self.pool_config.max_connections,
+            "max_keepalive_connections": self.pool_config.max_keepalive_connections,
+            "keepalive_expiry": self.pool_config.keepalive_expiry,
+            "http2": self.pool_config.http2 and _http2_available(),
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled transport and its connections"""
+        if self._transport is None:
+            return
+        if self._transport_loop is not asyncio.get_running_loop():
+            self._discard_transport()
+            return
+
+        transport, self._transport = self._transport, None
+        self._transport_loop = None
+        await self._close_transport(transport)
+
+    async def __aenter__(self) -> "BaseLLMClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
     @abstractmethod
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        """Issue a single provider call"""
+
     async def generate(self, request: LLMRequest) -> LLMResponse:
-        """Generate response from LLM"""
+        """
+        Generate response from LLM
+
+        Identical requests already in flight on this client are coalesced:
+        later callers await the first call's result instead of issuing
+        their own provider call.
+        """
+        loop = asyncio.get_running_loop()
+        key = request_fingerprint(self.provider_name, self.model, request)
+        self._coalesce_stats["calls"] += 1
+
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop and not future.done():
+            self._coalesce_stats["coalesced"] += 1
+            logger.debug(f"Coalesced identical in-flight request: {key[:12]}")
+        else:
+            future = loop.create_task(self._generate_with_retry(request))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish_inflight(key, done))
+
+        # Shield so one caller's cancellation doesn't fail the others; the
+        # provider call is only cancelled once nobody is waiting for it
+        self._inflight_waiters[key] = self._inflight_waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._inflight_waiters[key] == 1 and not future.done():
+                future.cancel()
+            raise
+        finally:
+            self._inflight_waiters[key] -= 1
+            if not self._inflight_waiters[key]:
+                del self._inflight_waiters[key]
+
+    def _classify_error(self, error: BaseException) -> RetryDecision:
+        """Decide whether a failed call to this provider is transient"""
+        return classify_error(error, self.retryable_statuses, self.non_retryable_codes)
+
+    async def _generate_with_retry(self, request: LLMRequest) -> LLMResponse:
+        """Run a provider call under the retry policy, recording attempts"""
+        response, record = await self.retry_policy.call(
+            lambda: self._rate_limited_generate(request), self._classify_error
+        )
+        response.metadata = {**(response.metadata or {}), "retry": record}
+        return response
+
+    def _rate_limit(self, request: LLMRequest) -> Any:
+        """Async context holding this request's rate limit admission"""
+        limiter = get_rate_limiter(
+            self.provider_name, request.model or self.model, self.rate_limits
+        )
+        if limiter is None:
+            return nullcontext(RateLimitTicket(estimated_tokens=0))
+
+        tokens = (
+            estimate_tokens(request.system_prompt)
+            + estimate_tokens(request.prompt)
+            + request.max_tokens
+        )
+        return limiter.limit(tokens)
+
+    async def _rate_limited_generate(self, request: LLMRequest) -> LLMResponse:
+        """Run one provider call within the provider/model's rate limits"""
+        async with self._rate_limit(request) as ticket:
+            response = await self._generate(request)
+            ticket.actual_tokens = response.tokens_used
+        return response
+
+    async def generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response as it is generated
+
+        Yields text deltas as they arrive; the final chunk has ``done`` set
+        and carries token usage and the finish reason. Registered stream
+        listeners see every chunk.
+
+        Like ``generate()``, identical streams already in flight on this
+        client are coalesced (a later caller first receives the chunks
+        already produced), and transient errors are retried under the
+        retry policy as long as no chunk has been received yet.
+        """
+        loop = asyncio.get_running_loop()
+        key = request_fingerprint(self.provider_name, self.model, request)
+        self._coalesce_stats["calls"] += 1
+
+        shared = self._inflight_streams.get(key)
+        if shared is not None and shared.task.get_loop() is loop:
+            self._coalesce_stats["coalesced"] += 1
+            logger.debug(f"Coalesced identical in-flight stream: {key[:12]}")
+        else:
+            shared = _SharedStream()
+            shared.task = loop.create_task(self._produce_stream(request, shared))
+            self._inflight_streams[key] = shared
+            shared.task.add_done_callback(
+                lambda done: self._finish_inflight_stream(key, shared)
+            )
+
+        # The provider stream is only cancelled once nobody is reading it
+        shared.consumers += 1
+        try:
+            async for chunk in shared.replay():
+                yield chunk
+        finally:
+            shared.consumers -= 1
+            if not shared.consumers and not shared.task.done():
+                shared.task.cancel()
+
+    async def _produce_stream(self, request: LLMRequest, shared: _SharedStream) -> None:
+        """Read the provider stream into ``shared`` for its consumers"""
+        try:
+            async for chunk in self._retried_stream(request):
+                _notify_stream_listeners(request, chunk)
+                shared.chunks.append(chunk)
+                shared.publish()
+        except BaseException as e:
+            shared.error = e
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            shared.done = True
+            shared.publish()
+
+    async def _retried_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Open a stream under the retry policy, then relay it"""
+        (stream, first), _ = await self.retry_policy.call(
+            lambda: self._open_stream(request), self._classify_error
+        )
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    async def _open_stream(
+        self, request: LLMRequest
+    ) -> tuple[AsyncIterator[LLMStreamChunk], LLMStreamChunk | None]:
+        """One attempt: start a rate-limited stream and wait for its first chunk"""
+        stream = self._rate_limited_stream(request)
+        try:
+            return stream, await anext(stream)
+        except StopAsyncIteration:
+            return stream, None
+        except BaseException:
+            await stream.aclose()
+            raise
+
+    async def _rate_limited_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Run one provider stream within the provider/model's rate limits"""
+        async with self._rate_limit(request) as ticket:
+            async for chunk in self._generate_stream(request):
+                if chunk.done:
+                    ticket.actual_tokens = chunk.tokens_used
+                yield chunk
+
+    async def _generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Provider streaming call; defaults to one chunk from _generate()"""
+        response = await self._generate(request)
+        yield LLMStreamChunk(delta=response.content)
+        yield LLMStreamChunk(
+            delta="",
+            done=True,
+            tokens_used=response.tokens_used,
+            model_used=response.model_used,
+            provider=response.provider,
+            finish_reason=response.finish_reason,
+        )
+
+    def _finish_inflight(self, key: str, future: asyncio.Future) -> None:
+        """Forget a completed in-flight call"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+        # Mark the error retrieved in case every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def _finish_inflight_stream(self, key: str, shared: _SharedStream) -> None:
+        """Forget a finished in-flight stream"""
+        if self._inflight_streams.get(key) is shared:
+            del self._inflight_streams[key]
+
+    def coalesce_stats(self) -> dict[str, Any]:
+        """Get request coalescing statistics"""
+        calls = self._coalesce_stats["calls"]
+        return {
+            **self._coalesce_stats,
+            "in_flight": len(self._inflight) + len(self._inflight_streams),
+            "coalesce_rate": self._coalesce_stats["coalesced"] / calls
+            if calls
+            else 0.0,
+        }
+
+    def _structured_request(
+        self, request: LLMRequest, schema: dict[str, Any]
+    ) -> LLMRequest:
+        """Build the JSON-mode request used by generate_structured()"""
+        # Add JSON format instruction to prompt
+        json_prompt = f"""{request.prompt}
+
+Please respond with valid JSON that matches this schema:
+{json.dumps(schema, indent=2)}
+
+Ensure your response is valid JSON only, no additional text."""
+
+        return LLMRequest(
+            prompt=json_prompt,
+            system_prompt=request.system_prompt,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            model=request.model,
+            response_format="json",
+        )
+
+    def _parse_structured(self, content: str) -> dict[str, Any]:
+        """Parse the provider's JSON answer"""
+        return json.loads(content)
 
-    @abstractmethod
     async def generate_structured(
         self, request: LLMRequest, schema: dict[str, Any]
     ) -> dict[str, Any]:
-        """Generate structured response (JSON) from LLM"""
+        """
+        Generate structured response (JSON) from LLM
+
+        Malformed output is repaired locally first; the request is only sent
+        again when repair fails, and only once.
+        """
+        structured = self._structured_request(request, schema)
+        response = await self.generate(structured)
+
+        try:
+            result = self._parse_structured(response.content)
+            self._structured_stats["parsed"] += 1
+            return result
+        except json.JSONDecodeError:
+            pass
+
+        try:
+            result = repair_json(response.content)
+            self._structured_stats["repaired"] += 1
+            return result
+        except JSONRepairError:
+            logger.warning("Unrepairable JSON response, re-requesting once")
+
+        self._structured_stats["re_requested"] += 1
+        response = await self.generate(
+            replace(
+                structured,
+                prompt=f"{structured.prompt}\n\nYour previous answer was not "
+                "valid JSON. Respond with the JSON document only.",
+            )
+        )
+
+        try:
+            return repair_json(response.content)
+        except JSONRepairError as e:
+            self._structured_stats["failed"] += 1
+            logger.error(f"Failed to parse JSON response: {response.content}")
+            raise PathFrameworkError(f"Invalid JSON response from LLM: {e!s}")
+
+    def structured_stats(self) -> dict[str, int]:
+        """Get counts of parsed, repaired, re-requested and failed JSON calls"""
+        return dict(self._structured_stats)
+
+    async def generate_structured_stream(
+        self, request: LLMRequest, schema: dict[str, Any], array_key: str | None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the elements of one array in a structured (JSON) response
+
+        Each element is yielded as soon as it is complete, so callers can
+        start processing while the model is still generating; a truncated
+        response only loses its last partial element.
+
+        Args:
+            request: The request to send
+            schema: JSON schema the response should follow
+            array_key: Key of the array to stream, or None for the first array
+
+        Yields:
+            Decoded array elements in order
+        """
+        chunks = self.generate_stream(self._structured_request(request, schema))
+        async for element in stream_json_array(chunks, array_key):
+            yield element
+
+
+async def _stream_chat_completion(
+    client: Any,
+    request: LLMRequest,
+    model: str,
+    provider: str,
+    **options: Any,
+) -> AsyncIterator[LLMStreamChunk]:
+    """Stream an OpenAI-compatible chat completion as LLMStreamChunks"""
+    messages = []
+    if request.system_prompt:
+        messages.append({"role": "system", "content": request.system_prompt})
+    messages.append({"role": "user", "content": request.prompt})
+
+    stream = await client.chat.completions.create(
+        model=request.model or model,
+        messages=messages,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens,
+        response_format=(
+            {"type": "json_object"}
+            if request.response_format == "json"
+            else {"type": "text"}
+        ),
+        stream=True,
+        **options,
+    )
+
+    model_used = request.model or model
+    finish_reason = None
+    tokens_used = 0
+    async for event in stream:
+        model_used = event.model or model_used
+        if event.usage:
+            tokens_used = event.usage.total_tokens
+        if not event.choices:
+            continue
+        choice = event.choices[0]
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+        if choice.delta and choice.delta.content:
+            yield LLMStreamChunk(delta=choice.delta.content)
+
+    yield LLMStreamChunk(
+        delta="",
+        done=True,
+        tokens_used=tokens_used,
+        model_used=model_used,
+        provider=provider,
+        finish_reason=finish_reason,
+    )
 
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI LLM Client"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4", timeout: int = 30):
-        super().__init__(api_key, model, timeout)
+    provider_name = "openai"
+    non_retryable_codes = frozenset({"insufficient_quota"})
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        timeout: int = 30,
+        pool_config: ConnectionPoolConfig | None = None,
+    ):
+        super().__init__(api_key, model, timeout, pool_config)
         self.base_url = "https://api.openai.com/v1"
 
-    async def generate(self, request: LLMRequest) -> LLMResponse:
+    def _create_transport(self) -> Any:
+        # Import here to avoid hard dependency
+        import openai
+
+        return openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http_client=self._create_http_client(),
+        )
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
         """Generate response using OpenAI API"""
         try:
-            # Import here to avoid hard dependency
-            import openai
-
-            client = openai.AsyncOpenAI(api_key=self.api_key, timeout=self.timeout)
+            client = self._get_transport()
 
             messages = []
             if request.system_prompt:
@@ -116,67 +751,75 @@ class OpenAIClient(BaseLLMClient):
             logger.error(f"OpenAI API error: {e}")
             raise PathFrameworkError(f"OpenAI generation failed: {e!s}")
 
-    async def generate_structured(
-        self, request: LLMRequest, schema: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Generate structured JSON response"""
-        # Add JSON format instruction to prompt
-        json_prompt = f"""{request.prompt}
-
-Please respond with valid JSON that matches this schema:
-{json.dumps(schema, indent=2)}
-
-Ensure your response is valid JSON only, no additional text."""
-
-        structured_request = LLMRequest(
-            prompt=json_prompt,
-            system_prompt=request.system_prompt,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens,
-            model=request.model,
-            response_format="json",
-        )
-
-        response = await self.generate(structured_request)
-
+    async def _generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a response using OpenAI API"""
         try:
-            return json.loads(response.content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {response.content}")
-            raise PathFrameworkError(f"Invalid JSON response from LLM: {e!s}")
+            async for chunk in _stream_chat_completion(
+                self._get_transport(),
+                request,
+                self.model,
+                "openai",
+                stream_options={"include_usage": True},
+            ):
+                yield chunk
+        except ImportError:
+            raise PathFrameworkError(
+                "OpenAI library not installed. Run: pip install openai"
+            )
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise PathFrameworkError(f"OpenAI streaming failed: {e!s}")
 
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic Claude LLM Client"""
 
+    provider_name = "anthropic"
+    # 529: Anthropic API overloaded
+    retryable_statuses = RETRYABLE_STATUSES | {529}
+
     def __init__(
-        self, api_key: str, model: str = "claude-3-sonnet-20240229", timeout: int = 30
+        self,
+        api_key: str,
+        model: str = "claude-3-sonnet-20240229",
+        timeout: int = 30,
+        pool_config: ConnectionPoolConfig | None = None,
     ):
-        super().__init__(api_key, model, timeout)
+        super().__init__(api_key, model, timeout, pool_config)
 
-    async def generate(self, request: LLMRequest) -> LLMResponse:
-        """Generate response using Anthropic API"""
-        try:
-            # Import here to avoid hard dependency
-            import anthropic
+    def _create_transport(self) -> Any:
+        # Import here to avoid hard dependency
+        import anthropic
 
-            client = anthropic.AsyncAnthropic(
-                api_key=self.api_key, timeout=self.timeout
-            )
+        return anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=self.timeout,
+            http_client=self._create_http_client(),
+        )
 
-            # Combine system and user prompts for Anthropic
-            full_prompt = ""
-            if request.system_prompt:
-                full_prompt = f"System: {request.system_prompt}\n\nHuman: {request.prompt}\n\nAssistant:"
-            else:
-                full_prompt = f"Human: {request.prompt}\n\nAssistant:"
+    def _message_params(self, request: LLMRequest) -> dict[str, Any]:
+        # Combine system and user prompts for Anthropic
+        full_prompt = ""
+        if request.system_prompt:
+            full_prompt = f"System: {request.system_prompt}\n\nHuman: {request.prompt}\n\nAssistant:"
+        else:
+            full_prompt = f"Human: {request.prompt}\n\nAssistant:"
 
-            response = await client.messages.create(
-                model=request.model or self.model,
-                max_tokens=request.max_tokens,
-                temperature=request.temperature,
-                messages=[{"role": "user", "content": full_prompt}],
-            )
+        return {
+            "model": request.model or self.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": [{"role": "user", "content": full_prompt}],
+        }
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        """Generate response using Anthropic API"""
+        try:
+            client = self._get_transport()
+
+            response = await client.messages.create(**self._message_params(request))
 
             return LLMResponse(
                 content=response.content[0].text,
@@ -200,10 +843,40 @@ class AnthropicClient(BaseLLMClient):
             logger.error(f"Anthropic API error: {e}")
             raise PathFrameworkError(f"Anthropic generation failed: {e!s}")
 
-    async def generate_structured(
+    async def _generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a response using Anthropic API"""
+        try:
+            client = self._get_transport()
+
+            async with client.messages.stream(
+                **self._message_params(request)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield LLMStreamChunk(delta=text)
+                message = await stream.get_final_message()
+
+            yield LLMStreamChunk(
+                delta="",
+                done=True,
+                tokens_used=message.usage.input_tokens + message.usage.output_tokens,
+                model_used=message.model,
+                provider="anthropic",
+                finish_reason=message.stop_reason,
+            )
+
+        except ImportError:
+            raise PathFrameworkError(
+                "Anthropic library not installed. Run: pip install anthropic"
+            )
+        except Exception as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise PathFrameworkError(f"Anthropic streaming failed: {e!s}")
+
+    def _structured_request(
         self, request: LLMRequest, schema: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Generate structured JSON response"""
+    ) -> LLMRequest:
         json_prompt = f"""{request.prompt}
 
 Please respond with valid JSON that matches this schema:
@@ -211,7 +884,7 @@ Please respond with valid JSON that matches this schema:
 
 Return only valid JSON, no additional text or formatting."""
 
-        structured_request = LLMRequest(
+        return LLMRequest(
             prompt=json_prompt,
             system_prompt=request.system_prompt,
             temperature=request.temperature,
@@ -219,55 +892,61 @@ Return only valid JSON, no additional text or formatting."""
             model=request.model,
         )
 
-        response = await self.generate(structured_request)
-
-        try:
-            return json.loads(response.content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {response.content}")
-            raise PathFrameworkError(f"Invalid JSON response from LLM: {e!s}")
-
 
 class OllamaClient(BaseLLMClient):
     """Ollama Local LLM Client"""
 
+    provider_name = "ollama"
+
     def __init__(
         self,
         api_key: str = "",
         model: str = "llama2",
         base_url: str = "http://localhost:11434",
         timeout: int = 60,
+        pool_config: ConnectionPoolConfig | None = None,
     ):
-        super().__init__(api_key, model, timeout)
+        super().__init__(api_key, model, timeout, pool_config)
         self.base_url = base_url
 
-    async def generate(self, request: LLMRequest) -> LLMResponse:
+    def _create_transport(self) -> Any:
+        import aiohttp
+
+        # aiohttp speaks HTTP/1.1 only; keep-alive reuse comes from the connector
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_config.max_connections,
+                keepalive_timeout=self.pool_config.keepalive_expiry,
+            ),
+        )
+
+    def _payload(self, request: LLMRequest, stream: bool) -> dict[str, Any]:
+        prompt = request.prompt
+        if request.system_prompt:
+            prompt = f"System: {request.system_prompt}\n\nUser: {request.prompt}"
+
+        return {
+            "model": request.model or self.model,
+            "prompt": prompt,
+            "options": {
+                "temperature": request.temperature,
+                "num_predict": request.max_tokens,
+            },
+            "stream": stream,
+        }
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
         """Generate response using Ollama API"""
         try:
-            import aiohttp
+            session = self._get_transport()
 
-            prompt = request.prompt
-            if request.system_prompt:
-                prompt = f"System: {request.system_prompt}\n\nUser: {request.prompt}"
-
-            payload = {
-                "model": request.model or self.model,
-                "prompt": prompt,
-                "options": {
-                    "temperature": request.temperature,
-                    "num_predict": request.max_tokens,
-                },
-                "stream": False,
-            }
-
-            async with (
-                aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as session,
-                session.post(f"{self.base_url}/api/generate", json=payload) as response,
-            ):
-                if response.status != 200:
-                    raise PathFrameworkError(f"Ollama API error: {response.status}")
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=self._payload(request, stream=False),
+            ) as response:
+                # Raises ClientResponseError carrying the status and headers
+                response.raise_for_status()
 
                 result = await response.json()
 
@@ -289,10 +968,47 @@ class OllamaClient(BaseLLMClient):
             logger.error(f"Ollama API error: {e}")
             raise PathFrameworkError(f"Ollama generation failed: {e!s}")
 
-    async def generate_structured(
+    async def _generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a response using Ollama API (newline-delimited JSON)"""
+        try:
+            session = self._get_transport()
+
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=self._payload(request, stream=True),
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if event.get("response"):
+                        yield LLMStreamChunk(delta=event["response"])
+                    if event.get("done"):
+                        yield LLMStreamChunk(
+                            delta="",
+                            done=True,
+                            tokens_used=event.get("eval_count", 0)
+                            + event.get("prompt_eval_count", 0),
+                            model_used=event.get("model", self.model),
+                            provider="ollama",
+                            finish_reason=event.get("done_reason", "stop"),
+                        )
+
+        except ImportError:
+            raise PathFrameworkError(
+                "aiohttp library not installed. Run: pip install aiohttp"
+            )
+        except Exception as e:
+            logger.error(f"Ollama API error: {e}")
+            raise PathFrameworkError(f"Ollama streaming failed: {e!s}")
+
+    def _structured_request(
         self, request: LLMRequest, schema: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Generate structured JSON response"""
+    ) -> LLMRequest:
         json_prompt = f"""{request.prompt}
 
 Respond with valid JSON matching this schema:
@@ -300,7 +1016,7 @@ Respond with valid JSON matching this schema:
 
 JSON only, no other text:"""
 
-        structured_request = LLMRequest(
+        return LLMRequest(
             prompt=json_prompt,
             system_prompt=request.system_prompt,
             temperature=request.temperature,
@@ -308,38 +1024,38 @@ JSON only, no other text:"""
             model=request.model,
         )
 
-        response = await self.generate(structured_request)
-
-        try:
-            # Clean up response - Ollama sometimes adds extra text
-            content = response.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-
-            return json.loads(content.strip())
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {response.content}")
-            raise PathFrameworkError(f"Invalid JSON response from LLM: {e!s}")
-
 
 class OpenRouterClient(BaseLLMClient):
     """OpenRouter LLM Client - Access to multiple models through OpenRouter API"""
 
-    def __init__(self, api_key: str, model: str = "openai/gpt-4", timeout: int = 30):
-        super().__init__(api_key, model, timeout)
+    provider_name = "openrouter"
+    non_retryable_codes = frozenset({"insufficient_quota"})
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "openai/gpt-4",
+        timeout: int = 30,
+        pool_config: ConnectionPoolConfig | None = None,
+    ):
+        super().__init__(api_key, model, timeout, pool_config)
         self.base_url = "https://openrouter.ai/api/v1"
 
-    async def generate(self, request: LLMRequest) -> LLMResponse:
+    def _create_transport(self) -> Any:
+        # OpenRouter uses OpenAI-compatible API
+        import openai
+
+        return openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http_client=self._create_http_client(),
+        )
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
         """Generate response using OpenRouter API"""
         try:
-            # OpenRouter uses OpenAI-compatible API
-            import openai
-
-            client = openai.AsyncOpenAI(
-                api_key=self.api_key, base_url=self.base_url, timeout=self.timeout
-            )
+            client = self._get_transport()
 
             messages = []
             if request.system_prompt:
@@ -378,34 +1094,23 @@ class OpenRouterClient(BaseLLMClient):
             logger.error(f"OpenRouter API error: {e}")
             raise PathFrameworkError(f"OpenRouter generation failed: {e!s}")
 
-    async def generate_structured(
-        self, request: LLMRequest, schema: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Generate structured JSON response"""
-        # Add JSON format instruction to prompt
-        json_prompt = f"""{request.prompt}
-
-Please respond with valid JSON that matches this schema:
-{json.dumps(schema, indent=2)}
-
-Ensure your response is valid JSON only, no additional text."""
-
-        structured_request = LLMRequest(
-            prompt=json_prompt,
-            system_prompt=request.system_prompt,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens,
-            model=request.model,
-            response_format="json",
-        )
-
-        response = await self.generate(structured_request)
-
+    async def _generate_stream(
+        self, request: LLMRequest
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a response using OpenRouter API"""
         try:
-            return json.loads(response.content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {response.content}")
-            raise PathFrameworkError(f"Invalid JSON response from LLM: {e!s}")
+            # OpenRouter reports usage on the final event without stream_options
+            async for chunk in _stream_chat_completion(
+                self._get_transport(), request, self.model, "openrouter"
+            ):
+                yield chunk
+        except ImportError:
+            raise PathFrameworkError(
+                "OpenAI library not installed. Run: pip install openai"
+            )
+        except Exception as e:
+            logger.error(f"OpenRouter API error: {e}")
+            raise PathFrameworkError(f"OpenRouter streaming failed: {e!s}")
 
 
 class LLMClientFactory:
@@ -452,7 +1157,181 @@ class LLMClientFactory:
             api_key=api_key,
             model=model,
             timeout=config.get("timeout", 30),
+            pool_config=ConnectionPoolConfig.from_config(config.get("connection_pool")),
+        )
+
+    @staticmethod
+    def create_from_resolved_config(config: dict[str, Any]) -> BaseLLMClient:
+        """Create LLM client from an already merged configuration"""
+        provider = LLMProvider(config["provider"])
+        options: dict[str, Any] = {
+            "timeout": config.get("timeout", 30),
+            "pool_config": ConnectionPoolConfig.from_config(
+                config.get("connection_pool")
+            ),
+        }
+        if provider == LLMProvider.OLLAMA and config.get("base_url"):
+            options["base_url"] = config["base_url"]
+
+        client = LLMClientFactory.create_client(
+            provider=provider,
+            api_key=config.get("api_key"),
+            model=config["model"],
+            **options,
         )
+        client.rate_limits = config.get("rate_limits")
+
+        retry_config = dict(config.get("retry") or {})
+        if config.get("retry_attempts") is not None:
+            retry_config.setdefault("max_attempts", config["retry_attempts"])
+        client.retry_policy = RetryPolicy.from_config(retry_config)
+        return client
+
+
+_DEFAULT_BASE_URLS = {
+    "openai": "https://api.openai.com/v1",
+    "anthropic": "https://api.anthropic.com",
+    "ollama": "http://localhost:11434",
+    "openrouter": "https://openrouter.ai/api/v1",
+}
+
+
+def _key_fingerprint(api_key: str | None) -> str:
+    """Short, non-reversible fingerprint of an API key for registry keys"""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of warm LLM clients
+
+    Clients are keyed by (provider, model, base_url, key fingerprint, timeout)
+    so every caller with the same effective configuration shares one client
+    and its pooled transport. The arguments of each ``get_llm_client()`` call
+    are memoized as well, so repeat lookups skip config resolution entirely.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple, BaseLLMClient] = {}
+        self._resolved: dict[tuple, BaseLLMClient] = {}
+        self._lock = threading.Lock()
+        self._closing: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def call_key(
+        provider: str | None,
+        api_key: str | None,
+        model: str | None,
+        phase: int | None,
+        options: dict[str, Any],
+    ) -> tuple:
+        """Key for the raw arguments of a get_llm_client() call"""
+        return (
+            provider,
+            _key_fingerprint(api_key),
+            model,
+            phase,
+            json.dumps(options, sort_keys=True, default=str),
+        )
+
+    @staticmethod
+    def client_key(config: dict[str, Any]) -> tuple:
+        """Key for a fully resolved client configuration"""
+        provider = config["provider"]
+        return (
+            provider,
+            config["model"],
+            config.get("base_url") or _DEFAULT_BASE_URLS.get(provider, ""),
+            _key_fingerprint(config.get("api_key")),
+            config.get("timeout", 30),
+        )
+
+    def lookup(self, call_key: tuple) -> BaseLLMClient | None:
+        """Return the client previously resolved for these call arguments"""
+        client = self._resolved.get(call_key)
+        if client is not None:
+            self.hits += 1
+        return client
+
+    def get_or_create(self, call_key: tuple, config: dict[str, Any]) -> BaseLLMClient:
+        """Return the shared client for a resolved configuration"""
+        client_key = self.client_key(config)
+
+        with self._lock:
+            self.misses += 1
+            client = self._clients.get(client_key)
+            if client is None:
+                from .hedged_client import wrap_with_failover
+                from .llm_cache import wrap_with_cache
+
+                client = wrap_with_cache(
+                    wrap_with_failover(
+                        LLMClientFactory.create_from_resolved_config(config),
+                        config,
+                    ),
+                    config.get("cache"),
+                )
+                self._clients[client_key] = client
+                logger.debug(
+                    f"Registered LLM client: {config['provider']}/{config['model']}"
+                )
+            self._resolved[call_key] = client
+
+        return client
+
+    def invalidate(self) -> None:
+        """Drop all cached clients, closing their transports where possible"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._resolved.clear()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to close on - open connections are released on collection
+            return
+
+        for client in clients:
+            task = loop.create_task(client.aclose())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def aclose_all(self) -> None:
+        """Close every registered client and clear the registry"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._resolved.clear()
+
+        for client in clients:
+            await client.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Get registry size and lookup counters"""
+        return {
+            "clients": len(self._clients),
+            "resolved_calls": len(self._resolved),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_client_registry = LLMClientRegistry()
+
+
+def get_client_registry() -> LLMClientRegistry:
+    """Get the process-wide LLM client registry"""
+    return _client_registry
+
+
+def invalidate_llm_clients() -> None:
+    """Forget all cached clients so the next lookup re-reads configuration"""
+    _client_registry.invalidate()
 
 
 # Convenience function for getting default client
@@ -472,6 +1351,12 @@ def get_llm_client(
     3. Configuration file
     4. Default values (lowest priority)
 
+    Clients are shared through the process-wide ``LLMClientRegistry``: the
+    first call with a given set of arguments resolves configuration, later
+    calls return the same warm client without re-reading it. Call
+    ``invalidate_llm_clients()`` (done by ``set_config_file()``) after
+    changing configuration or environment variables.
+
     Args:
         provider: LLM provider ("openai", "anthropic", "openrouter", "ollama")
         api_key: API key for the provider
@@ -491,6 +1376,10 @@ def get_llm_client(
         PATH_LLM_MODEL_PHASE4: Phase 4 specific model (Testing/Deployment)
         OPENROUTER_API_KEY: OpenRouter API key
     """
+    call_key = LLMClientRegistry.call_key(provider, api_key, model, phase, kwargs)
+    client = _client_registry.lookup(call_key)
+    if client is not None:
+        return client
 
     # Try to use enhanced config if available
     try:
@@ -504,12 +1393,7 @@ def get_llm_client(
         # Fallback to environment variables if config module not available
         config = _get_fallback_config(provider, api_key, model, phase, **kwargs)
 
-    return LLMClientFactory.create_client(
-        provider=LLMProvider(config["provider"]),
-        api_key=config["api_key"],
-        model=config["model"],
-        timeout=config.get("timeout", 30),
-    )
+    return _client_registry.get_or_create(call_key, config)
 
 
 def _get_fallback_config(
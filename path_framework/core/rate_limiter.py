@@ -0,0 +1,299 @@
+"""
+Rate Limiting for PATH Framework
+Token-bucket throttling and concurrency limits per LLM provider/model
+
+Each (provider, model) pair gets one limiter enforcing requests-per-minute
+and tokens-per-minute budgets plus a cap on requests in flight. Callers are
+admitted strictly in arrival order, so a large request is never starved by
+a stream of small ones.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from typing import Any
+
+from ..exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Rough prompt token estimate (about four characters per token)"""
+    if not text:
+        return 0
+    return len(text) // 4 + 1
+
+
+@dataclass
+class RateLimitConfig:
+    """Throughput budgets for one provider/model; None means unlimited"""
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    max_in_flight: int | None = None
+    max_queue_wait: float | None = None
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "RateLimitConfig":
+        """Build limits from a ``rate_limits`` config entry"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (config or {}).items() if k in known})
+
+    @property
+    def unlimited(self) -> bool:
+        return (
+            self.requests_per_minute is None
+            and self.tokens_per_minute is None
+            and self.max_in_flight is None
+        )
+
+
+class TokenBucket:
+    """Continuously refilling budget of ``rate_per_minute`` units"""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.refill_per_second
+        )
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available"""
+        self._refill()
+        # A single oversized request waits for a full bucket, not forever
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take units from the bucket; may go negative when reconciling"""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return unused units to the bucket"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+@dataclass
+class RateLimitTicket:
+    """Admission record used to reconcile estimated and actual usage"""
+
+    estimated_tokens: int
+    actual_tokens: int | None = None
+
+
+class RateLimiter:
+    """
+    Request/token budget and concurrency governor for one provider/model
+
+    Admission happens in FIFO order: the caller at the head of the queue
+    waits until both buckets can cover its request, then takes a slot in
+    the in-flight semaphore. Token usage is reconciled against the
+    provider's reported usage once the call completes.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._requests = (
+            TokenBucket(config.requests_per_minute)
+            if config.requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        )
+
+        # asyncio primitives are bound to the loop that first uses them
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._admission: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+            "queued": 0,
+            "max_queued": 0,
+            "in_flight": 0,
+            "rejected": 0,
+        }
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._admission = asyncio.Lock()
+            self._slots = (
+                asyncio.Semaphore(self.config.max_in_flight)
+                if self.config.max_in_flight
+                else None
+            )
+
+    def _wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self._requests is not None:
+            wait = max(wait, self._requests.wait_time(1))
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.wait_time(tokens))
+        return wait
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for budget and an in-flight slot for a request of ``tokens``"""
+        self._bind_loop()
+        started = time.monotonic()
+        deadline = (
+            started + self.config.max_queue_wait
+            if self.config.max_queue_wait is not None
+            else None
+        )
+
+        self._stats["queued"] += 1
+        self._stats["max_queued"] = max(
+            self._stats["max_queued"], self._stats["queued"]
+        )
+        try:
+            async with self._admission:
+                while (wait := self._wait_time(tokens)) > 0:
+                    if deadline is not None and time.monotonic() + wait > deadline:
+                        self._stats["rejected"] += 1
+                        raise RateLimitError(
+                            f"Rate limit budget not available within "
+                            f"{self.config.max_queue_wait}s"
+                        )
+                    await asyncio.sleep(wait)
+
+                if self._requests is not None:
+                    self._requests.consume(1)
+                if self._tokens is not None:
+                    self._tokens.consume(tokens)
+
+            if self._slots is not None:
+                try:
+                    await self._slots.acquire()
+                except BaseException:
+                    # Cancelled or timed out while waiting for a slot: the
+                    # request never ran, so its budget goes back
+                    self._refund(tokens)
+                    raise
+        finally:
+            self._stats["queued"] -= 1
+
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            self._stats["throttled"] += 1
+            self._stats["wait_seconds"] += waited
+        self._stats["requests"] += 1
+        self._stats["in_flight"] += 1
+
+    def _refund(self, tokens: int) -> None:
+        if self._requests is not None:
+            self._requests.refund(1)
+        if self._tokens is not None:
+            self._tokens.refund(tokens)
+
+    def release(self, ticket: RateLimitTicket, failed: bool = False) -> None:
+        """Free the slot and correct the token budget with actual usage"""
+        self._stats["in_flight"] -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+        if self._tokens is None:
+            return
+        if failed:
+            self._tokens.refund(ticket.estimated_tokens)
+        elif ticket.actual_tokens:
+            delta = ticket.actual_tokens - ticket.estimated_tokens
+            if delta > 0:
+                self._tokens.consume(delta)
+            else:
+                self._tokens.refund(-delta)
+
+    @asynccontextmanager
+    async def limit(self, tokens: int):
+        """Hold a rate-limited slot for the duration of one call"""
+        ticket = RateLimitTicket(estimated_tokens=tokens)
+        await self.acquire(tokens)
+        try:
+            yield ticket
+        except BaseException:
+            self.release(ticket, failed=True)
+            raise
+        else:
+            self.release(ticket)
+
+    def stats(self) -> dict[str, Any]:
+        """Get throttling statistics and remaining budgets"""
+        return {
+            **self._stats,
+            "requests_available": (
+                self._requests.tokens if self._requests is not None else None
+            ),
+            "tokens_available": (
+                self._tokens.tokens if self._tokens is not None else None
+            ),
+        }
+
+
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def resolve_rate_limits(
+    provider: str, model: str, rate_limits: dict[str, Any] | None
+) -> RateLimitConfig:
+    """
+    Resolve the limits for a provider/model from the ``rate_limits`` section
+
+    Entries are merged from least to most specific: ``default``, then the
+    provider name, then ``provider:model``.
+
+    Args:
+        provider: Provider name, e.g. "openai"
+        model: Model name as sent to the provider
+        rate_limits: The ``llm.rate_limits`` configuration section
+
+    Returns:
+        Effective rate limit settings
+    """
+    rate_limits = rate_limits or {}
+    merged: dict[str, Any] = {}
+    for key in ("default", provider, f"{provider}:{model}"):
+        merged.update(rate_limits.get(key) or {})
+    return RateLimitConfig.from_config(merged)
+
+
+def get_rate_limiter(
+    provider: str, model: str, rate_limits: dict[str, Any] | None
+) -> RateLimiter | None:
+    """Get the shared limiter for a provider/model, or None if unlimited"""
+    config = resolve_rate_limits(provider, model, rate_limits)
+    if config.unlimited:
+        return None
+
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None or limiter.config != config:
+            limiter = RateLimiter(config)
+            _limiters[key] = limiter
+    return limiter
+
+
+def rate_limiter_stats() -> dict[str, dict[str, Any]]:
+    """Get statistics for every active limiter keyed by ``provider:model``"""
+    with _limiters_lock:
+        return {f"{p}:{m}": limiter.stats() for (p, m), limiter in _limiters.items()}
@@ -0,0 +1,228 @@
+"""
+Retry Policy for PATH Framework
+Backoff, jitter and Retry-After handling for transient LLM provider errors
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, fields
+from typing import Any, TypeVar
+
+from ..config import AgentConfig
+from ..exceptions import LLMError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying for every provider
+RETRYABLE_STATUSES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+# SDK/transport exception class names that indicate a transient failure
+TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "TimeoutException",
+        "ConnectError",
+        "ReadError",
+        "RemoteProtocolError",
+        "ClientConnectionError",
+        "ClientPayloadError",
+        "ServerDisconnectedError",
+        "ServerTimeoutError",
+    }
+)
+
+
+@dataclass
+class RetryDecision:
+    """Classification of a failed attempt"""
+
+    retryable: bool
+    reason: str
+    retry_after: float | None = None
+
+
+def _error_chain(error: BaseException) -> list[BaseException]:
+    """The error plus everything it was raised from, outermost first"""
+    chain = []
+    seen = set()
+    while error is not None and id(error) not in seen:
+        chain.append(error)
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return chain
+
+
+def _headers_of(error: BaseException) -> Any:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        headers = getattr(error, "headers", None)
+    return headers
+
+
+def parse_retry_after(headers: Any) -> float | None:
+    """
+    Read the server-requested delay from response headers
+
+    Supports ``retry-after-ms`` as well as ``Retry-After`` given either in
+    seconds or as an HTTP date.
+    """
+    if not headers:
+        return None
+
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return max(0.0, float(value) / 1000)
+
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def classify_error(
+    error: BaseException,
+    retryable_statuses: frozenset[int] = RETRYABLE_STATUSES,
+    non_retryable_codes: frozenset[str] = frozenset(),
+) -> RetryDecision:
+    """
+    Decide whether a failed provider call is worth retrying
+
+    The error and the exceptions it was raised from are inspected for an
+    HTTP status (``status_code`` on SDK errors, ``status`` on aiohttp
+    errors), a provider error code and transient transport failures.
+
+    Args:
+        error: Exception raised by the provider call
+        retryable_statuses: HTTP statuses treated as transient
+        non_retryable_codes: Provider error codes that are never transient,
+            even on a retryable status (e.g. exhausted quota on a 429)
+
+    Returns:
+        RetryDecision with the reason and any server-requested delay
+    """
+    for exc in _error_chain(error):
+        status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+        if isinstance(status, int):
+            code = getattr(exc, "code", None)
+            if code in non_retryable_codes:
+                return RetryDecision(False, f"{status} {code}")
+            if status in retryable_statuses:
+                return RetryDecision(
+                    True, f"HTTP {status}", parse_retry_after(_headers_of(exc))
+                )
+            return RetryDecision(False, f"HTTP {status}")
+
+        if isinstance(exc, TimeoutError | asyncio.TimeoutError | ConnectionError):
+            return RetryDecision(True, type(exc).__name__)
+        if any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__):
+            return RetryDecision(True, type(exc).__name__)
+
+    return RetryDecision(False, type(error).__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry schedule for LLM calls
+
+    Delays follow decorrelated jitter (each delay is drawn between
+    ``base_delay`` and three times the previous one, capped at
+    ``max_delay``). A server-provided Retry-After takes precedence when it
+    is longer. No retry is attempted if it would end past ``deadline``
+    seconds from the first attempt.
+    """
+
+    max_attempts: int = AgentConfig.retry_attempts
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    deadline: float | None = 120.0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> "RetryPolicy":
+        """Build a policy from the ``retry`` config section"""
+        known = {f.name for f in fields(cls)} - {"rng"}
+        return cls(**{k: v for k, v in (config or {}).items() if k in known})
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated-jitter delay following ``previous``"""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self.rng.uniform(self.base_delay, upper))
+
+    async def call(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        classify: Callable[[BaseException], RetryDecision] = classify_error,
+    ) -> tuple[T, dict[str, Any]]:
+        """
+        Run ``attempt`` until it succeeds or the policy gives up
+
+        Args:
+            attempt: Coroutine factory performing one call
+            classify: Error classifier deciding what is retryable
+
+        Returns:
+            The call result and a record of the attempts made
+
+        Raises:
+            The last error if it is not retryable, or LLMError once
+            attempts or the deadline are exhausted
+        """
+        started = time.monotonic()
+        delay = self.base_delay
+        record: dict[str, Any] = {"attempts": 0, "errors": [], "delays": []}
+
+        while True:
+            record["attempts"] += 1
+            try:
+                result = await attempt()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                decision = classify(e)
+                record["errors"].append(decision.reason)
+                if not decision.retryable:
+                    raise
+
+                if record["attempts"] >= self.max_attempts:
+                    raise LLMError(
+                        f"LLM call failed after {record['attempts']} attempts: {e}"
+                    ) from e
+
+                delay = self.next_delay(delay)
+                if decision.retry_after is not None:
+                    delay = max(delay, decision.retry_after)
+
+                elapsed = time.monotonic() - started
+                if self.deadline is not None and elapsed + delay > self.deadline:
+                    raise LLMError(
+                        f"LLM call retry deadline of {self.deadline}s exceeded "
+                        f"after {record['attempts']} attempts: {e}"
+                    ) from e
+
+                logger.warning(
+                    f"Retrying LLM call in {delay:.2f}s "
+                    f"(attempt {record['attempts']}, {decision.reason})"
+                )
+                record["delays"].append(round(delay, 3))
+                await asyncio.sleep(delay)
+            else:
+                record["elapsed"] = round(time.monotonic() - started, 3)
+                return result, record
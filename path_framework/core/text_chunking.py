@@ -0,0 +1,182 @@
+"""
+Text Chunking for PATH Framework
+Split large documents into prompt-sized pieces on natural boundaries
+
+Large inputs (RFPs, collected stakeholder interviews) do not fit one
+prompt. Chunks are built from whole sections where possible, then whole
+sentences, and only split inside a sentence when a single sentence is
+over budget, so each chunk stays readable on its own.
+
+Sentence segmentation for the pattern-based analysis is streamed line by
+line, so documents of any size are processed with flat memory.
+"""
+
+import io
+import itertools
+import re
+from collections.abc import Iterable, Iterator
+
+from .rate_limiter import estimate_tokens
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_HEADING = re.compile(r"^(#{1,6}\s|\d+(\.\d+)*\s+[A-Z])", re.MULTILINE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Terminal punctuation (and closing quotes/brackets) followed by a space;
+# a decimal point or a dot inside "v1.2" is not a sentence end
+_BOUNDARY = re.compile(r"[.!?]+[\"')\]]*(?=\s|$)")
+_LIST_MARKER = re.compile(r"^(?:[-*+\u2022]|\(?(?:\d+(?:\.\d+)*|[a-z])[.)])\s+")
+_ABBREVIATIONS = frozenset(
+    {
+        "al",
+        "approx",
+        "cf",
+        "dr",
+        "e.g",
+        "eg",
+        "etc",
+        "fig",
+        "i.e",
+        "ie",
+        "inc",
+        "ltd",
+        "mr",
+        "mrs",
+        "ms",
+        "no",
+        "prof",
+        "vs",
+    }
+)
+
+
+def split_sections(text: str) -> list[str]:
+    """Split text into paragraphs, starting a new one at each heading"""
+    sections = []
+    for block in _BLANK_LINES.split(text):
+        starts = [m.start() for m in _HEADING.finditer(block)]
+        bounds = [0, *[s for s in starts if s > 0], len(block)]
+        for start, end in itertools.pairwise(bounds):
+            section = block[start:end].strip()
+            if section:
+                sections.append(section)
+    return sections
+
+
+def _split_oversized(piece: str, max_tokens: int) -> list[str]:
+    """Break a piece above budget into sentences, then into word runs"""
+    if estimate_tokens(piece) <= max_tokens:
+        return [piece]
+
+    sentences = _SENTENCE_END.split(piece)
+    if len(sentences) > 1:
+        return [
+            part
+            for sentence in sentences
+            for part in _split_oversized(sentence, max_tokens)
+        ]
+
+    # Same four-characters-per-token estimate as estimate_tokens()
+    max_chars = (max_tokens - 1) * 4
+    parts, current, length = [], [], 0
+    for word in piece.split():
+        if current and length + 1 + len(word) > max_chars:
+            parts.append(" ".join(current))
+            current, length = [], 0
+        length += len(word) + (1 if current else 0)
+        current.append(word)
+    if current:
+        parts.append(" ".join(current))
+    return parts
+
+
+def chunk_text(text: str, max_tokens: int) -> list[str]:
+    """
+    Split text into chunks of at most ``max_tokens`` estimated tokens
+
+    Args:
+        text: Document to split
+        max_tokens: Token budget per chunk
+
+    Returns:
+        Chunks in document order; a text within budget is returned whole
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be positive")
+    if estimate_tokens(text) <= max_tokens:
+        return [text] if text.strip() else []
+
+    pieces = [
+        part
+        for section in split_sections(text)
+        for part in _split_oversized(section, max_tokens)
+    ]
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = estimate_tokens(piece)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _is_abbreviation(text: str, boundary: re.Match) -> bool:
+    """Whether a boundary match is the dot of an abbreviation like "e.g." """
+    if boundary.group() != ".":
+        return False
+    word_start = text.rfind(" ", 0, boundary.start()) + 1
+    word = text[word_start : boundary.start()].lstrip("(\"'")
+    return word.lower() in _ABBREVIATIONS
+
+
+def iter_sentences(source: str | Iterable[str]) -> Iterator[str]:
+    """
+    Lazily split a document into sentences
+
+    Sentences end at terminal punctuation followed by whitespace (not at
+    decimals or abbreviations), at blank lines, and before list items:
+    every bullet or numbered line starts a new sentence, with its marker
+    removed. Only the sentence in progress is held in memory.
+
+    Args:
+        source: Document text, or its lines (e.g. an open text file)
+
+    Yields:
+        Sentences in document order, stripped of surrounding whitespace
+    """
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    pending = ""
+    for line in lines:
+        line = line.strip()
+        marker = _LIST_MARKER.match(line)
+        if not line or marker:
+            if pending:
+                yield pending
+                pending = ""
+            if marker:
+                line = line[marker.end() :]
+            if not line:
+                continue
+
+        # Boundaries in the pending text were already rejected; only the
+        # newly appended line can end a sentence
+        scan_from = len(pending)
+        pending = f"{pending} {line}" if pending else line
+        start = 0
+        for boundary in _BOUNDARY.finditer(pending, scan_from):
+            if _is_abbreviation(pending, boundary):
+                continue
+            sentence = pending[start : boundary.end()].strip()
+            if sentence:
+                yield sentence
+            start = boundary.end()
+        pending = pending[start:].strip()
+
+    if pending:
+        yield pending
@@ -5,6 +5,7 @@ Core data models for the PATH Framework phases and components.
 """
 
 from .arch_models import *
+from .serialization import dumps, loads, to_primitive
 
 __all__ = [
     "BusinessRule",
@@ -19,4 +20,8 @@ __all__ = [
     "RequirementType",
     "StakeholderAnalysis",
     "SystemArchitecture",
+    # Serialization
+    "dumps",
+    "loads",
+    "to_primitive",
 ]
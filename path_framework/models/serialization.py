@@ -0,0 +1,170 @@
+"""
+Model Serialization
+PATH Framework - Data Models
+
+Encoding of the phase data models (requirements, domain models,
+architectures, component and integration designs) for handoff between
+phases. ``dataclasses.asdict`` deep-copies every nested object and leaves
+enums and datetimes in place, so a payload built with it is neither cheap
+nor JSON-ready. Here each model class gets a field plan the first time it
+is seen, values are dispatched to an encoder by their exact type, and
+enums, datetimes and UUIDs are encoded as plain values, so one pass
+produces a payload that can be shared as-is or written out as bytes.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from ..exceptions import PathFrameworkError
+
+Primitive = None | bool | int | float | str | list[Any] | dict[str, Any]
+
+FORMATS = ("json", "msgpack")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _encode_sequence(value: Any) -> list[Any]:
+    return [to_primitive(item) for item in value]
+
+
+def _encode_key(key: Any) -> str:
+    if type(key) is str:
+        return key
+    encoded = to_primitive(key)
+    return encoded if isinstance(encoded, str) else str(encoded)
+
+
+def _encode_mapping(value: dict[Any, Any]) -> dict[str, Any]:
+    return {_encode_key(key): to_primitive(item) for key, item in value.items()}
+
+
+def _encode_enum(value: Enum) -> Primitive:
+    return to_primitive(value.value)
+
+
+def _encode_temporal(value: date | time) -> str:
+    return value.isoformat()
+
+
+def _dataclass_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Encoder over a dataclass's fields, resolved once per class"""
+    names = tuple(f.name for f in fields(cls))
+
+    def encode(value: Any) -> dict[str, Any]:
+        return {name: to_primitive(getattr(value, name)) for name in names}
+
+    return encode
+
+
+_ENCODERS: dict[type, Callable[[Any], Primitive]] = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    list: _encode_sequence,
+    tuple: _encode_sequence,
+    set: _encode_sequence,
+    frozenset: _encode_sequence,
+    dict: _encode_mapping,
+    datetime: _encode_temporal,
+    date: _encode_temporal,
+    time: _encode_temporal,
+    UUID: str,
+}
+
+
+def _resolve_encoder(cls: type) -> Callable[[Any], Primitive]:
+    if is_dataclass(cls):
+        encoder = _dataclass_encoder(cls)
+    elif issubclass(cls, Enum):
+        encoder = _encode_enum
+    elif issubclass(cls, PurePath):
+        encoder = str
+    else:
+        encoder = next(
+            (
+                _ENCODERS[base]
+                for base in cls.__mro__[1:]
+                if base in _ENCODERS and base is not object
+            ),
+            str,
+        )
+    _ENCODERS[cls] = encoder
+    return encoder
+
+
+def to_primitive(value: Any) -> Primitive:
+    """
+    Encode a model (or any nested value) as JSON-compatible data
+
+    Dataclasses become dicts of their fields, enums their values,
+    dates and times ISO 8601 strings, sequences and sets lists, and
+    mapping keys strings. Values of any other type are encoded with
+    ``str()``.
+
+    Args:
+        value: Dataclass instance or plain value
+
+    Returns:
+        New data sharing nothing mutable with ``value``
+    """
+    cls = type(value)
+    encoder = _ENCODERS.get(cls) or _resolve_encoder(cls)
+    return encoder(value)
+
+
+def dumps(value: Any, format: str = "json") -> bytes:
+    """
+    Serialize a model to bytes
+
+    Args:
+        value: Dataclass instance, plain value, or data already produced
+            by ``to_primitive``
+        format: "json" (compact UTF-8) or "msgpack" (requires the msgpack
+            package)
+
+    Returns:
+        Encoded payload
+    """
+    data = to_primitive(value)
+    if format == "json":
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    if format == "msgpack":
+        return _msgpack().packb(data)
+    raise ValueError(f"Unknown serialization format: {format}")
+
+
+def loads(payload: bytes, format: str = "json") -> Primitive:
+    """
+    Deserialize bytes produced by ``dumps``
+
+    Returns:
+        The encoded data; models are returned as dicts
+    """
+    if format == "json":
+        return json.loads(payload)
+    if format == "msgpack":
+        return _msgpack().unpackb(payload)
+    raise ValueError(f"Unknown serialization format: {format}")
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise PathFrameworkError(
+            "msgpack library not installed. Run: pip install msgpack"
+        )
+    return msgpack
@@ -51,6 +51,7 @@ class AIComponentDesigner(BaseAgent):
             decision_authority="Autonomous",
             phase=1,
             config=config,
+            capabilities=["component_design"],
         )
 
     async def design_components(
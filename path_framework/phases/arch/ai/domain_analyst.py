@@ -11,13 +11,20 @@ Responsible for:
 Decision Authority: Autonomous for analysis, Human approval for critical business decisions
 """
 
-import json
+import itertools
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any
 
 from ....agents_base import BaseAgent
+from ....config import AgentConfig
+from ....core.concurrency import BoundedGather, map_bounded, merge_streams
+from ....core.json_stream import stream_json_array
+from ....core.keywords import KeywordMatcher
 from ....core.llm_client import LLMRequest, get_llm_client
+from ....core.rate_limiter import estimate_tokens
+from ....core.text_chunking import chunk_text, iter_sentences
 from ....exceptions import PathFrameworkError
 from ....models.arch_models import (
     BusinessRule,
@@ -28,6 +35,52 @@ from ....models.arch_models import (
     RequirementType,
     StakeholderAnalysis,
 )
+from .domain_modeling import DomainModelIndex
+from .requirement_dedup import NearDuplicateIndex
+from .requirement_index import RequirementIndex
+
+# Keyword vocabulary of the pattern-based requirement analysis; one scan of
+# a sentence finds whether it states a requirement along with its type,
+# priority and complexity hints
+REQUIREMENT_KEYWORDS = KeywordMatcher(
+    {
+        "indicator": [
+            "must",
+            "should",
+            "shall",
+            "will",
+            "requires",
+            "needs",
+            "user can",
+            "system will",
+            "application should",
+        ],
+        "non_functional": ["performance", "security", "scalability", "availability"],
+        "business": ["business", "process", "workflow", "compliance"],
+        "technical": ["technical", "database", "api", "integration"],
+        "critical": ["critical", "essential", "must have"],
+        "high": ["important", "should have"],
+        "low": ["nice to have", "could have"],
+        "complexity": ["integration", "complex", "multiple", "advanced", "algorithm"],
+    }
+)
+
+# Entity names recognised by the pattern-based domain model, in output order
+ENTITY_TERMS = [
+    "user",
+    "customer",
+    "order",
+    "product",
+    "payment",
+    "account",
+    "service",
+    "system",
+    "data",
+    "report",
+    "transaction",
+    "session",
+]
+ENTITY_KEYWORDS = KeywordMatcher({"entity": ENTITY_TERMS})
 
 
 class AnalysisType(Enum):
@@ -89,7 +142,23 @@ class AIDomainAnalyst(BaseAgent):
             decision_authority="Autonomous",
             phase=1,
             config=config,
+            capabilities=[
+                "requirements_analysis",
+                "domain_modeling",
+                "business_rules",
+                "stakeholder_analysis",
+            ],
+        )
+
+        # Per-requirement enrichment calls in flight at once
+        self.enrichment_concurrency = self.config.get(
+            "enrichment_concurrency", AgentConfig.enrichment_concurrency
         )
+        # Similarity above which extracted requirements are merged (None: off)
+        self.dedup_threshold = self.config.get("dedup_threshold", 0.8)
+        # Larger extraction input is split into chunks extracted in parallel
+        self.extraction_chunk_tokens = self.config.get("extraction_chunk_tokens", 3000)
+        self.extraction_concurrency = self.config.get("extraction_concurrency", 4)
 
         # Domain analysis capabilities
         self.supported_domains = [
@@ -147,15 +216,21 @@ class AIDomainAnalyst(BaseAgent):
                     "Project description and business context are required"
                 )
 
-            # Extract requirements using NLP patterns
-            requirements = await self._extract_requirements(
-                request.project_description,
-                request.business_context,
-                request.stakeholder_input,
-            )
+            # Extract requirements, enriching each one as soon as it streams in
+            requirements = []
+            async with BoundedGather(self.enrichment_concurrency) as enrichment:
+                async for requirement in self._stream_requirements(
+                    request.project_description,
+                    request.business_context,
+                    request.stakeholder_input,
+                ):
+                    requirements.append(requirement)
+                    enrichment.submit(self._enrich_requirement(requirement))
+                outcomes = await enrichment.results()
+            self._report_enrichment_errors(requirements, outcomes)
 
-            # Classify and prioritize requirements
-            classified_requirements = await self._classify_requirements(requirements)
+            # Dependencies need the complete requirement set
+            classified_requirements = await self._link_dependencies(requirements)
 
             # Calculate confidence score
             confidence = self._calculate_confidence(classified_requirements, request)
@@ -204,15 +279,26 @@ class AIDomainAnalyst(BaseAgent):
                 request.project_description, request.business_context
             )
 
-            # Model relationships
-            await self._model_relationships(entities)
+            # Model relationships from entity mentions across the input
+            model_index = DomainModelIndex(
+                entities, self.config.get("relationship_min_cooccurrence", 1)
+            )
+            sources = [
+                request.project_description,
+                request.business_context,
+                *(request.stakeholder_input or []),
+            ]
+            await self._model_relationships(
+                model_index,
+                itertools.chain.from_iterable(map(iter_sentences, sources)),
+            )
 
             # Create domain model
             domain_model = DomainModel(
                 name=f"{request.project_name}_domain",
                 description=f"Domain model for {request.project_name}",
                 entities=entities,
-                bounded_contexts=await self._identify_bounded_contexts(entities),
+                bounded_contexts=await self._identify_bounded_contexts(model_index),
                 domain_services=await self._identify_domain_services(entities),
             )
 
@@ -323,15 +409,140 @@ class AIDomainAnalyst(BaseAgent):
         self, description: str, context: str, stakeholder_input: list[str]
     ) -> list[Requirement]:
         """Extract requirements from natural language text using LLM"""
+        return [
+            requirement
+            async for requirement in self._stream_requirements(
+                description, context, stakeholder_input
+            )
+        ]
+
+    async def _stream_requirements(
+        self, description: str, context: str, stakeholder_input: list[str]
+    ) -> AsyncIterator[Requirement]:
+        """
+        Yield requirements as the LLM generates them
+
+        Each element of the streamed ``requirements`` array becomes a
+        Requirement as soon as it is complete. If the stream fails before
+        any requirement arrived, pattern-based extraction is used instead;
+        a failure later only loses the unfinished tail. Near-duplicates of
+        an earlier requirement are merged into it instead of being yielded.
+        """
+        duplicates = (
+            NearDuplicateIndex(self.dedup_threshold) if self.dedup_threshold else None
+        )
+        extracted = 0
         try:
             # Get LLM client with Phase 1 configuration
             llm_client = get_llm_client(phase=1)
+            parts = self._requirement_parts(description, context, stakeholder_input)
+            streams = [
+                self._stream_part_requirements(llm_client, part, index, len(parts))
+                for index, part in enumerate(parts, 1)
+            ]
+
+            async for requirement in merge_streams(
+                streams, self.extraction_concurrency
+            ):
+                extracted += 1
+                if duplicates is None or duplicates.add(requirement) is None:
+                    yield requirement
+
+        except Exception as e:
+            self.logger.error(f"LLM requirements extraction failed: {e}")
+            if extracted:
+                self.logger.warning(
+                    f"Keeping {extracted} requirements streamed before the failure"
+                )
+
+        if extracted:
+            self.logger.info(f"Extracted {extracted} requirements using LLM")
+        else:
+            # Fallback to simple extraction
+            for requirement in self._fallback_requirements(
+                description, context, *(stakeholder_input or [])
+            ):
+                if duplicates is None or duplicates.add(requirement) is None:
+                    yield requirement
+
+        if duplicates is not None and duplicates.merged:
+            self.logger.info(f"Merged {duplicates.merged} near-duplicate requirements")
+
+    def _requirement_parts(
+        self, description: str, context: str, stakeholder_input: list[str]
+    ) -> list[tuple[str, str, list[str]]]:
+        """
+        Split extraction input that is over the prompt token budget
+
+        Each part is a (description, context, stakeholder input) triple
+        holding one chunk of one source. A business context small enough
+        to share is repeated in every part.
+        """
+        budget = self.extraction_chunk_tokens
+        stakeholder_text = "\n".join(stakeholder_input or [])
+        if estimate_tokens(f"{description}{context}{stakeholder_text}") <= budget:
+            return [(description, context, stakeholder_input)]
 
-            # Prepare context for LLM
-            stakeholder_text = "\n".join(stakeholder_input or [])
+        shared_context = context if estimate_tokens(context) <= budget // 4 else ""
+        budget -= estimate_tokens(shared_context)
 
-            # Create comprehensive prompt for requirements extraction
-            system_prompt = """You are an expert business analyst specializing in requirements engineering. Your task is to extract clear, actionable requirements from project descriptions and stakeholder input.
+        parts = [
+            (chunk, shared_context, []) for chunk in chunk_text(description, budget)
+        ]
+        if not shared_context:
+            parts += [("", chunk, []) for chunk in chunk_text(context, budget)]
+        parts += [
+            ("", shared_context, [chunk])
+            for chunk in chunk_text(stakeholder_text, budget)
+        ]
+        self.logger.info(f"Extracting requirements from {len(parts)} input chunks")
+        return parts
+
+    async def _stream_part_requirements(
+        self,
+        llm_client: Any,
+        part: tuple[str, str, list[str]],
+        index: int,
+        total: int,
+    ) -> AsyncIterator[Requirement]:
+        """Stream requirements for one part; a failure only loses that part"""
+        request = self._requirements_request(
+            *part, part_label=f"part {index} of {total}" if total > 1 else None
+        )
+        try:
+            async for req_data in stream_json_array(
+                llm_client.generate_stream(request), "requirements"
+            ):
+                requirement = self._requirement_from_data(req_data)
+                if requirement is not None:
+                    yield requirement
+        except Exception as e:
+            if total == 1:
+                raise
+            self.logger.error(
+                f"LLM requirements extraction failed for part {index}/{total}: {e}"
+            )
+
+    def _requirements_request(
+        self,
+        description: str,
+        context: str,
+        stakeholder_input: list[str],
+        part_label: str | None = None,
+    ) -> LLMRequest:
+        """Build the LLM request for requirements extraction"""
+        # Prepare context for LLM
+        stakeholder_text = "\n".join(stakeholder_input or [])
+
+        part_note = (
+            f"This is {part_label} of a larger document; extract only the "
+            f"requirements stated in this part.\n\n"
+            if part_label
+            else ""
+        )
+
+        # Create comprehensive prompt for requirements extraction
+        system_prompt = """You are an expert business analyst specializing in requirements engineering. Your task is to extract clear, actionable requirements from project descriptions and stakeholder input.
 
 For each requirement you identify:
 1. Create a clear, concise title
@@ -347,7 +558,7 @@ Focus on extracting requirements that are:
 - Relevant to the project goals
 - Realistic and achievable"""
 
-            user_prompt = f"""Project Description:
+        user_prompt = f"""Project Description:
 {description}
 
 Business Context:
@@ -356,7 +567,7 @@ Business Context:
 Stakeholder Input:
 {stakeholder_text}
 
-Please extract and analyze all requirements from this information. Return your analysis as JSON matching this exact schema:
+{part_note}Please extract and analyze all requirements from this information. Return your analysis as JSON matching this exact schema:
 
 {{
   "requirements": [
@@ -374,144 +585,128 @@ Please extract and analyze all requirements from this information. Return your a
   ]
 }}"""
 
-            # Make LLM request
-            request = LLMRequest(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                temperature=0.1,
-                max_tokens=4000,
-                response_format="json",
-            )
-
-            response = await llm_client.generate(request)
-
-            # Parse LLM response
-            try:
-                result_data = json.loads(response.content)
-                requirements = []
-
-                for req_data in result_data.get("requirements", []):
-                    requirement = Requirement(
-                        title=req_data.get("title", ""),
-                        description=req_data.get("description", ""),
-                        type=RequirementType(req_data.get("type", "functional")),
-                        priority=RequirementPriority(
-                            req_data.get("priority", "medium")
-                        ),
-                        acceptance_criteria=req_data.get("acceptance_criteria", []),
-                        business_value=req_data.get("business_value", ""),
-                        complexity_score=req_data.get("complexity_score", 5.0),
-                        dependencies=req_data.get("dependencies", []),
-                        stakeholders=req_data.get("stakeholders", []),
-                    )
-                    requirements.append(requirement)
-
-                self.logger.info(
-                    f"Extracted {len(requirements)} requirements using LLM"
-                )
-                return requirements
-
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to parse LLM response: {e}")
-                # Fallback to simple extraction
-                return await self._fallback_extract_requirements(
-                    description, context, stakeholder_input
-                )
+        # Make LLM request
+        return LLMRequest(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.1,
+            max_tokens=4000,
+            response_format="json",
+        )
 
-        except Exception as e:
-            self.logger.error(f"LLM requirements extraction failed: {e}")
-            # Fallback to simple extraction
-            return await self._fallback_extract_requirements(
-                description, context, stakeholder_input
+    def _requirement_from_data(self, req_data: Any) -> Requirement | None:
+        """Build a Requirement from one LLM-produced element"""
+        try:
+            return Requirement(
+                title=req_data.get("title", ""),
+                description=req_data.get("description", ""),
+                type=RequirementType(req_data.get("type", "functional")),
+                priority=RequirementPriority(req_data.get("priority", "medium")),
+                acceptance_criteria=req_data.get("acceptance_criteria", []),
+                business_value=req_data.get("business_value", ""),
+                complexity_score=req_data.get("complexity_score", 5.0),
+                dependencies=req_data.get("dependencies", []),
+                stakeholders=req_data.get("stakeholders", []),
             )
+        except (AttributeError, TypeError, ValueError) as e:
+            self.logger.warning(f"Skipping malformed requirement from LLM: {e}")
+            return None
 
-    async def _fallback_extract_requirements(
-        self, description: str, context: str, stakeholder_input: list[str]
-    ) -> list[Requirement]:
-        """Fallback requirements extraction using simple patterns"""
-        requirements = []
-
-        # Simple pattern-based extraction
-        requirement_indicators = [
-            "must",
-            "should",
-            "shall",
-            "will",
-            "requires",
-            "needs",
-            "user can",
-            "system will",
-            "application should",
-        ]
-
-        # Combine all text sources
-        all_text = f"{description} {context} {' '.join(stakeholder_input or [])}"
-        sentences = all_text.split(".")
+    def _fallback_requirements(
+        self, *sources: str | Iterable[str]
+    ) -> Iterator[Requirement]:
+        """
+        Fallback requirements extraction using simple patterns
 
+        Sources (text, or line iterables such as open files) are segmented
+        lazily, so large documents are processed one sentence at a time.
+        """
+        sentences = itertools.chain.from_iterable(
+            iter_sentences(source) for source in sources
+        )
         for i, sentence in enumerate(sentences):
-            sentence = sentence.strip()
-            if any(
-                indicator in sentence.lower() for indicator in requirement_indicators
-            ):
-                req = Requirement(
+            hits = REQUIREMENT_KEYWORDS.categories(sentence)
+            if "indicator" in hits:
+                yield Requirement(
                     title=f"Requirement {i + 1}",
                     description=sentence,
-                    type=self._classify_requirement_type(sentence),
-                    priority=self._assess_requirement_priority(sentence),
+                    type=self._requirement_type_for(hits),
+                    priority=self._requirement_priority_for(hits),
                 )
-                requirements.append(req)
-
-        return requirements
 
     async def _classify_requirements(
         self, requirements: list[Requirement]
     ) -> list[Requirement]:
         """Classify and enhance requirements"""
-        for req in requirements:
-            # Add acceptance criteria
-            req.acceptance_criteria = await self._generate_acceptance_criteria(
-                req.description
-            )
+        outcomes = await map_bounded(
+            self._enrich_requirement, requirements, self.enrichment_concurrency
+        )
+        self._report_enrichment_errors(requirements, outcomes)
 
-            # Assess complexity
-            req.complexity_score = self._assess_complexity(req.description)
+        return await self._link_dependencies(requirements)
 
-            # Identify dependencies
-            req.dependencies = await self._identify_dependencies(req, requirements)
+    async def _enrich_requirement(self, req: Requirement) -> None:
+        """Add the per-requirement classification details"""
+        # Assess complexity
+        req.complexity_score = self._assess_complexity(req.description)
+
+        # Add acceptance criteria
+        req.acceptance_criteria = await self._generate_acceptance_criteria(
+            req.description
+        )
+
+    def _report_enrichment_errors(
+        self, requirements: list[Requirement], outcomes: list[Any]
+    ) -> None:
+        """Log requirements whose enrichment failed; they keep their defaults"""
+        for req, outcome in zip(requirements, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                self.logger.warning(f"Could not enrich requirement {req.id}: {outcome}")
+
+    async def _link_dependencies(
+        self, requirements: list[Requirement]
+    ) -> list[Requirement]:
+        """
+        Identify dependencies across the full requirement set
+
+        Two requirements depend on each other when their descriptions share
+        more than two words, stop words included, as in the original
+        pairwise comparison; the index only makes finding them faster.
+        """
+        index = RequirementIndex(requirements, stop_words=())
+        for position, req in enumerate(requirements):
+            req.dependencies = index.dependencies(position)
 
         return requirements
 
     def _classify_requirement_type(self, text: str) -> RequirementType:
         """Classify requirement type based on content"""
-        text_lower = text.lower()
+        return self._requirement_type_for(REQUIREMENT_KEYWORDS.categories(text))
 
-        if any(
-            word in text_lower
-            for word in ["performance", "security", "scalability", "availability"]
-        ):
+    def _assess_requirement_priority(self, text: str) -> RequirementPriority:
+        """Assess requirement priority"""
+        return self._requirement_priority_for(REQUIREMENT_KEYWORDS.categories(text))
+
+    @staticmethod
+    def _requirement_type_for(hits: set[str]) -> RequirementType:
+        """Requirement type from the keyword categories found in its text"""
+        if "non_functional" in hits:
             return RequirementType.NON_FUNCTIONAL
-        elif any(
-            word in text_lower
-            for word in ["business", "process", "workflow", "compliance"]
-        ):
+        elif "business" in hits:
             return RequirementType.BUSINESS
-        elif any(
-            word in text_lower
-            for word in ["technical", "database", "api", "integration"]
-        ):
+        elif "technical" in hits:
             return RequirementType.TECHNICAL
         else:
             return RequirementType.FUNCTIONAL
 
-    def _assess_requirement_priority(self, text: str) -> RequirementPriority:
-        """Assess requirement priority"""
-        text_lower = text.lower()
-
-        if any(word in text_lower for word in ["critical", "essential", "must have"]):
+    @staticmethod
+    def _requirement_priority_for(hits: set[str]) -> RequirementPriority:
+        """Requirement priority from the keyword categories found in its text"""
+        if "critical" in hits:
             return RequirementPriority.CRITICAL
-        elif any(word in text_lower for word in ["important", "should have"]):
+        elif "high" in hits:
             return RequirementPriority.HIGH
-        elif any(word in text_lower for word in ["nice to have", "could have"]):
+        elif "low" in hits:
             return RequirementPriority.LOW
         else:
             return RequirementPriority.MEDIUM
@@ -524,25 +719,10 @@ Please extract and analyze all requirements from this information. Return your a
 
         # Simple noun extraction (in real implementation, use NLP)
         # This is a simplified pattern-based approach
-        common_entity_patterns = [
-            "user",
-            "customer",
-            "order",
-            "product",
-            "payment",
-            "account",
-            "service",
-            "system",
-            "data",
-            "report",
-            "transaction",
-            "session",
-        ]
-
-        text = f"{description} {context}".lower()
+        found = ENTITY_KEYWORDS.keywords(f"{description} {context}")
 
-        for pattern in common_entity_patterns:
-            if pattern in text:
+        for pattern in ENTITY_TERMS:
+            if pattern in found:
                 entity = DomainEntity(
                     name=pattern.title(),
                     description=f"{pattern.title()} entity in the domain",
@@ -558,64 +738,32 @@ Please extract and analyze all requirements from this information. Return your a
         return entities
 
     async def _model_relationships(
-        self, entities: list[DomainEntity]
+        self, model_index: DomainModelIndex, sentences: Iterable[str] = ()
     ) -> dict[str, str]:
         """Model relationships between entities"""
-        relationships = {}
-
-        # Simple relationship modeling
-        for entity in entities:
-            for other_entity in entities:
-                if entity.name != other_entity.name:
-                    # Simple heuristic for relationships
-                    if (
-                        "user" in entity.name.lower()
-                        and "order" in other_entity.name.lower()
-                    ):
-                        relationships[f"{entity.name}_to_{other_entity.name}"] = (
-                            "one_to_many"
-                        )
-
-        return relationships
+        return model_index.relationships(sentences)
 
     async def _identify_bounded_contexts(
-        self, entities: list[DomainEntity]
+        self, model_index: DomainModelIndex
     ) -> list[str]:
         """Identify bounded contexts"""
-        contexts = set()
-
-        # Group entities by domain areas
-        for entity in entities:
-            if any(
-                word in entity.name.lower() for word in ["user", "customer", "account"]
-            ):
-                contexts.add("User Management")
-            elif any(
-                word in entity.name.lower() for word in ["order", "product", "payment"]
-            ):
-                contexts.add("Order Management")
-            elif any(
-                word in entity.name.lower() for word in ["report", "data", "analytics"]
-            ):
-                contexts.add("Analytics")
-
-        return list(contexts)
+        return model_index.bounded_contexts()
 
     async def _identify_domain_services(
         self, entities: list[DomainEntity]
     ) -> list[str]:
         """Identify domain services"""
-        services = []
+        services: dict[str, None] = {}
 
         # Identify services based on entity behaviors
         for entity in entities:
-            for behavior in entity.behaviors:
-                if behavior.startswith("create_") or behavior.startswith("process_"):
-                    service_name = f"{entity.name}Service"
-                    if service_name not in services:
-                        services.append(service_name)
+            if any(
+                behavior.startswith(("create_", "process_"))
+                for behavior in entity.behaviors
+            ):
+                services[f"{entity.name}Service"] = None
 
-        return services
+        return list(services)
 
     async def _extract_business_rules(
         self, description: str, context: str
@@ -781,17 +929,9 @@ Please extract and analyze all requirements from this information. Return your a
 
     def _assess_complexity(self, description: str) -> float:
         """Assess requirement complexity"""
-        complexity_indicators = [
-            "integration",
-            "complex",
-            "multiple",
-            "advanced",
-            "algorithm",
-        ]
-        score = sum(
-            1 for indicator in complexity_indicators if indicator in description.lower()
-        )
-        return min(score / len(complexity_indicators), 1.0)
+        indicators = REQUIREMENT_KEYWORDS.vocabulary["complexity"]
+        found = REQUIREMENT_KEYWORDS.matches(description).get("complexity", ())
+        return min(len(found) / len(indicators), 1.0)
 
     async def _generate_acceptance_criteria(self, description: str) -> list[str]:
         """Generate acceptance criteria for a requirement"""
@@ -801,23 +941,6 @@ Please extract and analyze all requirements from this information. Return your a
             "Then it should meet the specified behavior",
         ]
 
-    async def _identify_dependencies(
-        self, requirement: Requirement, all_requirements: list[Requirement]
-    ) -> list[str]:
-        """Identify dependencies between requirements"""
-        dependencies = []
-
-        # Simple keyword-based dependency detection
-        req_keywords = set(requirement.description.lower().split())
-
-        for other_req in all_requirements:
-            if other_req.id != requirement.id:
-                other_keywords = set(other_req.description.lower().split())
-                if len(req_keywords.intersection(other_keywords)) > 2:
-                    dependencies.append(other_req.id)
-
-        return dependencies
-
     # Recommendation generation methods
     async def _generate_requirements_recommendations(
         self, requirements: list[Requirement]
@@ -0,0 +1,192 @@
+"""
+Domain Modeling Index
+PATH Framework - AI Component
+
+Index-driven relationship and bounded-context modeling for extracted
+domain entities. Entity names and context keywords are compiled into
+keyword matchers once; relationships come from how often two entities are
+mentioned in the same sentence, counted in a single sweep over the text,
+and bounded contexts are the connected groups of related entities found
+with union-find. Work grows with the amount of text and the number of
+relationships found, not with the square of the entity count.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from ....core.keywords import KeywordMatcher
+from ....models.arch_models import DomainEntity
+
+# Keywords in an entity name placing it in a well-known context; earlier
+# contexts win when a name matches several
+CONTEXT_KEYWORDS = {
+    "User Management": ["user", "customer", "account"],
+    "Order Management": ["order", "product", "payment"],
+    "Analytics": ["report", "data", "analytics"],
+}
+
+# Cardinality of relationships between entities whose names contain the
+# given keywords, whether or not they are mentioned together
+RELATIONSHIP_RULES = {("user", "order"): "one_to_many"}
+
+ASSOCIATION = "association"
+
+
+class UnionFind:
+    """Disjoint sets over positions 0..size-1"""
+
+    def __init__(self, size: int):
+        self._parent = list(range(size))
+        self._size = [1] * size
+
+    def find(self, item: int) -> int:
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, first: int, second: int) -> int:
+        """Merge the sets of two items, returning the new root"""
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return first
+        if self._size[first] < self._size[second]:
+            first, second = second, first
+        self._parent[second] = first
+        self._size[first] += self._size[second]
+        return first
+
+
+class DomainModelIndex:
+    """
+    Lookups over a set of domain entities
+
+    Args:
+        entities: Entities to model; names are matched case-insensitively
+        min_cooccurrence: Sentences that must mention two entities before
+            they are considered associated
+    """
+
+    def __init__(self, entities: Iterable[DomainEntity], min_cooccurrence: int = 1):
+        self.entities = list(entities)
+        self.min_cooccurrence = min_cooccurrence
+
+        self._positions: dict[str, list[int]] = {}
+        for position, entity in enumerate(self.entities):
+            if entity.name:
+                self._positions.setdefault(entity.name.lower(), []).append(position)
+        self._names = KeywordMatcher({"entity": self._positions})
+
+        self._rule_keywords = KeywordMatcher(
+            {keyword: [keyword] for rule in RELATIONSHIP_RULES for keyword in rule}
+        )
+        self._context_keywords = KeywordMatcher(CONTEXT_KEYWORDS)
+
+    def cooccurrences(self, sentences: Iterable[str]) -> Counter:
+        """
+        Count the sentences mentioning each pair of entities
+
+        Returns:
+            Counter keyed by (position, other position), lower one first
+        """
+        counts: Counter = Counter()
+        for sentence in sentences:
+            mentioned = sorted(
+                position
+                for name in self._names.keywords(sentence)
+                for position in self._positions[name]
+            )
+            for i, first in enumerate(mentioned):
+                for second in mentioned[i + 1 :]:
+                    counts[first, second] += 1
+        return counts
+
+    def relationships(self, sentences: Iterable[str] = ()) -> dict[str, str]:
+        """
+        Relate entities by name rules and by co-occurrence in ``sentences``
+
+        Each relationship is also recorded on both entities'
+        ``relationships``, keyed by the other entity's name.
+
+        Returns:
+            Relationship kinds keyed by "<Entity>_to_<Other>"
+        """
+        related: dict[tuple[int, int], str] = {}
+
+        by_keyword: dict[str, list[int]] = {}
+        for position, entity in enumerate(self.entities):
+            for keyword in self._rule_keywords.categories(entity.name):
+                by_keyword.setdefault(keyword, []).append(position)
+        for (source, target), kind in RELATIONSHIP_RULES.items():
+            for first in by_keyword.get(source, ()):
+                for second in by_keyword.get(target, ()):
+                    if self.entities[first].name != self.entities[second].name:
+                        related[first, second] = kind
+
+        for (first, second), count in self.cooccurrences(sentences).items():
+            if count < self.min_cooccurrence:
+                continue
+            if (first, second) not in related and (second, first) not in related:
+                related[first, second] = ASSOCIATION
+
+        relationships = {}
+        for (first, second), kind in related.items():
+            entity, other = self.entities[first], self.entities[second]
+            entity.relationships[other.name] = kind
+            other.relationships.setdefault(entity.name, kind)
+            relationships[f"{entity.name}_to_{other.name}"] = kind
+        return relationships
+
+    def context_of(self, entity: DomainEntity) -> str | None:
+        """Well-known bounded context an entity's name places it in"""
+        hits = self._context_keywords.categories(entity.name)
+        return next((context for context in CONTEXT_KEYWORDS if context in hits), None)
+
+    def bounded_contexts(self) -> list[str]:
+        """
+        Group related entities into bounded contexts
+
+        Entities are joined along their relationships unless that would
+        merge two different well-known contexts. A group is named after
+        the well-known context of its members or, for a group of several
+        entities outside those contexts, after its first entity.
+
+        Returns:
+            Context names in order of their first entity
+        """
+        groups = UnionFind(len(self.entities))
+        labels: dict[int, str] = {}
+        for position, entity in enumerate(self.entities):
+            label = self.context_of(entity)
+            if label is not None:
+                labels[position] = label
+
+        positions = {
+            entity.name: position for position, entity in enumerate(self.entities)
+        }
+        for position, entity in enumerate(self.entities):
+            for name in entity.relationships:
+                other = positions.get(name)
+                if other is None:
+                    continue
+                first, second = groups.find(position), groups.find(other)
+                first_label, second_label = labels.get(first), labels.get(second)
+                if first_label and second_label and first_label != second_label:
+                    continue
+                root = groups.union(first, second)
+                if first_label or second_label:
+                    labels[root] = first_label or second_label
+
+        roots = [groups.find(position) for position in range(len(self.entities))]
+        sizes = Counter(roots)
+        first_members: dict[int, str] = {}
+        contexts: dict[str, None] = {}
+        for root, entity in zip(roots, self.entities, strict=True):
+            if root in labels:
+                contexts[labels[root]] = None
+            elif sizes[root] > 1:
+                name = first_members.setdefault(root, entity.name)
+                contexts[f"{name} Context"] = None
+        return list(contexts)
@@ -55,6 +55,7 @@ class AIIntegrationArchitect(BaseAgent):
             decision_authority="Autonomous",
             phase=1,
             config=config,
+            capabilities=["integration_design"],
         )
 
     async def design_integration(
@@ -23,16 +23,17 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from ....exceptions import AgentError
-from ....models.arch_models import DomainModel, RequirementAnalysis, SystemArchitecture
+from ....exceptions import AgentError, ValidationError
+from ....models.arch_models import RequirementAnalysis, SystemArchitecture
 from ....models.phase1_models import (
     ComponentDesign,
     IntegrationDesign,
     Phase1Output,
-    Requirement,
     TechnologyStack,
 )
+from ....models.serialization import to_primitive
 from ...base import BasePhase
+from ..process.scheduler import StepScheduler, step_spec
 from .component_designer import AIComponentDesigner, ComponentDesignRequest
 from .domain_analyst import AIDomainAnalyst, AnalysisType, DomainAnalysisRequest
 from .integration_architect import AIIntegrationArchitect, IntegrationRequest
@@ -49,6 +50,48 @@ class Phase1Step(Enum):
     DOCUMENTATION_HANDOFF = "documentation_handoff"
 
 
+# Inputs and outputs of each step, named after the Phase1Output fields.
+# Context analysis and domain modeling both work from the request alone, so
+# they run concurrently on the shared domain analyst; per-step state stays
+# local to each step. Add an edge to serialize steps that cannot share an
+# agent.
+PHASE1_STEP_GRAPH = [
+    step_spec(Phase1Step.CONTEXT_ANALYSIS, provides=["requirement_analysis"]),
+    step_spec(Phase1Step.DOMAIN_MODELING, provides=["domain_model"]),
+    step_spec(
+        Phase1Step.ARCHITECTURE_DESIGN,
+        requires=["requirement_analysis", "domain_model"],
+        provides=["system_architecture"],
+    ),
+    step_spec(
+        Phase1Step.COMPONENT_DESIGN,
+        requires=["system_architecture"],
+        provides=["component_designs"],
+    ),
+    step_spec(
+        Phase1Step.INTEGRATION_DESIGN,
+        requires=["system_architecture", "component_designs"],
+        provides=["integration_design"],
+    ),
+    step_spec(
+        Phase1Step.VALIDATION_REVIEW,
+        requires=[
+            "requirement_analysis",
+            "domain_model",
+            "system_architecture",
+            "component_designs",
+            "integration_design",
+        ],
+        provides=["validation_results"],
+    ),
+    step_spec(
+        Phase1Step.DOCUMENTATION_HANDOFF,
+        requires=["validation_results"],
+        provides=["documentation"],
+    ),
+]
+
+
 @dataclass
 class Phase1Request:
     """Input request for Phase 1"""
@@ -100,16 +143,9 @@ class ArchOrchestrator(BasePhase):
         self.component_designer = AIComponentDesigner(config)
         self.integration_architect = AIIntegrationArchitect(config)
 
-        # Phase 1 workflow steps
-        self.workflow_steps = [
-            Phase1Step.CONTEXT_ANALYSIS,
-            Phase1Step.DOMAIN_MODELING,
-            Phase1Step.ARCHITECTURE_DESIGN,
-            Phase1Step.COMPONENT_DESIGN,
-            Phase1Step.INTEGRATION_DESIGN,
-            Phase1Step.VALIDATION_REVIEW,
-            Phase1Step.DOCUMENTATION_HANDOFF,
-        ]
+        # Phase 1 workflow steps and their data dependencies
+        self.step_scheduler = StepScheduler(PHASE1_STEP_GRAPH)
+        self.workflow_steps = [spec.step for spec in PHASE1_STEP_GRAPH]
 
         # Human approval points
         self.human_approval_steps = {
@@ -145,11 +181,14 @@ class ArchOrchestrator(BasePhase):
             phase_output = Phase1Output(project_name=request.project_name)
             step_results = []
 
-            # Execute workflow steps
-            for step in self.workflow_steps:
+            # Execute workflow steps, each as soon as its inputs are available
+            async def execute(step: Phase1Step) -> Phase1StepResult:
                 self.logger.info(f"Executing step: {step.value}")
+                return await self._execute_step(step, request, phase_output)
 
-                step_result = await self._execute_step(step, request, phase_output)
+            async def on_complete(
+                step: Phase1Step, step_result: Phase1StepResult
+            ) -> bool:
                 step_results.append(step_result)
 
                 # Check if step was successful
@@ -158,7 +197,7 @@ class ArchOrchestrator(BasePhase):
                         f"Step {step.value} failed: {step_result.validation_errors}"
                     )
                     phase_output.validation_results[step.value] = False
-                    break
+                    return False
 
                 # Update phase output with step results
                 await self._update_phase_output(phase_output, step_result)
@@ -187,6 +226,9 @@ class ArchOrchestrator(BasePhase):
                     phase_output.validation_results[f"{step.value}_quality"] = False
 
                 self.logger.info(f"Step {step.value} completed successfully")
+                return True
+
+            await self.step_scheduler.run(execute, on_complete)
 
             # Final validation
             final_validation = await self._final_validation(phase_output)
@@ -271,11 +313,7 @@ class ArchOrchestrator(BasePhase):
             agent_id=self.domain_analyst.agent_id,
             success=True,
             output={
-                "requirements": (
-                    [asdict(req) for req in result.requirements]
-                    if result.requirements
-                    else []
-                ),
+                "requirements": list(result.requirements or []),
                 "analysis_type": result.analysis_type.value,
                 "recommendations": result.recommendations or [],
             },
@@ -304,9 +342,7 @@ class ArchOrchestrator(BasePhase):
             agent_id=self.domain_analyst.agent_id,
             success=True,
             output={
-                "domain_model": (
-                    asdict(result.domain_model) if result.domain_model else {}
-                ),
+                "domain_model": result.domain_model,
                 "recommendations": result.recommendations or [],
             },
             confidence_score=result.confidence_score,
@@ -526,22 +562,17 @@ class ArchOrchestrator(BasePhase):
         output = step_result.output
 
         if step == Phase1Step.CONTEXT_ANALYSIS:
-            # Convert requirements data back to objects
+            # The step passes the analyst's Requirement objects through
             if "requirements" in output:
-                requirements = []
-                for req_data in output["requirements"]:
-                    req = Requirement(**req_data)
-                    requirements.append(req)
-
                 phase_output.requirement_analysis = RequirementAnalysis(
                     project_name=phase_output.project_name,
                     description="Requirements analysis from Phase 1",
-                    requirements=requirements,
+                    requirements=output["requirements"],
                 )
 
         elif step == Phase1Step.DOMAIN_MODELING:
             if output.get("domain_model"):
-                phase_output.domain_model = DomainModel(**output["domain_model"])
+                phase_output.domain_model = output["domain_model"]
 
         elif step == Phase1Step.ARCHITECTURE_DESIGN:
             if "architecture" in output:
@@ -623,27 +654,18 @@ class ArchOrchestrator(BasePhase):
     async def _prepare_next_phase_inputs(
         self, phase_output: Phase1Output
     ) -> dict[str, Any]:
-        """Prepare inputs for Phase 2 (TDD)"""
+        """
+        Prepare inputs for Phase 2 (TDD)
+
+        The deliverables are encoded once here; ``execute()`` reuses this
+        payload rather than encoding them again.
+        """
         return {
-            "requirements": (
-                asdict(phase_output.requirement_analysis)
-                if phase_output.requirement_analysis
-                else {}
-            ),
-            "domain_model": (
-                asdict(phase_output.domain_model) if phase_output.domain_model else {}
-            ),
-            "architecture": (
-                asdict(phase_output.system_architecture)
-                if phase_output.system_architecture
-                else {}
-            ),
-            "components": [asdict(comp) for comp in phase_output.component_designs],
-            "integration": (
-                asdict(phase_output.integration_design)
-                if phase_output.integration_design
-                else {}
-            ),
+            "requirements": to_primitive(phase_output.requirement_analysis or {}),
+            "domain_model": to_primitive(phase_output.domain_model or {}),
+            "architecture": to_primitive(phase_output.system_architecture or {}),
+            "components": to_primitive(phase_output.component_designs),
+            "integration": to_primitive(phase_output.integration_design or {}),
             "phase1_validation": phase_output.validation_results,
             "human_approvals": phase_output.human_approvals,
         }
@@ -666,7 +688,8 @@ class ArchOrchestrator(BasePhase):
             # Execute complete Phase 1
             result = await self.execute_phase(request)
 
-            # Format response
+            # Format response; deliverables share the handoff payload
+            handoff = result.next_phase_inputs
             response = {
                 "phase": "phase1",
                 "orchestrator_id": "phase1_orchestrator",
@@ -677,27 +700,11 @@ class ArchOrchestrator(BasePhase):
                 "human_approvals": result.human_approvals,
                 "next_phase_inputs": result.next_phase_inputs,
                 "deliverables": {
-                    "requirement_analysis": (
-                        asdict(result.requirement_analysis)
-                        if result.requirement_analysis
-                        else None
-                    ),
-                    "domain_model": (
-                        asdict(result.domain_model) if result.domain_model else None
-                    ),
-                    "system_architecture": (
-                        asdict(result.system_architecture)
-                        if result.system_architecture
-                        else None
-                    ),
-                    "component_designs": [
-                        asdict(comp) for comp in result.component_designs
-                    ],
-                    "integration_design": (
-                        asdict(result.integration_design)
-                        if result.integration_design
-                        else None
-                    ),
+                    "requirement_analysis": handoff["requirements"] or None,
+                    "domain_model": handoff["domain_model"] or None,
+                    "system_architecture": handoff["architecture"] or None,
+                    "component_designs": handoff["components"],
+                    "integration_design": handoff["integration"] or None,
                 },
             }
 
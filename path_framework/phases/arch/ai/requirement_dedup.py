@@ -0,0 +1,193 @@
+"""
+Requirement Deduplication
+PATH Framework - AI Component
+
+Near-duplicate detection for extracted requirements using MinHash
+signatures and locality-sensitive hashing. Several stakeholder documents
+often state the same requirement in slightly different words; merging
+them early keeps every downstream step from doing the work twice.
+
+Each requirement is compared only with those landing in one of its LSH
+buckets, so a batch is processed in time linear in its size.
+"""
+
+import random
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+
+from ....models.arch_models import Requirement, RequirementPriority
+
+_WORD = re.compile(r"\w+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_PRIORITY_RANK = {
+    RequirementPriority.LOW: 0,
+    RequirementPriority.MEDIUM: 1,
+    RequirementPriority.HIGH: 2,
+    RequirementPriority.CRITICAL: 3,
+}
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    """Overlapping word n-grams of the normalized text"""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(first: set[str], second: set[str]) -> float:
+    # Text without any words carries no evidence of being a duplicate
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """
+    MinHash signatures over sets of string features
+
+    Args:
+        num_perm: Signature length (number of hash permutations)
+        seed: Seed for the permutation coefficients, so signatures are
+            stable between runs
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)  # noqa: S311 - not used for security
+        self.num_perm = num_perm
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, features: Iterable[str]) -> tuple[int, ...]:
+        hashes = [zlib.crc32(feature.encode()) for feature in features]
+        if not hashes:
+            return (0,) * self.num_perm
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._permutations
+        )
+
+
+def _merge_unique(target: list[str], extra: list[str]) -> None:
+    seen = set(target)
+    for item in extra:
+        if item not in seen:
+            target.append(item)
+            seen.add(item)
+
+
+def merge_requirement(target: Requirement, duplicate: Requirement) -> None:
+    """Fold a near-duplicate into the requirement that is kept"""
+    _merge_unique(target.stakeholders, duplicate.stakeholders)
+    _merge_unique(target.acceptance_criteria, duplicate.acceptance_criteria)
+    _merge_unique(target.dependencies, duplicate.dependencies)
+    if _PRIORITY_RANK[duplicate.priority] > _PRIORITY_RANK[target.priority]:
+        target.priority = duplicate.priority
+    if not target.business_value:
+        target.business_value = duplicate.business_value
+
+
+class NearDuplicateIndex:
+    """
+    Incremental LSH index of requirements
+
+    Requirements are added one at a time, so duplicates can be dropped
+    while extraction is still streaming. A requirement whose text has at
+    least ``threshold`` Jaccard similarity (over word shingles) with an
+    indexed one is merged into that requirement's kept representative.
+
+    Args:
+        threshold: Minimum shingle Jaccard similarity of a duplicate
+        num_perm: MinHash signature length
+        bands: Number of LSH bands; ``num_perm`` must be divisible by it.
+            More bands find more candidates at lower similarity.
+        shingle_size: Words per shingle
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.merged = 0
+
+        self._hasher = MinHasher(num_perm)
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+        # Shingles of every indexed text and the representative it belongs to
+        self._shingles: list[set[str]] = []
+        self._representatives: list[Requirement] = []
+
+    def add(self, requirement: Requirement) -> Requirement | None:
+        """
+        Index a requirement, merging it if it duplicates an earlier one
+
+        Returns:
+            The kept requirement it was merged into, or None if it is new
+        """
+        features = shingles(
+            requirement.description or requirement.title, self.shingle_size
+        )
+        if not features:
+            # Text without words cannot be compared, so it is always kept
+            self._shingles.append(features)
+            self._representatives.append(requirement)
+            return None
+
+        signature = self._hasher.signature(features)
+        keys = [
+            (band, signature[band * self.rows : (band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+        match: Requirement | None = None
+        checked: set[int] = set()
+        for key in keys:
+            for candidate in self._buckets.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if jaccard(features, self._shingles[candidate]) >= self.threshold:
+                    match = self._representatives[candidate]
+                    break
+            if match is not None:
+                break
+
+        position = len(self._shingles)
+        self._shingles.append(features)
+        self._representatives.append(match or requirement)
+        for key in keys:
+            self._buckets[key].append(position)
+
+        if match is not None:
+            merge_requirement(match, requirement)
+            self.merged += 1
+        return match
+
+
+def deduplicate_requirements(
+    requirements: Iterable[Requirement], threshold: float = 0.8
+) -> list[Requirement]:
+    """
+    Drop near-duplicate requirements, merging them into the first occurrence
+
+    Args:
+        requirements: Extracted requirements in document order
+        threshold: Minimum shingle Jaccard similarity of a duplicate
+
+    Returns:
+        The kept requirements, in their original order
+    """
+    index = NearDuplicateIndex(threshold)
+    return [req for req in requirements if index.add(req) is None]
@@ -0,0 +1,235 @@
+"""
+Requirement Term Index
+PATH Framework - AI Component
+
+Inverted index over requirement descriptions used to find requirements
+that share enough vocabulary to be considered dependent. Each description
+is tokenized once; candidate pairs come from the postings of the terms a
+requirement uses, so only requirements that actually share vocabulary are
+ever compared.
+"""
+
+import functools
+import itertools
+import math
+import operator
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+from ....models.arch_models import Requirement
+
+# Words too common in requirement prose to indicate a relationship
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "can",
+        "for",
+        "from",
+        "has",
+        "have",
+        "in",
+        "is",
+        "it",
+        "must",
+        "of",
+        "on",
+        "or",
+        "shall",
+        "should",
+        "system",
+        "that",
+        "the",
+        "their",
+        "this",
+        "to",
+        "will",
+        "with",
+    }
+)
+
+_TOKEN = re.compile(r"\S+")
+
+# Terms in more postings than this (or sqrt of the requirement count, if
+# larger) are matched with bitsets rather than by walking their postings
+_MIN_FREQUENT_POSTINGS = 32
+_MAX_BITSET_COMBINATIONS = 256
+
+
+def _bit_positions(mask: int) -> Iterator[int]:
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def tokenize(text: str, stop_words: Iterable[str] = STOP_WORDS) -> set[str]:
+    """Distinct lower-cased whitespace-separated terms, minus stop words"""
+    return set(_TOKEN.findall(text.lower())) - set(stop_words)
+
+
+class RequirementIndex:
+    """
+    Inverted index from terms to the requirements that use them
+
+    Two requirements are related when they share more than ``threshold``
+    terms or, with ``tfidf=True``, when the summed inverse document
+    frequency of their shared terms exceeds ``threshold``, so rare shared
+    terms count for more than common ones.
+
+    Args:
+        requirements: Requirements to index
+        threshold: Shared-term count (or IDF score) that must be exceeded
+        stop_words: Terms ignored entirely
+        tfidf: Weight shared terms by inverse document frequency
+        max_document_frequency: Ignore terms used by more than this
+            fraction of requirements; their postings would dominate the
+            pair count while saying little about dependency
+    """
+
+    def __init__(
+        self,
+        requirements: Iterable[Requirement],
+        threshold: float = 2,
+        stop_words: Iterable[str] = STOP_WORDS,
+        tfidf: bool = False,
+        max_document_frequency: float | None = None,
+    ):
+        self.requirements = list(requirements)
+        self.threshold = threshold
+        self.tfidf = tfidf
+
+        stop_words = frozenset(stop_words)
+        self._terms = [
+            tokenize(requirement.description, stop_words)
+            for requirement in self.requirements
+        ]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for position, terms in enumerate(self._terms):
+            for term in terms:
+                self._postings[term].append(position)
+
+        count = len(self.requirements)
+        if max_document_frequency is not None and count:
+            limit = max_document_frequency * count
+            self._postings = {
+                term: postings
+                for term, postings in self._postings.items()
+                if len(postings) <= limit
+            }
+            self._terms = [terms & self._postings.keys() for terms in self._terms]
+
+        self._weights = {
+            term: (math.log(count / len(postings)) if tfidf else 1.0)
+            for term, postings in self._postings.items()
+        }
+        self._related: list[list[int]] | None = None
+
+    def _compute_related(self) -> list[list[int]]:
+        if self.tfidf:
+            return self._score_related()
+        return self._count_related()
+
+    def _score_related(self) -> list[list[int]]:
+        """Sum the weights of shared terms through the postings"""
+        related: list[list[int]] = []
+        for position in range(len(self.requirements)):
+            scores: dict[int, float] = defaultdict(float)
+            for term in self._terms[position]:
+                weight = self._weights[term]
+                for other in self._postings[term]:
+                    scores[other] += weight
+            scores.pop(position, None)
+            related.append(
+                sorted(
+                    other for other, score in scores.items() if score > self.threshold
+                )
+            )
+        return related
+
+    def _count_related(self) -> list[list[int]]:
+        """
+        Find requirements sharing more than ``threshold`` terms
+
+        Walking the postings of a term used by most requirements is as
+        slow as the pairwise comparison it replaces, so terms are split by
+        document frequency. Shared rare terms are counted through their
+        postings; frequent terms are kept as bitsets of requirements, and
+        requirements sharing enough of them are found by intersecting
+        those bitsets.
+        """
+        needed = math.floor(self.threshold) + 1
+        cutoff = max(_MIN_FREQUENT_POSTINGS, math.isqrt(len(self.requirements)))
+        bitsets = {
+            term: sum(1 << position for position in postings)
+            for term, postings in self._postings.items()
+            if len(postings) > cutoff
+        }
+
+        related: list[list[int]] = []
+        for position, terms in enumerate(self._terms):
+            frequent = terms & bitsets.keys()
+
+            shared: dict[int, int] = defaultdict(int)
+            for term in terms - frequent:
+                for other in self._postings[term]:
+                    shared[other] += 1
+            shared.pop(position, None)
+
+            matches = set()
+            for other, count in shared.items():
+                if count >= needed or (
+                    count + len(frequent) >= needed
+                    and count + len(frequent & self._terms[other]) >= needed
+                ):
+                    matches.add(other)
+
+            # Requirements sharing no rare term need enough frequent ones
+            if len(frequent) >= needed:
+                if math.comb(len(frequent), needed) <= _MAX_BITSET_COMBINATIONS:
+                    mask = 0
+                    for combination in itertools.combinations(frequent, needed):
+                        mask |= functools.reduce(
+                            operator.and_, (bitsets[t] for t in combination)
+                        )
+                    mask &= ~(1 << position)
+                    matches.update(_bit_positions(mask))
+                else:
+                    counts: dict[int, int] = defaultdict(int)
+                    for term in frequent:
+                        for other in self._postings[term]:
+                            counts[other] += 1
+                    counts.pop(position, None)
+                    matches.update(o for o, c in counts.items() if c >= needed)
+
+            related.append(sorted(matches))
+        return related
+
+    def dependencies(self, position: int) -> list[str]:
+        """
+        IDs of requirements related to the one at ``position``
+
+        Returns:
+            Related requirement IDs in their original order
+        """
+        if self._related is None:
+            self._related = self._compute_related()
+        return [
+            self.requirements[other].id
+            for other in self._related[position]
+            if self.requirements[other].id != self.requirements[position].id
+        ]
+
+    def all_dependencies(self) -> dict[str, list[str]]:
+        """Dependency lists for every indexed requirement, keyed by ID"""
+        return {
+            requirement.id: self.dependencies(position)
+            for position, requirement in enumerate(self.requirements)
+        }
@@ -97,6 +97,7 @@ class AISystemArchitect(BaseAgent):
             decision_authority="Human approval",
             phase=1,
             config=config,
+            capabilities=["architecture_design", "technology_selection"],
         )
 
         # Architecture knowledge base
@@ -32,6 +32,7 @@ from ...models.arch_models import (
     RequirementAnalysis,
     SystemArchitecture,
 )
+from ...models.serialization import to_primitive
 from ..base import BasePhase
 from .ai.component_designer import AIComponentDesigner, ComponentDesignRequest
 from .ai.domain_analyst import AIDomainAnalyst, AnalysisType, DomainAnalysisRequest
@@ -39,6 +40,7 @@ from .ai.integration_architect import AIIntegrationArchitect, IntegrationRequest
 from .ai.system_architect import AISystemArchitect, ArchitectureRequest
 from .human import ApprovalGates, CreativeInput, HumanOversight
 from .process.quality_gates import ArchQualityGates
+from .process.scheduler import StepScheduler, step_spec
 from .process.validation import ArchValidation
 
 # Import PATH pillar components
@@ -58,6 +60,48 @@ class ArchStep(Enum):
     DOCUMENTATION_HANDOFF = "documentation_handoff"
 
 
+# Inputs and outputs of each step, named after the ArchOutput fields.
+# Steps without a path between them run concurrently, even when they use
+# the same agent (context analysis and domain modeling both use the domain
+# analyst), so per-step state belongs to the step, not the shared agent or
+# orchestrator. Add an edge to serialize steps that cannot share an agent.
+ARCH_STEP_GRAPH = [
+    step_spec(ArchStep.CONTEXT_ANALYSIS, provides=["requirements_analysis"]),
+    step_spec(ArchStep.DOMAIN_MODELING, provides=["domain_model"]),
+    step_spec(
+        ArchStep.ARCHITECTURE_DESIGN,
+        requires=["requirements_analysis", "domain_model"],
+        provides=["system_architecture", "architecture_decisions"],
+    ),
+    step_spec(
+        ArchStep.COMPONENT_DESIGN,
+        requires=["system_architecture", "domain_model"],
+        provides=["component_designs"],
+    ),
+    step_spec(
+        ArchStep.INTEGRATION_DESIGN,
+        requires=["system_architecture", "component_designs"],
+        provides=["integration_design"],
+    ),
+    step_spec(
+        ArchStep.VALIDATION_REVIEW,
+        requires=[
+            "requirements_analysis",
+            "domain_model",
+            "system_architecture",
+            "component_designs",
+            "integration_design",
+        ],
+        provides=["validation_results"],
+    ),
+    step_spec(
+        ArchStep.DOCUMENTATION_HANDOFF,
+        requires=["validation_results", "architecture_decisions"],
+        provides=["next_phase_inputs"],
+    ),
+]
+
+
 @dataclass
 class ArchRequest:
     """Input request for Architecture phase"""
@@ -124,8 +168,10 @@ class ArchOrchestrator(BasePhase):
         self._init_technology_components()
         self._init_human_components()
 
-        # Track phase state
+        # Track phase state; independent steps can be running at once, and
+        # current_step is the most recently started one still running
         self.current_step = None
+        self.running_steps: list[ArchStep] = []
         self.step_results = {}
         self.overall_confidence = 0.0
 
@@ -134,6 +180,7 @@ class ArchOrchestrator(BasePhase):
         self.workflow = ArchWorkflows()
         self.quality_gates = ArchQualityGates()
         self.validation = ArchValidation()
+        self.step_scheduler = StepScheduler(ARCH_STEP_GRAPH)
 
     def _init_ai_components(self):
         """Initialize AI pillar components"""
@@ -172,12 +219,20 @@ class ArchOrchestrator(BasePhase):
                 project_name=request.project_name, created_at=datetime.now()
             )
 
-            # Execute each step in sequence
-            for step in ArchStep:
+            # Execute each step as soon as the steps it depends on are done
+            async def execute(step: ArchStep) -> ArchStepResult:
+                self.running_steps.append(step)
                 self.current_step = step
                 self.logger.info(f"Executing step: {step.value}")
-
-                step_result = await self._execute_step(step, request, phase_output)
+                try:
+                    return await self._execute_step(step, request, phase_output)
+                finally:
+                    self.running_steps.remove(step)
+                    self.current_step = (
+                        self.running_steps[-1] if self.running_steps else None
+                    )
+
+            async def on_complete(step: ArchStep, step_result: ArchStepResult) -> bool:
                 self.step_results[step] = step_result
 
                 if not step_result.success:
@@ -196,6 +251,9 @@ class ArchOrchestrator(BasePhase):
                 if step_result.human_review_required:
                     self.logger.info(f"Step {step.value} requires human review")
                     await self._request_human_review(step, step_result)
+                return True
+
+            await self.step_scheduler.run(execute, on_complete)
 
             # Final validation
             final_validation = await self._final_validation(phase_output)
@@ -658,33 +716,22 @@ class ArchOrchestrator(BasePhase):
         self, phase_output: ArchOutput
     ) -> dict[str, Any]:
         """Prepare inputs for the next phase (TDD)"""
+        # Encoded once; the stack and quality attributes are shared with
+        # the architecture design rather than encoded again
+        architecture = to_primitive(phase_output.system_architecture or {})
         return {
-            "architecture_design": (
-                asdict(phase_output.system_architecture)
-                if phase_output.system_architecture
-                else {}
-            ),
-            "component_specifications": (
-                [asdict(comp) for comp in phase_output.component_designs]
-                if phase_output.component_designs
-                else []
-            ),
-            "integration_requirements": (
-                asdict(phase_output.integration_design)
-                if phase_output.integration_design
-                else {}
+            "architecture_design": architecture,
+            "component_specifications": to_primitive(
+                phase_output.component_designs or []
             ),
-            "quality_attributes": (
-                phase_output.system_architecture.quality_attributes
-                if phase_output.system_architecture
-                else {}
+            "integration_requirements": to_primitive(
+                phase_output.integration_design or {}
             ),
-            "technology_stack": (
-                asdict(phase_output.system_architecture.technology_stack)
-                if phase_output.system_architecture
-                else {}
+            "quality_attributes": architecture.get("quality_attributes", {}),
+            "technology_stack": architecture.get("technology_stack", {}),
+            "architecture_decisions": to_primitive(
+                phase_output.architecture_decisions or []
             ),
-            "architecture_decisions": phase_output.architecture_decisions or [],
         }
 
     def _calculate_overall_confidence(self) -> float:
@@ -700,6 +747,7 @@ class ArchOrchestrator(BasePhase):
         return {
             "phase_name": "Architecture",
             "current_step": self.current_step.value if self.current_step else None,
+            "running_steps": [step.value for step in self.running_steps],
             "completed_steps": [
                 step.value
                 for step, result in self.step_results.items()
@@ -34,6 +34,7 @@ Usage:
 import argparse
 import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -42,6 +43,13 @@ import yaml
 # Add the PATH framework to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
+from path_framework.core.artifact_writer import (
+    ArtifactWriter,
+    WriteReport,
+    sync_paths,
+    write_if_changed,
+)
+
 try:
     pass
     # Try to import LLM client from the framework
@@ -73,14 +81,142 @@ except ImportError as e:
                 self.model = "gpt-3.5-turbo"
                 print(f"🔗 Using OpenAI with model: {self.model}")
 
+            self.cache = None
+            try:
+                from path_framework.core.llm_cache import get_response_cache
+
+                self.cache = get_response_cache()
+            except ImportError:
+                pass
+
         def generate_response(self, prompt, max_tokens=4000):
-            response = self.client.chat.completions.create(
+            cache_key = None
+            if self.cache is not None:
+                from path_framework.core.llm_cache import cache_refresh_requested
+                from path_framework.core.llm_client import (
+                    LLMRequest,
+                    LLMResponse,
+                    request_fingerprint,
+                )
+
+                request = LLMRequest(
+                    prompt=prompt, max_tokens=max_tokens, temperature=0.1
+                )
+                cache_key = request_fingerprint("openai", self.model, request)
+                if not cache_refresh_requested():
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        return cached.content
+
+            # Stream so progress shows as soon as the first tokens arrive
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=0.1,
+                stream=True,
             )
-            return response.choices[0].message.content
+            parts = []
+            received = 0
+            finish_reason = None
+            for event in stream:
+                if not event.choices:
+                    continue
+                choice = event.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.delta and choice.delta.content:
+                    parts.append(choice.delta.content)
+                    received += len(choice.delta.content)
+                    print(f"\r   ✍️  {received:,} chars received", end="", flush=True)
+            if received:
+                print()
+            content = "".join(parts)
+
+            if cache_key is not None and content:
+                self.cache.put(
+                    cache_key,
+                    LLMResponse(
+                        content=content,
+                        tokens_used=0,
+                        model_used=self.model,
+                        provider="openai",
+                        finish_reason=finish_reason or "stop",
+                    ),
+                )
+            return content
+
+
+@dataclass(frozen=True)
+class ArtifactStep:
+    """One step of the 7-step process and the artifact it produces"""
+
+    name: str
+    header: str
+    artifact: str
+    extract_yaml: bool = True
+    max_tokens: int = 4000
+    # Generator attributes (request fields) and upstream steps whose
+    # artifacts the prompt is built from, in prompt argument order
+    reads: tuple[str, ...] = ("project_name",)
+    after: tuple[str, ...] = ()
+
+    def content(self, response: str) -> str:
+        """Artifact content from the LLM response"""
+        if self.extract_yaml and "```yaml" in response:
+            return response.split("```yaml")[1].split("```")[0].strip()
+        return response
+
+
+# Steps in process order; each step's prompt is built by
+# PathArtifactGenerator._<name>_prompt from the artifacts of the steps it
+# runs after. Declared inputs decide what a resumed run rebuilds.
+ARTIFACT_STEPS = [
+    ArtifactStep(
+        "context_analysis",
+        "📋 Step 1: Context Analysis",
+        "phase1/domain_context.yaml",
+        reads=("project_name", "domain", "requirements_context"),
+    ),
+    ArtifactStep(
+        "domain_modeling",
+        "🏗️  Step 2: Domain Modeling",
+        "phase1/domain_model.yaml",
+        after=("context_analysis",),
+    ),
+    ArtifactStep(
+        "architecture_design",
+        "🏛️  Step 3: Architecture Design",
+        "phase1/system_architecture.yaml",
+        after=("domain_modeling",),
+    ),
+    ArtifactStep(
+        "component_design",
+        "🧩 Step 4: Component Design",
+        "phase1/component_designs.yaml",
+        after=("architecture_design",),
+    ),
+    ArtifactStep(
+        "integration_design",
+        "🔗 Step 5: Integration Design",
+        "phase1/integration_specs.yaml",
+        after=("component_design",),
+    ),
+    ArtifactStep(
+        "architecture_validation",
+        "✅ Step 6: Architecture Validation",
+        "phase1/interface_specifications.yaml",
+        after=("integration_design",),
+    ),
+    ArtifactStep(
+        "final_documentation",
+        "📚 Step 7: Final Documentation",
+        "deliverables/architecture_decisions.md",
+        extract_yaml=False,
+        max_tokens=6000,
+        reads=(),
+        after=("architecture_validation",),
+    ),
+]
 
 
 class PathArtifactGenerator:
@@ -98,17 +234,36 @@ class PathArtifactGenerator:
         stakeholders=None,
         compliance=None,
         requirements_file=None,
+        output_dir=None,
+        resume=False,
     ):
+        from path_framework.phases.arch.run_manifest import MANIFEST_NAME, RunManifest
+
         self.project_name = project_name
         self.domain = domain
-        self.llm_client = LLMClient()
+        self._llm_client = None
+        self.write_report = WriteReport()
 
         # Set project path relative to framework root
         framework_root = Path(__file__).parent.parent.parent.parent
         self.project_path = framework_root / "projects" / project_name
-        self.artifacts_path = self.project_path / "path_artifacts"
+        self.artifacts_path = (
+            Path(output_dir) if output_dir else self.project_path / "path_artifacts"
+        )
         self.timestamp = datetime.now().isoformat()
 
+        # Step checkpoints; a resumed run keeps the original run timestamp
+        # so that prompts of unchanged steps match their recorded hashes
+        self.resume = resume
+        manifest_path = self.artifacts_path / MANIFEST_NAME
+        if resume:
+            self.manifest = RunManifest.load(
+                manifest_path, project_name, self.timestamp
+            )
+            self.timestamp = self.manifest.timestamp
+        else:
+            self.manifest = RunManifest(manifest_path, project_name, self.timestamp)
+
         # Load or process requirements
         self.requirements_context = self._load_requirements_context(
             requirements, constraints, stakeholders, compliance, requirements_file
@@ -126,6 +281,16 @@ class PathArtifactGenerator:
         if self.requirements_context:
             print(f"📋 Requirements loaded: {len(self.requirements_context)} sections")
 
+    @property
+    def llm_client(self):
+        # Created on first use, so a dry run needs no provider credentials
+        if self._llm_client is None:
+            self._llm_client = self._create_llm_client()
+        return self._llm_client
+
+    def _create_llm_client(self):
+        return LLMClient()
+
     def _load_requirements_context(
         self, requirements, constraints, stakeholders, compliance, requirements_file
     ):
@@ -181,17 +346,110 @@ NOTE: Limited context provided. The AI should make reasonable assumptions for a
 
         return "\n".join(context_lines)
 
+    def _step_prompt(self, step, *inputs):
+        """Build a step's prompt from the artifacts it depends on"""
+        return getattr(self, f"_{step.name}_prompt")(*inputs)
+
+    def _step_inputs(self, step, *artifacts):
+        """A step's declared inputs: request fields and upstream artifacts"""
+        inputs = {name: getattr(self, name) for name in step.reads}
+        inputs.update(zip(step.after, artifacts, strict=True))
+        return inputs
+
+    def build_plan(self):
+        """
+        Work a resumed run would do, without calling the LLM
+
+        Steps after a step that is rebuilt are reported as depending on it:
+        they only run again if the rebuilt artifact actually changes.
+
+        Returns:
+            Reasons to rebuild each step by name; empty if up to date
+        """
+        plan = {}
+        outputs = {}
+        for step in ARTIFACT_STEPS:
+            rebuilt = [name for name in step.after if plan[name]]
+            if rebuilt:
+                plan[step.name] = [f"{name} is rebuilt" for name in rebuilt]
+                continue
+
+            artifacts = [outputs[name] for name in step.after]
+            prompt = self._step_prompt(step, *artifacts)
+            plan[step.name] = self.manifest.stale_reasons(
+                step.name, prompt, self._step_inputs(step, *artifacts)
+            )
+            if not plan[step.name]:
+                outputs[step.name] = self.manifest.completed_output(step.name, prompt)
+        return plan
+
+    def print_build_plan(self):
+        """Show which steps a resumed run would rebuild and why"""
+        plan = self.build_plan()
+        print(f"\n🔍 Dry run for {self.project_name} ({self.artifacts_path})")
+        for step in ARTIFACT_STEPS:
+            reasons = plan[step.name]
+            name = Path(step.artifact).name
+            if reasons:
+                print(f"   🔁 {name}: rebuild ({', '.join(reasons)})")
+            else:
+                print(f"   ✅ {name}: up to date")
+
+    def _resumed_output(self, step, prompt):
+        """Checkpointed output of a step that does not need to run again"""
+        if not self.resume:
+            return None
+        content = self.manifest.completed_output(step.name, prompt)
+        if content is not None:
+            self.write_report.add(
+                self.artifacts_path / step.artifact,
+                len(content.encode("utf-8")),
+                changed=False,
+            )
+        return content
+
+    def _run_step(self, step, *inputs):
+        """Run one step: prompt the LLM and save the resulting artifact"""
+        print(f"\n{step.header}")
+
+        prompt = self._step_prompt(step, *inputs)
+        resumed = self._resumed_output(step, prompt)
+        if resumed is not None:
+            print(f"⏭️  Unchanged, resumed: {Path(step.artifact).name}")
+            return resumed
+
+        response = self.llm_client.generate_response(prompt, max_tokens=step.max_tokens)
+        content = step.content(response)
+
+        self._save_artifact(step.artifact, content)
+        self.manifest.record(
+            step.name, step.artifact, prompt, self._step_inputs(step, *inputs), content
+        )
+        self.manifest.save(self.write_report)
+
+        print(f"✅ Generated: {Path(step.artifact).name}")
+        return content
+
+    def _save_artifact(self, artifact, content):
+        """Write an artifact unless it is already on disk as generated"""
+        path = self.artifacts_path / artifact
+        # Synced to disk together at the end of the run
+        if not write_if_changed(path, content, self.write_report, fsync=False):
+            print(f"⏸️  Content unchanged, not rewritten: {path.name}")
+
     def step1_context_analysis(self):
         """
         Phase 1: Context Analysis (Domain Understanding)
         Lead Agent: AI Domain Analyst
         Flow Pattern: Human-Initiated Process
         """
-        print("\n📋 Step 1: Context Analysis")
+        return self._run_step(ARTIFACT_STEPS[0])
 
+    def _context_analysis_prompt(self):
+        """Prompt for step 1"""
         context_section = self._get_context_prompt_section()
 
-        prompt = f"""
+        return f"""
 You are an expert AI Domain Analyst specializing in requirements analysis and domain modeling.
 
 Analyze the project and extract comprehensive domain context based on the provided information:
@@ -274,30 +532,17 @@ domain_context:
 Provide detailed, specific analysis based on the project context. If context is limited, make reasonable assumptions based on the domain type and project name, focusing on common patterns and requirements for {self.domain} domain applications.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save domain context
-        with open(self.artifacts_path / "phase1" / "domain_context.yaml", "w") as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: domain_context.yaml")
-        return yaml_content
-
     def step2_domain_modeling(self, domain_context):
         """
         Phase 2: Domain Modeling
         Lead Agent: AI Domain Analyst
         Flow Pattern: AI-Driven Automation
         """
-        print("\n🏗️  Step 2: Domain Modeling")
+        return self._run_step(ARTIFACT_STEPS[1], domain_context)
 
-        prompt = f"""
+    def _domain_modeling_prompt(self, domain_context):
+        """Prompt for step 2"""
+        return f"""
 You are an expert AI Domain Analyst creating detailed domain models.
 
 Based on the domain context analysis, create a comprehensive domain model:
@@ -358,30 +603,17 @@ domain_model:
 Focus on creating a comprehensive domain model with clear entity relationships and business rules.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save domain model
-        with open(self.artifacts_path / "phase1" / "domain_model.yaml", "w") as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: domain_model.yaml")
-        return yaml_content
-
     def step3_architecture_design(self, domain_model):
         """
         Phase 3: Architecture Design
         Lead Agent: AI System Architect
         Flow Pattern: AI-Driven Automation
         """
-        print("\n🏛️  Step 3: Architecture Design")
+        return self._run_step(ARTIFACT_STEPS[2], domain_model)
 
-        prompt = f"""
+    def _architecture_design_prompt(self, domain_model):
+        """Prompt for step 3"""
+        return f"""
 You are an expert AI System Architect specializing in architectural design and technology selection.
 
 Based on the domain model, design a comprehensive system architecture:
@@ -457,32 +689,17 @@ system_architecture:
 Select appropriate architectural patterns and technology stack based on the domain requirements.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save system architecture
-        with open(
-            self.artifacts_path / "phase1" / "system_architecture.yaml", "w"
-        ) as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: system_architecture.yaml")
-        return yaml_content
-
     def step4_component_design(self, system_architecture):
         """
         Phase 4: Component Design
         Lead Agent: AI Component Designer
         Flow Pattern: AI-Driven Automation
         """
-        print("\n🧩 Step 4: Component Design")
+        return self._run_step(ARTIFACT_STEPS[3], system_architecture)
 
-        prompt = f"""
+    def _component_design_prompt(self, system_architecture):
+        """Prompt for step 4"""
+        return f"""
 You are an expert AI Component Designer specializing in component-level design and SOLID principles.
 
 Based on the system architecture, design detailed components:
@@ -565,30 +782,17 @@ component_designs:
 Focus on SOLID principles compliance and clear component responsibilities.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save component designs
-        with open(self.artifacts_path / "phase1" / "component_designs.yaml", "w") as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: component_designs.yaml")
-        return yaml_content
-
     def step5_integration_design(self, component_designs):
         """
         Phase 5: Integration Design
         Lead Agent: AI Integration Architect
         Flow Pattern: AI-Driven Automation
         """
-        print("\n🔗 Step 5: Integration Design")
+        return self._run_step(ARTIFACT_STEPS[4], component_designs)
 
-        prompt = f"""
+    def _integration_design_prompt(self, component_designs):
+        """Prompt for step 5"""
+        return f"""
 You are an expert AI Integration Architect specializing in system integration and API design.
 
 Based on the component designs, create integration specifications:
@@ -677,30 +881,17 @@ integration_specs:
 Focus on robust integration patterns and comprehensive error handling.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save integration specs
-        with open(self.artifacts_path / "phase1" / "integration_specs.yaml", "w") as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: integration_specs.yaml")
-        return yaml_content
-
     def step6_architecture_validation(self, integration_specs):
         """
         Phase 6: Architecture Validation
         Lead Agent: AI System Architect
         Flow Pattern: Human-AI Collaborative Decision
         """
-        print("\n✅ Step 6: Architecture Validation")
+        return self._run_step(ARTIFACT_STEPS[5], integration_specs)
 
-        prompt = f"""
+    def _architecture_validation_prompt(self, integration_specs):
+        """Prompt for step 6"""
+        return f"""
 You are an expert AI System Architect performing comprehensive architecture validation.
 
 Validate the complete architecture against requirements and generate validation report:
@@ -792,32 +983,22 @@ interface_specifications:
 Provide comprehensive validation with clear approval criteria.
 """
 
-        response = self.llm_client.generate_response(prompt)
-
-        # Extract YAML content
-        if "```yaml" in response:
-            yaml_content = response.split("```yaml")[1].split("```")[0].strip()
-        else:
-            yaml_content = response
-
-        # Save interface specifications
-        with open(
-            self.artifacts_path / "phase1" / "interface_specifications.yaml", "w"
-        ) as f:
-            f.write(yaml_content)
-
-        print("✅ Generated: interface_specifications.yaml")
-        return yaml_content
-
     def step7_final_documentation(self, interface_specifications):
         """
         Phase 7: Final Documentation
         Lead Agent: AI Integration Architect
         Flow Pattern: AI-Driven Automation
         """
-        print("\n📚 Step 7: Final Documentation")
+        response = self._run_step(ARTIFACT_STEPS[6], interface_specifications)
+
+        # Generate summary README
+        self.generate_summary_readme()
+
+        return response
 
-        prompt = f"""
+    def _final_documentation_prompt(self, interface_specifications):
+        """Prompt for step 7"""
+        return f"""
 You are an expert AI Integration Architect creating comprehensive architecture documentation.
 
 Generate final architecture documentation and decision records:
@@ -845,25 +1026,14 @@ Format as a complete Markdown document with:
 Focus on providing implementation-ready documentation for development teams.
 """
 
-        response = self.llm_client.generate_response(prompt, max_tokens=6000)
-
-        # Save architecture decisions
-        with open(
-            self.artifacts_path / "deliverables" / "architecture_decisions.md", "w"
-        ) as f:
-            f.write(response)
-
-        print("✅ Generated: architecture_decisions.md")
-
-        # Generate summary README
-        self.generate_summary_readme()
-
-        return response
-
     def generate_summary_readme(self):
         """Generate a comprehensive README for the PATH artifacts"""
+        self._save_artifact("README.md", self._summary_readme())
+        print("✅ Generated: README.md")
 
-        readme_content = f"""# PATH Framework Artifacts
+    def _summary_readme(self):
+        """Content of the artifacts README"""
+        return f"""# PATH Framework Artifacts
 ## {self.project_name}
 
 Generated on: {self.timestamp}
@@ -937,11 +1107,6 @@ Artifacts are compliant with:
 *Methodology Reference: docs/framework/path_software_engineering_methodology.md*
 """
 
-        with open(self.artifacts_path / "README.md", "w") as f:
-            f.write(readme_content)
-
-        print("✅ Generated: README.md")
-
     def generate_all_artifacts(self):
         """Execute the complete 7-step PATH process"""
         print("\n🎯 Starting PATH Framework Artifact Generation")
@@ -965,13 +1130,9 @@ Artifacts are compliant with:
             print(f"📁 Location: {self.artifacts_path}")
             print("\n📋 Generated Files:")
 
-            # List all generated files
-            for root, _dirs, files in os.walk(self.artifacts_path):
-                for file in files:
-                    rel_path = os.path.relpath(
-                        os.path.join(root, file), self.artifacts_path
-                    )
-                    print(f"   📄 {rel_path}")
+            for path in self.write_report.paths:
+                print(f"   📄 {path.relative_to(self.artifacts_path)}")
+            print(f"💾 {self.write_report.summary()}")
 
             print(
                 "\n✅ All artifacts comply with PATH Software Engineering Methodology v2.0.0"
@@ -981,6 +1142,140 @@ Artifacts are compliant with:
         except Exception as e:
             print(f"\n❌ Error during generation: {e}")
             raise
+        finally:
+            sync_paths(self.write_report.written)
+
+
+class AsyncPathArtifactGenerator(PathArtifactGenerator):
+    """
+    PATH Framework Artifact Generator on the async framework LLM client
+
+    Artifacts are saved by a background ArtifactWriter, so each step's LLM
+    call starts while the previous artifact is still being written. The
+    LLM client and writer can be shared by generators for many projects
+    running on one event loop (see generate_projects).
+    """
+
+    def __init__(self, project_name, *args, llm_client=None, writer=None, **kwargs):
+        self._shared_llm_client = llm_client
+        self.writer = writer
+        super().__init__(project_name, *args, **kwargs)
+
+    def _create_llm_client(self):
+        if self._shared_llm_client is not None:
+            return self._shared_llm_client
+
+        from path_framework.core.llm_client import get_llm_client
+
+        return get_llm_client(phase=1)
+
+    async def _arun_step(self, step, *inputs):
+        """Run one step: prompt the LLM and queue the resulting artifact"""
+        from path_framework.core.llm_client import LLMRequest
+
+        print(f"\n[{self.project_name}] {step.header}")
+
+        prompt = self._step_prompt(step, *inputs)
+        resumed = self._resumed_output(step, prompt)
+        if resumed is not None:
+            print(f"⏭️  [{self.project_name}] Unchanged, resumed: {step.artifact}")
+            return resumed
+
+        request = LLMRequest(prompt=prompt, max_tokens=step.max_tokens, temperature=0.1)
+        response = await self.llm_client.generate(request)
+        content = step.content(response.content)
+
+        # A checkpoint is only trusted on resume if the artifact on disk
+        # matches it, so a crash between the two writes is harmless
+        self.writer.write(
+            self.artifacts_path / step.artifact, content, self.write_report
+        )
+        self.manifest.record(
+            step.name, step.artifact, prompt, self._step_inputs(step, *inputs), content
+        )
+        self.writer.write(
+            self.manifest.path, self.manifest.to_json(), self.write_report
+        )
+
+        print(f"✅ [{self.project_name}] Generated: {Path(step.artifact).name}")
+        return content
+
+    async def _generate_steps(self):
+        # The README does not depend on any step
+        self.writer.write(
+            self.artifacts_path / "README.md", self._summary_readme(), self.write_report
+        )
+
+        artifacts = {}
+        previous = ()
+        for step in ARTIFACT_STEPS:
+            artifacts[step.name] = await self._arun_step(step, *previous)
+            previous = (artifacts[step.name],)
+        return artifacts
+
+    async def generate_all_artifacts(self):
+        """
+        Execute the complete 7-step PATH process
+
+        Each step needs the previous step's artifact, so the LLM calls run
+        in order; the file writes overlap with them. A generator without a
+        shared writer waits for its writes before returning; the owner of
+        a shared writer flushes it, after which ``write_report`` holds
+        this project's writes.
+
+        Returns:
+            Artifact content by step name
+        """
+        if self.writer is not None:
+            return await self._generate_steps()
+
+        self.writer = ArtifactWriter()
+        try:
+            artifacts = await self._generate_steps()
+        finally:
+            writer, self.writer = self.writer, None
+            await writer.close()
+        print(f"🎉 [{self.project_name}] Artifacts written to {self.artifacts_path}")
+        print(f"💾 [{self.project_name}] {self.write_report.summary()}")
+        return artifacts
+
+
+async def generate_projects(projects, concurrency=4, llm_client=None):
+    """
+    Generate artifacts for several projects on one event loop
+
+    All projects share one LLM client (and its rate limiter) and one
+    background writer. Each project's writes are recorded in its own
+    generator's ``write_report``; the summary printed at the end covers
+    all projects.
+
+    Args:
+        projects: AsyncPathArtifactGenerator keyword arguments, one dict
+            per project
+        concurrency: Maximum number of projects generated at once
+        llm_client: Shared client (default: the Phase 1 framework client)
+
+    Returns:
+        Artifacts by step name for each project, or the exception that
+        stopped it, in input order
+    """
+    from path_framework.core.concurrency import map_bounded
+    from path_framework.core.llm_client import get_llm_client
+
+    llm_client = llm_client or get_llm_client(phase=1)
+
+    async with ArtifactWriter() as writer:
+
+        async def generate(options):
+            generator = AsyncPathArtifactGenerator(
+                **options, llm_client=llm_client, writer=writer
+            )
+            return await generator.generate_all_artifacts()
+
+        results = await map_bounded(generate, projects, concurrency)
+        await writer.flush()
+        print(f"💾 {writer.report.summary()}")
+        return results
 
 
 def main():
@@ -1021,9 +1316,39 @@ def main():
     parser.add_argument(
         "--output", help="Output directory (default: projects/{project}/path_artifacts)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Only rebuild steps whose inputs changed since the previous run",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which steps --resume would rebuild, without calling the LLM",
+    )
+
+    # Cache options
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the LLM response cache"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached LLM responses and store fresh ones",
+    )
 
     args = parser.parse_args()
 
+    if args.no_cache or args.refresh:
+        try:
+            from path_framework.core.llm_cache import configure_llm_cache
+
+            configure_llm_cache(
+                enabled=False if args.no_cache else None, refresh=args.refresh
+            )
+        except ImportError:
+            pass
+
     # Interactive mode
     if args.interactive:
         print("🎯 PATH Framework Interactive Mode")
@@ -1046,7 +1371,11 @@ def main():
         args.compliance = compliance
 
     # Verify environment
-    if not os.getenv("OPENROUTER_API_KEY") and not os.getenv("OPENAI_API_KEY"):
+    if (
+        not args.dry_run
+        and not os.getenv("OPENROUTER_API_KEY")
+        and not os.getenv("OPENAI_API_KEY")
+    ):
         print("❌ Error: No API key found. Set OPENROUTER_API_KEY or OPENAI_API_KEY")
         sys.exit(1)
 
@@ -1078,7 +1407,12 @@ def main():
         stakeholders=args.stakeholders,
         compliance=args.compliance,
         requirements_file=args.requirements_file,
+        output_dir=args.output,
+        resume=args.resume or args.dry_run,
     )
+    if args.dry_run:
+        generator.print_build_plan()
+        return
     generator.generate_all_artifacts()
 
 
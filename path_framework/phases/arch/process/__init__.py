@@ -1,5 +1,6 @@
 """Process Components for Architecture Phase"""
 
+from .scheduler import StepScheduler, StepSpec, step_spec
 from .workflows import ArchWorkflows
 
-__all__ = ["ArchWorkflows"]
+__all__ = ["ArchWorkflows", "StepScheduler", "StepSpec", "step_spec"]
@@ -0,0 +1,168 @@
+"""
+Architecture Phase Step Scheduler
+PATH Framework - Process Component
+
+Runs workflow steps as a dependency graph instead of a fixed sequence.
+Each step declares the artifacts it requires and provides; a step starts
+as soon as everything it requires has been provided, so independent LLM
+calls overlap and a phase takes roughly as long as its critical path.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ....exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StepSpec:
+    """A workflow step and the artifacts it consumes and produces"""
+
+    step: Hashable
+    requires: frozenset[str] = field(default_factory=frozenset)
+    provides: frozenset[str] = field(default_factory=frozenset)
+
+
+def step_spec(
+    step: Hashable, requires: Iterable[str] = (), provides: Iterable[str] = ()
+) -> StepSpec:
+    """Build a StepSpec from plain iterables"""
+    return StepSpec(step, frozenset(requires), frozenset(provides))
+
+
+class StepScheduler:
+    """
+    Dependency-driven asyncio scheduler for workflow steps
+
+    The graph is validated up front: every artifact must have exactly one
+    producer, every requirement must be produced by some step and the
+    graph must be acyclic.
+
+    Args:
+        specs: Steps in their preferred (documentation) order; ties between
+            steps that become ready together are started in this order
+    """
+
+    def __init__(self, specs: Iterable[StepSpec]):
+        self.specs = list(specs)
+        self._producers: dict[str, Hashable] = {}
+
+        steps = [spec.step for spec in self.specs]
+        if len(set(steps)) != len(steps):
+            raise ValidationError("Duplicate step in workflow graph")
+
+        for spec in self.specs:
+            for artifact in spec.provides:
+                if artifact in self._producers:
+                    raise ValidationError(
+                        f"Artifact '{artifact}' provided by both "
+                        f"{self._producers[artifact]} and {spec.step}"
+                    )
+                self._producers[artifact] = spec.step
+
+        for spec in self.specs:
+            missing = spec.requires - self._producers.keys()
+            if missing:
+                raise ValidationError(
+                    f"Step {spec.step} requires unprovided artifacts: {sorted(missing)}"
+                )
+
+        self._levels = self._compute_levels()
+        self._position = {step: i for i, step in enumerate(self.order())}
+
+    def dependencies(self, step: Hashable) -> set[Hashable]:
+        """Steps whose artifacts ``step`` requires"""
+        for spec in self.specs:
+            if spec.step == step:
+                return {self._producers[artifact] for artifact in spec.requires}
+        raise ValidationError(f"Unknown step: {step}")
+
+    def _compute_levels(self) -> list[list[Hashable]]:
+        """Group steps into waves that can run together (Kahn's algorithm)"""
+        remaining = {spec.step: self.dependencies(spec.step) for spec in self.specs}
+        levels: list[list[Hashable]] = []
+        done: set[Hashable] = set()
+        while remaining:
+            wave = [step for step, deps in remaining.items() if deps <= done]
+            if not wave:
+                raise ValidationError(
+                    f"Workflow graph has a cycle between {sorted(map(str, remaining))}"
+                )
+            levels.append(wave)
+            done.update(wave)
+            for step in wave:
+                del remaining[step]
+        return levels
+
+    @property
+    def levels(self) -> list[list[Hashable]]:
+        """Steps grouped by dependency depth"""
+        return [list(level) for level in self._levels]
+
+    def order(self) -> list[Hashable]:
+        """A valid sequential execution order"""
+        return [step for level in self._levels for step in level]
+
+    async def run(
+        self,
+        execute: Callable[[Hashable], Awaitable[Any]],
+        on_complete: Callable[[Hashable, Any], Awaitable[bool]],
+    ) -> dict[Hashable, Any]:
+        """
+        Execute every step, launching each one as soon as it is ready
+
+        ``on_complete`` is called for one result at a time, in completion
+        order, so it may update shared phase state without locking. If it
+        returns False the phase stops: no further steps are started and
+        steps still running are cancelled.
+
+        Args:
+            execute: Coroutine function running one step
+            on_complete: Coroutine function recording a step result; returns
+                whether the workflow should continue
+
+        Returns:
+            Results of the steps that completed, keyed by step
+
+        Raises:
+            Any exception raised by ``execute`` or ``on_complete``, after
+            cancelling the steps still running
+        """
+        pending = {spec.step: self.dependencies(spec.step) for spec in self.specs}
+        completed: set[Hashable] = set()
+        results: dict[Hashable, Any] = {}
+        running: dict[asyncio.Task, Hashable] = {}
+
+        def launch_ready() -> None:
+            for step in [s for s, deps in pending.items() if deps <= completed]:
+                del pending[step]
+                logger.debug(f"Starting workflow step {step}")
+                running[asyncio.create_task(execute(step))] = step
+
+        launch_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Keep completion handling deterministic within one wakeup
+                for task in sorted(done, key=lambda t: self._position[running[t]]):
+                    step = running.pop(task)
+                    results[step] = task.result()
+                    if not await on_complete(step, results[step]):
+                        logger.info(f"Workflow stopped after step {step}")
+                        return results
+                    completed.add(step)
+                launch_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return results
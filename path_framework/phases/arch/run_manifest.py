@@ -0,0 +1,189 @@
+"""
+Artifact Run Manifest
+PATH Framework - Architecture Phase
+
+Checkpoint record of a seven-step artifact generation run. After each step
+the hash of its prompt (which embeds all of its inputs), the hashes of the
+request fields and upstream artifacts it declares as inputs, and the hash
+of the artifact produced are written to a manifest under
+``path_artifacts/``. A resumed run reuses every step whose prompt is
+unchanged and whose artifact is still on disk as recorded, so a failure
+late in the pipeline only costs the remaining LLM calls, and a changed
+input only rebuilds the steps that read it and those downstream whose
+inputs actually changed as a result.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ...core.artifact_writer import WriteReport, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "run_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def value_hash(value: Any) -> str:
+    """Hash of a step input: artifact text or a request field value"""
+    if isinstance(value, str):
+        return content_hash(value)
+    return content_hash(json.dumps(value, sort_keys=True, default=str))
+
+
+@dataclass
+class StepRecord:
+    """Checkpoint of one completed step"""
+
+    artifact: str
+    prompt_sha256: str
+    input_hashes: dict[str, str] = field(default_factory=dict)
+    output_sha256: str = ""
+    completed_at: str = ""
+
+    @classmethod
+    def from_config(cls, data: dict[str, Any]) -> "StepRecord":
+        known = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+class RunManifest:
+    """
+    Step checkpoints of one artifact generation run
+
+    Args:
+        path: Manifest file
+        project_name: Project the run generates artifacts for
+        timestamp: Run timestamp embedded in the prompts; a resumed run
+            must reuse it for its prompts to match
+    """
+
+    def __init__(self, path: str | Path, project_name: str, timestamp: str):
+        self.path = Path(path)
+        self.project_name = project_name
+        self.timestamp = timestamp
+        self.steps: dict[str, StepRecord] = {}
+
+    @classmethod
+    def load(cls, path: str | Path, project_name: str, timestamp: str) -> "RunManifest":
+        """
+        Load a manifest, or start an empty one if there is none to resume
+
+        Args:
+            path: Manifest file
+            project_name: Project of the run
+            timestamp: Timestamp of a new run, used when nothing is loaded
+
+        Returns:
+            The loaded manifest, keeping its original run timestamp
+        """
+        manifest = cls(path, project_name, timestamp)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable run manifest {path}: {e}")
+            return manifest
+
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("project_name") != project_name
+        ):
+            logger.warning(f"Ignoring run manifest {path} from another run")
+            return manifest
+
+        manifest.timestamp = data.get("timestamp", timestamp)
+        manifest.steps = {
+            name: StepRecord.from_config(record)
+            for name, record in data.get("steps", {}).items()
+        }
+        return manifest
+
+    def completed_output(self, step: str, prompt: str) -> str | None:
+        """
+        Output of a step completed with the same prompt, if still on disk
+
+        Returns:
+            The recorded artifact content, or None if the step must run
+        """
+        record = self.steps.get(step)
+        if record is None or record.prompt_sha256 != content_hash(prompt):
+            return None
+        try:
+            content = (self.path.parent / record.artifact).read_text(encoding="utf-8")
+        except OSError:
+            return None
+        if content_hash(content) != record.output_sha256:
+            return None
+        return content
+
+    def stale_reasons(
+        self, step: str, prompt: str, inputs: dict[str, Any]
+    ) -> list[str]:
+        """
+        Why a step would have to run again
+
+        Args:
+            step: Step name
+            prompt: The step's current prompt
+            inputs: The step's declared inputs by name
+
+        Returns:
+            Reasons, empty if the checkpointed output can be reused
+        """
+        record = self.steps.get(step)
+        if record is None:
+            return ["not built yet"]
+
+        reasons = [
+            f"{name} changed"
+            for name, value in inputs.items()
+            if record.input_hashes.get(name) != value_hash(value)
+        ]
+        if not reasons and record.prompt_sha256 != content_hash(prompt):
+            reasons.append("prompt changed")
+        if not reasons and self.completed_output(step, prompt) is None:
+            reasons.append("artifact missing or edited")
+        return reasons
+
+    def record(
+        self,
+        step: str,
+        artifact: str,
+        prompt: str,
+        inputs: dict[str, Any],
+        output: str,
+    ) -> None:
+        """Record a completed step"""
+        self.steps[step] = StepRecord(
+            artifact=artifact,
+            prompt_sha256=content_hash(prompt),
+            input_hashes={name: value_hash(value) for name, value in inputs.items()},
+            output_sha256=content_hash(output),
+            completed_at=datetime.now().isoformat(),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "project_name": self.project_name,
+                "timestamp": self.timestamp,
+                "steps": {name: asdict(record) for name, record in self.steps.items()},
+            },
+            indent=2,
+        )
+
+    def save(self, report: WriteReport | None = None) -> None:
+        """Write the manifest, recording the write in ``report`` if given"""
+        write_if_changed(self.path, self.to_json(), report, fsync=False)
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from path_framework.core.keywords import KeywordMatcher
 from path_framework.models.arch_models import SystemArchitecture
 
 
@@ -600,28 +601,24 @@ class PayPalPayment(PaymentStrategy):
             if pattern["category"] == category.lower()
         ]
 
+    # Problem keywords suggesting each pattern, in recommendation order
+    _PATTERN_KEYWORDS = KeywordMatcher(
+        {
+            "observer": ["event", "notification"],
+            "strategy": ["algorithm", "strategy", "payment"],
+            "factory": ["creation", "factory", "instantiation"],
+            "singleton": ["single instance", "global"],
+        }
+    )
+
     def recommend_patterns(self, problem_description: str) -> list[dict[str, Any]]:
         """Recommend patterns based on problem description"""
-        keywords = problem_description.lower()
-        recommendations = []
-
-        if "event" in keywords or "notification" in keywords:
-            recommendations.append({"name": "observer", **self._patterns["observer"]})
-
-        if "algorithm" in keywords or "strategy" in keywords or "payment" in keywords:
-            recommendations.append({"name": "strategy", **self._patterns["strategy"]})
-
-        if (
-            "creation" in keywords
-            or "factory" in keywords
-            or "instantiation" in keywords
-        ):
-            recommendations.append({"name": "factory", **self._patterns["factory"]})
-
-        if "single instance" in keywords or "global" in keywords:
-            recommendations.append({"name": "singleton", **self._patterns["singleton"]})
-
-        return recommendations
+        hits = self._PATTERN_KEYWORDS.categories(problem_description)
+        return [
+            {"name": name, **self._patterns[name]}
+            for name in self._PATTERN_KEYWORDS.vocabulary
+            if name in hits
+        ]
 
 
 class ModelingFrameworks:
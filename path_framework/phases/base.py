@@ -13,8 +13,8 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from ..agents_base import AgentStatus, AgentTask
-from ..exceptions import PhaseError
+from ..agents_base import AgentTask
+from ..exceptions import AgentError, PhaseError
 
 
 class PhaseStatus(Enum):
@@ -166,18 +166,12 @@ class BasePhase(ABC):
             raise
 
     async def _check_required_agents(self):
-        """Check that all required agents are available."""
-        missing_agents = []
-
-        for agent_type in self.get_required_agents():
-            available_agents = [
-                agent
-                for agent in self.agent_registry.list_agents()
-                if agent_type in agent.capabilities and agent.status == AgentStatus.IDLE
-            ]
-
-            if not available_agents:
-                missing_agents.append(agent_type)
+        """Check that every required agent type is registered."""
+        missing_agents = [
+            agent_type
+            for agent_type in self.get_required_agents()
+            if not self.agent_registry.has_capability(agent_type)
+        ]
 
         if missing_agents:
             raise PhaseError(f"Missing required agents: {missing_agents}")
@@ -188,6 +182,9 @@ class BasePhase(ABC):
         """
         Assign a task to an agent with specific capability.
 
+        Waits for an agent of the shared pool to become idle, up to the
+        ``agent_wait_timeout`` config value.
+
         Args:
             agent_capability: Required capability
             task: Task to assign
@@ -198,15 +195,17 @@ class BasePhase(ABC):
         Raises:
             PhaseError: If no suitable agent found
         """
-        agent = await self.agent_registry.find_available_agent([agent_capability])
-
-        if not agent:
-            raise PhaseError(f"No available agent with capability: {agent_capability}")
+        try:
+            agent = await self.agent_registry.acquire_agent(
+                [agent_capability], timeout=self.config.get("agent_wait_timeout")
+            )
+        except AgentError as e:
+            raise PhaseError(str(e)) from e
 
         task_id = await self.agent_registry.assign_task(agent.agent_id, task)
         self.active_tasks[task_id] = task
 
-        self.logger.debug(f"Assigned task {task.name} to agent {agent.agent_id}")
+        self.logger.debug(f"Assigned task {task.task_id} to agent {agent.agent_id}")
         return task_id
 
     async def wait_for_task_completion(
@@ -229,19 +228,16 @@ class BasePhase(ABC):
             raise PhaseError(f"Unknown task ID: {task_id}")
 
         task = self.active_tasks[task_id]
-        start_time = datetime.now()
-
-        while task.status not in [AgentStatus.COMPLETED, AgentStatus.ERROR]:
-            if timeout and (datetime.now() - start_time).total_seconds() > timeout:
-                raise PhaseError(f"Task {task_id} timed out after {timeout} seconds")
-
-            await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
-
-        if task.status == AgentStatus.ERROR:
-            raise PhaseError(f"Task {task.name} failed: {task.error_message}")
+        try:
+            result = await asyncio.wait_for(task.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise PhaseError(f"Task {task_id} timed out after {timeout} seconds")
+        except AgentError as e:
+            del self.active_tasks[task_id]
+            raise PhaseError(str(e)) from e
 
         del self.active_tasks[task_id]
-        return task.output_data
+        return result
 
     async def wait_for_all_tasks(
         self, timeout: float | None = None
@@ -249,20 +245,49 @@ class BasePhase(ABC):
         """
         Wait for all active tasks to complete.
 
+        All tasks share one deadline. Waiting stops at the first failed
+        task; tasks still running then stay active and can be waited on
+        again.
+
         Args:
-            timeout: Optional timeout in seconds
+            timeout: Optional timeout in seconds for the whole group
 
         Returns:
             Dictionary mapping task IDs to their results
         """
-        results = {}
+        if not self.active_tasks:
+            return {}
 
-        for task_id in list(self.active_tasks.keys()):
-            try:
-                result = await self.wait_for_task_completion(task_id, timeout)
-                results[task_id] = result
-            except PhaseError as e:
-                self.errors.append(str(e))
+        waiters = {
+            asyncio.create_task(task.wait()): task_id
+            for task_id, task in self.active_tasks.items()
+        }
+        done, pending = await asyncio.wait(
+            waiters, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION
+        )
+
+        # Cancelling a waiter leaves its task running
+        for waiter in pending:
+            waiter.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+        results = {}
+        failed = False
+        for waiter in done:
+            task_id = waiters[waiter]
+            del self.active_tasks[task_id]
+            if waiter.exception() is not None:
+                failed = True
+                self.errors.append(str(waiter.exception()))
+            else:
+                results[task_id] = waiter.result()
+
+        if pending and not failed:
+            for waiter in pending:
+                self.errors.append(
+                    f"Task {waiters[waiter]} timed out after {timeout} seconds"
+                )
 
         return results
 